@@ -1,97 +1,733 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+import queue
+import struct
 import threading
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
 from io import BytesIO
-from typing import Any
+from pathlib import Path
+from typing import Any, Protocol
 
 import numpy as np
 import sounddevice as sd
-import soundfile as sf  # pyright: ignore[reportUnknownVariableType]
 from numpy.typing import NDArray
-from silero_vad import VADIterator, load_silero_vad
 
-from babel_tower.config import Settings
+from babel_tower.config import Settings, get_settings
+from babel_tower.tracing import span
 
 VAD_CHUNK_SIZE = 512
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+_INPUT_STALL_SECONDS = 2.0
 
 
 class NoSpeechError(Exception):
     pass
 
 
-def _record_speech_blocking(
-    settings: Settings, stop_event: threading.Event | None = None
-) -> BytesIO:
-    model: Any = load_silero_vad(onnx=True)  # pyright: ignore[reportUnknownVariableType]
-    vad = VADIterator(
+@dataclass
+class CaptureStats:
+    """Process-wide capture counters, read by instrumentation."""
+
+    chunks: int = 0
+    overflows: int = 0  # PortAudio reported an input overflow
+    dropped: int = 0  # callback queue full, chunk discarded
+    underruns: int = 0  # consumer waited more than two chunk periods for audio
+    vad_skipped: int = 0  # chunks the energy pre-gate kept away from the VAD
+
+
+capture_stats = CaptureStats()
+
+
+EchoGate = Callable[[NDArray[np.float32]], bool]
+SegmentCallback = Callable[[BytesIO], None]
+
+
+class Recorder(Protocol):
+    """Anything that records one utterance the way `record_speech` does.
+
+    Recorders used with BABEL_SPECULATIVE_MODES must also accept `on_segment`.
+    """
+
+    def __call__(
+        self, settings: Settings, stop_event: threading.Event | None = None
+    ) -> Awaitable[BytesIO]: ...
+
+
+_ORT_OPTIMIZATION_LEVELS = {
+    "disable": "ORT_DISABLE_ALL",
+    "basic": "ORT_ENABLE_BASIC",
+    "extended": "ORT_ENABLE_EXTENDED",
+    "all": "ORT_ENABLE_ALL",
+}
+
+
+def _vad_session_is_default(settings: Settings) -> bool:
+    # load_silero_vad pins both thread pools to 1 and keeps ORT's default graph level
+    return (
+        settings.vad_intra_op_threads == 1
+        and settings.vad_inter_op_threads == 1
+        and settings.vad_graph_optimization == "all"
+        and not settings.vad_optimized_model_path
+    )
+
+
+def _build_vad_session(settings: Settings) -> Any:
+    """ONNX Runtime session for the Silero VAD model with the configured execution options.
+
+    With vad_optimized_model_path set, the first run writes the optimized graph
+    there; later runs load it directly and skip graph optimization.
+    """
+    import onnxruntime as ort
+
+    opts = ort.SessionOptions()
+    opts.intra_op_num_threads = settings.vad_intra_op_threads
+    opts.inter_op_num_threads = settings.vad_inter_op_threads
+    level = _ORT_OPTIMIZATION_LEVELS[settings.vad_graph_optimization]
+    opts.graph_optimization_level = getattr(ort.GraphOptimizationLevel, level)
+
+    model_path = _vad_model_path()
+    cached = Path(settings.vad_optimized_model_path) if settings.vad_optimized_model_path else None
+    if cached is not None and cached.exists():
+        model_path = str(cached)
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+    elif cached is not None:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        opts.optimized_model_filepath = str(cached)
+
+    return ort.InferenceSession(model_path, sess_options=opts, providers=["CPUExecutionProvider"])
+
+
+def _vad_model_path() -> str:
+    # find_spec locates the package without executing silero_vad/__init__, which imports torch
+    spec = importlib.util.find_spec("silero_vad")
+    if spec is None or not spec.submodule_search_locations:
+        raise RuntimeError("silero_vad is not installed")
+    return str(Path(next(iter(spec.submodule_search_locations))) / "data" / "silero_vad.onnx")
+
+
+class _OnnxVAD:
+    """Silero VAD ONNX model with numpy state.
+
+    Mirrors silero_vad's OnnxWrapper (same session options, state and context
+    handling) without torch, which costs ~2 s of import time and is only used
+    there for tensor conversion.
+    """
+
+    def __init__(self, session: Any) -> None:
+        self.session = session
+        self.reset_states()
+
+    def reset_states(self) -> None:
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._context: NDArray[np.float32] | None = None
+
+    def __call__(self, x: NDArray[np.float32], sr: int) -> float:
+        context_size = 64 if sr == 16000 else 32
+        if self._context is None:
+            self._context = np.zeros((1, context_size), dtype=np.float32)
+        chunk = x.reshape(1, -1).astype(np.float32, copy=False)
+        frame = np.concatenate([self._context, chunk], axis=1)
+        out, self._state = self.session.run(
+            None, {"input": frame, "state": self._state, "sr": np.array(sr, dtype=np.int64)}
+        )
+        self._context = frame[:, -context_size:]
+        return float(out.reshape(-1)[0])
+
+
+def load_silero_vad(onnx: bool = True) -> _OnnxVAD:
+    """Silero VAD with silero_vad's default session options (1 intra-op / 1 inter-op thread)."""
+    import onnxruntime as ort
+
+    opts = ort.SessionOptions()
+    opts.intra_op_num_threads = 1
+    opts.inter_op_num_threads = 1
+    session = ort.InferenceSession(
+        _vad_model_path(), sess_options=opts, providers=["CPUExecutionProvider"]
+    )
+    return _OnnxVAD(session)
+
+
+class VADIterator:
+    """Streaming speech start/end events; a port of silero_vad's VADIterator on numpy."""
+
+    def __init__(
+        self,
+        model: Any,
+        threshold: float = 0.5,
+        sampling_rate: int = 16000,
+        min_silence_duration_ms: int = 100,
+        speech_pad_ms: int = 30,
+    ) -> None:
+        if sampling_rate not in (8000, 16000):
+            raise ValueError("VADIterator does not support sampling rates other than [8000, 16000]")
+        self.model = model
+        self.threshold = threshold
+        self.sampling_rate = sampling_rate
+        self.min_silence_samples = sampling_rate * min_silence_duration_ms / 1000
+        self.speech_pad_samples = sampling_rate * speech_pad_ms / 1000
+        self.reset_states()
+
+    def reset_states(self) -> None:
+        self.model.reset_states()
+        self.triggered = False
+        self.temp_end = 0
+        self.current_sample = 0
+
+    def __call__(self, x: NDArray[np.float32]) -> dict[str, int] | None:
+        window = len(x)
+        self.current_sample += window
+        speech_prob = self.model(x, self.sampling_rate)
+
+        if speech_prob >= self.threshold and self.temp_end:
+            self.temp_end = 0
+
+        if speech_prob >= self.threshold and not self.triggered:
+            self.triggered = True
+            return {"start": int(max(0, self.current_sample - self.speech_pad_samples - window))}
+
+        if speech_prob < self.threshold - 0.15 and self.triggered:
+            if not self.temp_end:
+                self.temp_end = self.current_sample
+            if self.current_sample - self.temp_end < self.min_silence_samples:
+                return None
+            speech_end = self.temp_end + self.speech_pad_samples - window
+            self.temp_end = 0
+            self.triggered = False
+            return {"end": int(speech_end)}
+
+        return None
+
+
+def _load_vad_model(settings: Settings) -> Any:
+    model = load_silero_vad(onnx=True)
+    if not _vad_session_is_default(settings):
+        model.session = _build_vad_session(settings)
+    return model
+
+
+def _new_vad_iterator(model: Any, settings: Settings) -> Any:
+    return VADIterator(
         model,
         threshold=settings.vad_threshold,
         sampling_rate=settings.audio_sample_rate,
         min_silence_duration_ms=int(settings.silence_duration * 1000),
     )
 
-    frames: list[NDArray[np.int16]] = []
-    speech_started = False
-    ever_had_speech = False
-    max_chunks = int(settings.max_record_seconds * settings.audio_sample_rate / VAD_CHUNK_SIZE)
-    timeout_chunks = int(
-        settings.inter_segment_timeout * settings.audio_sample_rate / VAD_CHUNK_SIZE
-    )
-    inter_segment_deadline: int | None = None
-    chunk_index = 0
 
-    with sd.InputStream(
+def _open_input_stream(settings: Settings) -> Any:
+    return sd.InputStream(
         samplerate=settings.audio_sample_rate,
         channels=settings.audio_channels,
         dtype="int16",
         blocksize=VAD_CHUNK_SIZE,
-    ) as stream:
-        for chunk_index in range(max_chunks):
+    )
+
+
+class _CallbackCapture:
+    """Input stream whose PortAudio callback only copies chunks into a bounded queue.
+
+    VAD runs on the consumer thread, so a slow inference or GC pause fills the
+    queue instead of stalling PortAudio. SimpleQueue.put never blocks the
+    callback; the bound is enforced by dropping (and counting) chunks.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self._queue: queue.SimpleQueue[NDArray[np.int16]] = queue.SimpleQueue()
+        self._max_chunks = settings.capture_queue_chunks
+        self._period = VAD_CHUNK_SIZE / settings.audio_sample_rate
+        self._stream: Any = sd.InputStream(
+            samplerate=settings.audio_sample_rate,
+            channels=settings.audio_channels,
+            dtype="int16",
+            blocksize=VAD_CHUNK_SIZE,
+            callback=self._on_audio,
+        )
+
+    def _on_audio(self, indata: NDArray[np.int16], _frames: int, _time: Any, status: Any) -> None:
+        if status.input_overflow:
+            capture_stats.overflows += 1
+        if self._queue.qsize() >= self._max_chunks:
+            capture_stats.dropped += 1
+            return
+        self._queue.put(indata[:, 0].copy())
+
+    def read(self) -> NDArray[np.int16]:
+        try:
+            chunk = self._queue.get(timeout=2 * self._period)
+        except queue.Empty:
+            capture_stats.underruns += 1
+            try:
+                chunk = self._queue.get(timeout=_INPUT_STALL_SECONDS)
+            except queue.Empty:
+                raise RuntimeError("No audio from input device") from None
+        capture_stats.chunks += 1
+        return chunk
+
+    def __enter__(self) -> _CallbackCapture:
+        self._stream.start()
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        self._stream.stop()
+        self._stream.close()
+
+
+class _EnergyGate:
+    """RMS pre-gate with an adaptive noise floor in front of the VAD.
+
+    Chunks quieter than `vad_pregate_ratio` x the running noise floor skip VAD
+    inference entirely. The last `vad_pregate_lookback_ms` of skipped audio is
+    kept, and replayed through the VAD when energy rises, so onsets that start
+    below the threshold still reach the model.
+    """
+
+    _FLOOR_ALPHA = 0.05
+    _MIN_FLOOR = 1e-4
+
+    def __init__(self, settings: Settings) -> None:
+        self._ratio = settings.vad_pregate_ratio
+        lookback_chunks = int(
+            settings.vad_pregate_lookback_ms / 1000 * settings.audio_sample_rate / VAD_CHUNK_SIZE
+        )
+        self._lookback: deque[NDArray[np.int16]] = deque(maxlen=max(1, lookback_chunks))
+        self._floor = self._MIN_FLOOR
+        self._rms = 0.0
+
+    def is_silent(self, mono: NDArray[np.int16], chunk_float: NDArray[np.float32]) -> bool:
+        self._rms = float(np.sqrt(np.dot(chunk_float, chunk_float) / len(chunk_float)))
+        silent = self._rms < self._floor * self._ratio
+        if silent:
+            self.track_noise()
+            self._lookback.append(mono.copy())
+        return silent
+
+    def track_noise(self) -> None:
+        """Move the noise floor towards the last chunk's level (call on non-speech chunks)."""
+        self._floor = max(
+            self._floor + self._FLOOR_ALPHA * (self._rms - self._floor), self._MIN_FLOOR
+        )
+
+    def drain_lookback(self) -> list[NDArray[np.int16]]:
+        chunks = list(self._lookback)
+        self._lookback.clear()
+        return chunks
+
+
+class _Segmenter:
+    """VAD-driven utterance assembly over mono int16 chunks.
+
+    Speech is written into one int16 buffer sized from `max_record_seconds`
+    and each chunk is converted into a reused float32 scratch buffer for the
+    VAD: no per-chunk allocations and no concatenate at the end.
+
+    on_segment receives each finished segment as a WAV while recording goes
+    on, and the not yet emitted tail when the utterance is complete.
+    """
+
+    def __init__(
+        self,
+        vad: Any,
+        settings: Settings,
+        on_speech_start: Callable[[], None] | None = None,
+        echo_gate: EchoGate | None = None,
+        on_segment: SegmentCallback | None = None,
+    ) -> None:
+        self._vad = vad
+        self._settings = settings
+        self._on_speech_start = on_speech_start
+        self._echo_gate = echo_gate
+        self._on_segment = on_segment
+        self._segment_start = 0
+        self.max_chunks = int(
+            settings.max_record_seconds * settings.audio_sample_rate / VAD_CHUNK_SIZE
+        )
+        self._timeout_chunks = int(
+            settings.inter_segment_timeout * settings.audio_sample_rate / VAD_CHUNK_SIZE
+        )
+        self._captured = np.empty(self.max_chunks * VAD_CHUNK_SIZE, dtype=np.int16)
+        self._n_captured = 0
+        self._scratch = np.empty(VAD_CHUNK_SIZE, dtype=np.float32)
+        self._gate = _EnergyGate(settings) if settings.vad_pregate else None
+        self.in_speech = False
+        self.ever_had_speech = False
+        self.inter_segment_deadline: int | None = None
+
+    def _to_float(self, mono: NDArray[np.int16]) -> NDArray[np.float32]:
+        chunk_float = self._scratch[: len(mono)]
+        np.copyto(chunk_float, mono, casting="unsafe")
+        chunk_float *= _INT16_SCALE
+        return chunk_float
+
+    def feed(self, mono: NDArray[np.int16], chunk_index: int) -> bool:
+        """Process one chunk. Returns True once the utterance is complete."""
+        chunk_float = self._to_float(mono)
+        if self._gate is not None and not self.in_speech:
+            if self._gate.is_silent(mono, chunk_float):
+                capture_stats.vad_skipped += 1
+                return False
+            for skipped in self._gate.drain_lookback():
+                if self._process(skipped, self._to_float(skipped), chunk_index):
+                    return True
+            chunk_float = self._to_float(mono)
+            done = self._process(mono, chunk_float, chunk_index)
+            if not self.in_speech:
+                self._gate.track_noise()
+            return done
+        return self._process(mono, chunk_float, chunk_index)
+
+    def _process(
+        self, mono: NDArray[np.int16], chunk_float: NDArray[np.float32], chunk_index: int
+    ) -> bool:
+        vad_result = self._vad(chunk_float)
+
+        if vad_result is not None and "start" in vad_result:
+            if self._echo_gate is not None and self._echo_gate(chunk_float):
+                self._vad.reset_states()
+                return False
+            if not self.ever_had_speech and self._on_speech_start is not None:
+                self._on_speech_start()
+            self.in_speech = True
+            self.ever_had_speech = True
+            self.inter_segment_deadline = None
+
+        if self.in_speech:
+            end = min(self._n_captured + len(mono), len(self._captured))
+            self._captured[self._n_captured : end] = mono[: end - self._n_captured]
+            self._n_captured = end
+
+        if self.in_speech and vad_result is not None and "end" in vad_result:
+            self.in_speech = False
+            if self._timeout_chunks > 0:
+                # Multi-segment: wait for more speech
+                self._emit_segment()
+                self._vad.reset_states()
+                self.inter_segment_deadline = chunk_index + self._timeout_chunks
+            else:
+                # Legacy single-segment: stop immediately
+                return True
+        return False
+
+    def _emit_segment(self) -> None:
+        if self._on_segment is None or self._n_captured == self._segment_start:
+            return
+        segment = self._captured[self._segment_start : self._n_captured]
+        self._segment_start = self._n_captured
+        self._on_segment(encode_wav(segment, self._settings.audio_sample_rate))
+
+    def result(self) -> BytesIO:
+        if not self.ever_had_speech or self._n_captured == 0:
+            raise NoSpeechError("No speech detected")
+        self._emit_segment()
+        sample_rate = self._settings.audio_sample_rate
+        with span("wav_encode", audio_seconds=self._n_captured / sample_rate):
+            return encode_wav(self._captured[: self._n_captured], sample_rate)
+
+
+def _capture_utterance(
+    read_chunk: Callable[[], NDArray[np.int16]],
+    vad: Any,
+    settings: Settings,
+    stop_event: threading.Event | None = None,
+    on_speech_start: Callable[[], None] | None = None,
+    echo_gate: EchoGate | None = None,
+    on_segment: SegmentCallback | None = None,
+) -> BytesIO:
+    """Run VAD over mono int16 chunks from read_chunk until the utterance is complete.
+
+    on_speech_start fires once, when the first accepted speech segment begins.
+    echo_gate is consulted on every VAD start; returning True rejects the
+    segment as loudspeaker echo (used for barge-in during TTS playback).
+    on_segment is called from the capture thread with each finished segment.
+    """
+    segmenter = _Segmenter(vad, settings, on_speech_start, echo_gate, on_segment)
+
+    with span("capture"):
+        for chunk_index in range(segmenter.max_chunks):
             if stop_event and stop_event.is_set():
                 break
 
             # Inter-segment timeout expired — done recording
-            if inter_segment_deadline is not None and chunk_index >= inter_segment_deadline:
+            deadline = segmenter.inter_segment_deadline
+            if deadline is not None and chunk_index >= deadline:
                 break
 
-            raw, _overflowed = stream.read(VAD_CHUNK_SIZE)  # pyright: ignore[reportUnknownMemberType]
+            if segmenter.feed(read_chunk(), chunk_index):
+                break
+
+    return segmenter.result()
+
+
+def encode_wav(samples: NDArray[np.int16], sample_rate: int) -> BytesIO:
+    """Encode mono int16 samples as a 16-bit PCM WAV without intermediate copies.
+
+    The RIFF header is packed by hand and the sample memory is handed to the
+    buffer as a memoryview, so the only copy is the write into the BytesIO.
+    """
+    data = samples if samples.dtype == np.dtype("<i2") else samples.astype("<i2")
+    data = np.ascontiguousarray(data)
+    n_bytes = data.nbytes
+    buf = BytesIO()
+    buf.write(
+        struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF",
+            36 + n_bytes,
+            b"WAVE",
+            b"fmt ",
+            16,
+            1,  # PCM
+            1,  # mono
+            sample_rate,
+            sample_rate * 2,
+            2,
+            16,
+            b"data",
+            n_bytes,
+        )
+    )
+    buf.write(memoryview(data).cast("B"))
+    buf.seek(0)
+    return buf
+
+
+def _record_speech_blocking(
+    settings: Settings,
+    stop_event: threading.Event | None = None,
+    on_speech_start: Callable[[], None] | None = None,
+    echo_gate: EchoGate | None = None,
+    on_segment: SegmentCallback | None = None,
+) -> BytesIO:
+    """Record one (possibly multi-segment) utterance from a freshly opened microphone."""
+    vad = _new_vad_iterator(_load_vad_model(settings), settings)
+
+    if settings.capture_mode == "callback":
+        with _CallbackCapture(settings) as capture:
+            return _capture_utterance(
+                capture.read, vad, settings, stop_event, on_speech_start, echo_gate, on_segment
+            )
+
+    with _open_input_stream(settings) as stream:
+
+        def read_chunk() -> NDArray[np.int16]:
+            raw, overflowed = stream.read(VAD_CHUNK_SIZE)
+            if overflowed:
+                capture_stats.overflows += 1
+            capture_stats.chunks += 1
             chunk_int16: NDArray[np.int16] = np.asarray(raw, dtype=np.int16)
-            mono = chunk_int16[:, 0]
+            return chunk_int16[:, 0]
+
+        return _capture_utterance(
+            read_chunk, vad, settings, stop_event, on_speech_start, echo_gate, on_segment
+        )
 
-            chunk_float = mono.astype(np.float32) / 32768.0
-            vad_result = vad(chunk_float)
 
-            if vad_result is not None and "start" in vad_result:
-                speech_started = True
-                ever_had_speech = True
-                inter_segment_deadline = None
+class CaptureSession:
+    """Warm microphone: open input stream, loaded VAD model and a rolling pre-roll.
 
-            if speech_started:
-                frames.append(np.array(mono, dtype=np.int16, copy=True))
+    A reader thread drains the stream continuously. Between recordings only the
+    last `prearm_pre_roll_ms` of audio is kept; `record()` replays that history
+    into the VAD before live audio, so speech that began just before the call
+    is not clipped. Recordings must use the sample rate and channel count the
+    session was opened with.
+    """
 
-            if vad_result is not None and "end" in vad_result:
-                speech_started = False
-                if timeout_chunks > 0:
-                    # Multi-segment: wait for more speech
-                    vad.reset_states()  # pyright: ignore[reportUnknownMemberType]
-                    inter_segment_deadline = chunk_index + timeout_chunks
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+        self._model = _load_vad_model(settings)
+        pre_roll_chunks = int(
+            settings.prearm_pre_roll_ms / 1000 * settings.audio_sample_rate / VAD_CHUNK_SIZE
+        )
+        self._pre_roll: deque[NDArray[np.int16]] = deque(maxlen=max(1, pre_roll_chunks))
+        self._live: queue.Queue[NDArray[np.int16]] | None = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._stream: Any = _open_input_stream(settings)
+        self._stream.start()
+        self._reader = threading.Thread(target=self._drain, name="babel-capture", daemon=True)
+        self._reader.start()
+
+    def _drain(self) -> None:
+        while not self._closed.is_set():
+            try:
+                raw, overflowed = self._stream.read(VAD_CHUNK_SIZE)
+            except Exception:
+                if self._closed.is_set():
+                    return
+                raise
+            if overflowed:
+                capture_stats.overflows += 1
+            capture_stats.chunks += 1
+            mono = np.array(np.asarray(raw, dtype=np.int16)[:, 0], copy=True)
+            with self._lock:
+                if self._live is not None:
+                    self._live.put(mono)
                 else:
-                    # Legacy single-segment: stop immediately
-                    break
+                    self._pre_roll.append(mono)
 
-    if not ever_had_speech or not frames:
-        raise NoSpeechError("No speech detected")
+    def _attach(self) -> queue.Queue[NDArray[np.int16]]:
+        """Route audio into a queue, starting with the buffered pre-roll, until `_detach`."""
+        live: queue.Queue[NDArray[np.int16]] = queue.Queue()
+        with self._lock:
+            for chunk in self._pre_roll:
+                live.put(chunk)
+            self._pre_roll.clear()
+            self._live = live
+        return live
 
-    audio_data = np.concatenate(frames)
-    buf = BytesIO()
-    sf.write(buf, audio_data, settings.audio_sample_rate, format="WAV", subtype="PCM_16")  # pyright: ignore[reportUnknownMemberType]
-    buf.seek(0)
-    return buf
+    def _detach(self) -> None:
+        with self._lock:
+            self._live = None
+
+    def _record_blocking(
+        self,
+        settings: Settings,
+        stop_event: threading.Event | None,
+        on_speech_start: Callable[[], None] | None,
+        echo_gate: EchoGate | None,
+        on_segment: SegmentCallback | None = None,
+    ) -> BytesIO:
+        live = self._attach()
+        try:
+            vad = _new_vad_iterator(self._model, settings)
+            return _capture_utterance(
+                live.get, vad, settings, stop_event, on_speech_start, echo_gate, on_segment
+            )
+        finally:
+            self._detach()
+
+    async def record(
+        self,
+        settings: Settings | None = None,
+        stop_event: threading.Event | None = None,
+        on_speech_start: Callable[[], None] | None = None,
+        echo_gate: EchoGate | None = None,
+        on_segment: SegmentCallback | None = None,
+    ) -> BytesIO:
+        return await asyncio.to_thread(
+            self._record_blocking,
+            settings or self.settings,
+            stop_event,
+            on_speech_start,
+            echo_gate,
+            on_segment,
+        )
+
+    def close(self) -> None:
+        self._closed.set()
+        self._stream.stop()
+        self._reader.join(timeout=1.0)
+        self._stream.close()
+
+
+class CaptureEngine:
+    """Always-on capture: one input stream and one VAD iterator for every utterance.
+
+    `record_speech` opens the microphone and builds a VAD iterator per
+    utterance, and nothing listens while the previous utterance is being
+    transcribed. The engine segments the stream continuously on a background
+    thread instead, so speech that starts during processing becomes the next
+    utterance rather than being cut off. `utterances()` yields them as an async
+    stream; `record` adapts the stream to the `Recorder` interface.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+        self._session = CaptureSession(settings)
+        self._feed = self._session._attach()
+        self._vad = _new_vad_iterator(self._session._model, settings)
+        self._closed = threading.Event()
+        # None marks the end of the stream
+        self._utterances: asyncio.Queue[BytesIO | Exception | None] = asyncio.Queue()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._segmenter: threading.Thread | None = None
+
+    def _read(self) -> NDArray[np.int16]:
+        try:
+            return self._feed.get(timeout=_INPUT_STALL_SECONDS)
+        except queue.Empty:
+            raise RuntimeError("No audio from input device") from None
+
+    def _publish(self, item: BytesIO | Exception | None) -> None:
+        assert self._loop is not None
+        self._loop.call_soon_threadsafe(self._utterances.put_nowait, item)
+
+    def _segment(self) -> None:
+        while not self._closed.is_set():
+            try:
+                audio = _capture_utterance(self._read, self._vad, self.settings, self._closed)
+            except NoSpeechError:
+                continue
+            except Exception as e:
+                if not self._closed.is_set():
+                    self._publish(e)
+                return
+            finally:
+                # Cut off by max_record_seconds mid-speech: the next utterance needs a fresh start
+                if getattr(self._vad, "triggered", False):
+                    self._vad.reset_states()
+            if not self._closed.is_set():
+                self._publish(audio)
+
+    async def _next(self) -> BytesIO | None:
+        if self._segmenter is None:
+            self._loop = asyncio.get_running_loop()
+            self._segmenter = threading.Thread(
+                target=self._segment, name="babel-segmenter", daemon=True
+            )
+            self._segmenter.start()
+        item = await self._utterances.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def utterances(self) -> AsyncIterator[BytesIO]:
+        """Completed utterances as WAV, in order, until `close()`."""
+        while (audio := await self._next()) is not None:
+            yield audio
+
+    async def record(
+        self,
+        settings: Settings | None = None,
+        stop_event: threading.Event | None = None,
+        on_segment: SegmentCallback | None = None,
+    ) -> BytesIO:
+        """The next utterance, as a `Recorder` for `run_pipeline`.
+
+        Raises NoSpeechError once the engine is closed. The utterance is
+        already complete, so on_segment receives it as a single segment.
+        """
+        audio = await self._next()
+        if audio is None:
+            raise NoSpeechError("Capture engine closed")
+        if on_segment is not None:
+            on_segment(BytesIO(audio.getvalue()))
+        return audio
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._loop is not None:
+            self._publish(None)
+        else:
+            self._utterances.put_nowait(None)
+        self._session.close()
+        if self._segmenter is not None:
+            self._segmenter.join(timeout=1.0)
 
 
 async def record_speech(
-    settings: Settings | None = None, stop_event: threading.Event | None = None
+    settings: Settings | None = None,
+    stop_event: threading.Event | None = None,
+    on_speech_start: Callable[[], None] | None = None,
+    echo_gate: EchoGate | None = None,
+    on_segment: SegmentCallback | None = None,
 ) -> BytesIO:
-    settings = settings or Settings()
-    return await asyncio.to_thread(_record_speech_blocking, settings, stop_event)
+    settings = settings or get_settings()
+    return await asyncio.to_thread(
+        _record_speech_blocking, settings, stop_event, on_speech_start, echo_gate, on_segment
+    )
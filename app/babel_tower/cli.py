@@ -191,8 +191,12 @@ def serve(
     """HTTP service: audio file → clean transcript (for nanobot/Rupert)."""
     import uvicorn
 
+    from babel_tower.config import get_settings, reload_on_sighup
     from babel_tower.serve import create_app
+    from babel_tower.warmup import start_warm_up
 
+    reload_on_sighup()
+    start_warm_up(get_settings())
     uvicorn.run(create_app(), host=host, port=port)
 
 
@@ -205,8 +209,22 @@ def telegram_bot() -> None:
 
 
 @app.command()
-def debug() -> None:
+def debug(
+    startup: bool = typer.Option(
+        False, "--startup", help="Profile `babel listen` cold start and slowest imports"
+    ),
+    tokens: bool = typer.Option(
+        False, "--tokens", help="Per-mode LLM token usage and rates from recorded traces"
+    ),
+) -> None:
     """Show resolved settings and test connectivity."""
+    if startup:
+        _debug_startup()
+        return
+    if tokens:
+        _debug_tokens()
+        return
+
     from babel_tower.config import Settings
     from babel_tower.processing import get_available_modes, resolve_prompts_dir
 
@@ -248,5 +266,54 @@ def debug() -> None:
         typer.echo(f"STT ({settings.stt_url}): UNREACHABLE", err=True)
 
 
+def _debug_startup() -> None:
+    from babel_tower.startup import measure_listen_cold_start
+
+    try:
+        report = measure_listen_cold_start(importtime=True)
+    except RuntimeError as e:
+        typer.echo(f"Fehler: {e}", err=True)
+        raise typer.Exit(1) from None
+
+    typer.echo("=== Cold start: babel listen (before recording) ===")
+    typer.echo(f"total:            {report.total_s * 1000:7.0f} ms (interpreter + -X importtime)")
+    for phase, seconds in report.phases.items():
+        typer.echo(f"{phase + ':':17s} {seconds * 1000:7.0f} ms")
+
+    typer.echo("\n=== Slowest imports (cumulative, per package) ===")
+    for package, seconds in report.packages():
+        typer.echo(f"{package:24s} {seconds * 1000:7.0f} ms")
+
+
+def _debug_tokens() -> None:
+    from babel_tower.state import traces_path
+    from babel_tower.usage import summarize
+
+    path = traces_path()
+    if not path.exists():
+        typer.echo(f"Keine Traces in {path} — mit BABEL_TRACE_EXPORT=jsonl aufzeichnen.", err=True)
+        raise typer.Exit(1)
+    with path.open() as f:
+        summaries = summarize(f)
+    if not summaries:
+        typer.echo("Keine LLM-Requests mit usage-Angaben in den Traces.", err=True)
+        raise typer.Exit(1)
+
+    typer.echo("=== LLM tokens per mode ===")
+    typer.echo(
+        f"{'mode':14s} {'reqs':>5s} {'prompt':>7s} {'cached':>7s} {'compl':>6s} "
+        f"{'latency':>8s} {'tok/s':>6s} {'prefill/1k':>10s} {'decode/tok':>10s} {'prompt%':>7s}"
+    )
+    for s in summaries:
+        prefill = f"{s.prefill_ms_per_1k:8.0f}ms" if s.prefill_ms_per_1k is not None else "-"
+        decode = f"{s.decode_ms_per_token:8.1f}ms" if s.decode_ms_per_token is not None else "-"
+        share = f"{s.prompt_share:7.0%}" if s.prompt_share is not None else "-"
+        typer.echo(
+            f"{s.mode:14s} {s.requests:5d} {s.prompt_tokens:7.0f} {s.cached_ratio:7.0%} "
+            f"{s.completion_tokens:6.0f} {s.latency_s * 1000:6.0f}ms "
+            f"{s.completion_tokens_per_s:6.1f} {prefill:>10s} {decode:>10s} {share:>7s}"
+        )
+
+
 if __name__ == "__main__":
     app()
@@ -1,5 +1,10 @@
+import signal
+import threading
+import time
 from pathlib import Path
+from typing import Literal
 
+from loguru import logger
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -20,35 +25,144 @@ class Settings(BaseSettings):
     stt_hotwords: str = ""
     stt_prompt: str = ""
     stt_corrections: str = ""
+    stt_urls: str = ""
+    stt_hedge: bool = False
+    stt_hedge_min_delay: float = 0.5
+    stt_eject_seconds: float = 30.0
+    stt_health_interval: float = 15.0
 
     # LLM Postprocessing (M5)
     llm_url: str = "http://ai-station:4000"
     llm_model: str = "babel"
     llm_api_key: str = ""
     llm_timeout: float = 300.0
+    llm_urls: str = ""
+    llm_mode_models: str = ""
+    llm_retries: int = 2
+    llm_retry_backoff: float = 0.25
+    llm_breaker_failures: int = 3
+    llm_breaker_reset: float = 30.0
+    llm_hedge_modes: str = ""
+    llm_hedge_min_delay: float = 1.0
+    llm_cache: Literal["off", "memory", "disk"] = "off"
+    llm_cache_size: int = 256
+    llm_cache_disk_entries: int = 10000
 
     # Audio
     audio_sample_rate: int = 16000
     audio_channels: int = 1
     vad_threshold: float = 0.5
+    vad_intra_op_threads: int = 1
+    vad_inter_op_threads: int = 1
+    vad_graph_optimization: Literal["disable", "basic", "extended", "all"] = "all"
+    vad_optimized_model_path: str = ""
+    vad_pregate: bool = False
+    vad_pregate_ratio: float = 3.0
+    vad_pregate_lookback_ms: int = 96
     silence_duration: float = 2.0
     inter_segment_timeout: float = 30.0
     max_record_seconds: int = 600
+    capture_mode: Literal["blocking", "callback"] = "blocking"
+    capture_queue_chunks: int = 64
+    prearm_capture: bool = False
+    prearm_pre_roll_ms: int = 300
+    capture_engine: bool = False
 
     # TTS (M5)
     tts_url: str = "http://m5:8000"
     tts_voice: str = "thorsten_emotional"
     tts_timeout: float = 10.0
     tts_enabled: bool = False
+    barge_in_enabled: bool = False
+    barge_in_echo_ratio: float = 0.5
 
     # Processing
     default_mode: str = "clean"
     durchreichen_max_words: int = 5
+    local_fastpath: bool = False
+    local_fastpath_max_words: int = 8
+    local_fastpath_min_confidence: float = 0.7
+    speculative_modes: str = ""
+    speculative_paragraph_words: int = 40
+    speculative_reconcile: bool = False
+    revise_max_turns: int = 8
+    revise_targeted: bool = False
+    revise_targeted_min_sections: int = 4
     review_enabled: bool = False
 
+    # Warm-up
+    warmup_on_start: bool = False
+    warmup_on_record: bool = False
+    warmup_keepalive_seconds: float = 0.0
+    warmup_min_interval: float = 60.0
+
+    # Tracing
+    trace_export: Literal["off", "jsonl", "otlp"] = "off"
+    trace_otlp_url: str = "http://localhost:4318/v1/traces"
+    metrics_port: int = 0
+
     # Prompts
     prompts_dir: str = "prompts"
 
+    # MCP server
+    mcp_session_idle_seconds: float = 3600.0
+
     # Telegram bot
     telegram_bot_token: str = ""
     telegram_allowed_users: str = ""
+
+
+# How often get_settings() stats the .env file; reads in between return the cached instance
+_RELOAD_CHECK_INTERVAL = 1.0
+
+_current: Settings | None = None
+_current_stamp: tuple[int, int] | None = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def _env_file_stamp() -> tuple[int, int] | None:
+    env_file = Settings.model_config.get("env_file")
+    if not isinstance(env_file, str | Path):
+        return None
+    try:
+        stat = Path(env_file).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def get_settings() -> Settings:
+    """Process-wide Settings, parsed once and rebuilt when `.env` changes or after a reload.
+
+    The instance is shared: derive per-request variants with
+    `model_copy(update=...)`, which copies the parsed values without reading
+    the environment again, instead of mutating it.
+    """
+    global _current, _current_stamp, _checked_at
+    current = _current
+    now = time.monotonic()
+    if current is not None and now - _checked_at < _RELOAD_CHECK_INTERVAL:
+        return current
+    with _lock:
+        stamp = _env_file_stamp()
+        _checked_at = now
+        if _current is None or stamp != _current_stamp:
+            if _current is not None:
+                logger.info("Settings changed, reloading")
+            _current = Settings()
+            _current_stamp = stamp
+        return _current
+
+
+def reload_settings() -> None:
+    """Drop the cached Settings; the next get_settings() re-reads the environment and `.env`."""
+    global _current
+    # No lock: this runs from signal handlers, possibly while get_settings() holds it
+    _current = None
+
+
+def reload_on_sighup() -> None:
+    """Reload settings on SIGHUP. Signal handlers can only be installed from the main thread."""
+    if hasattr(signal, "SIGHUP") and threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGHUP, lambda _signum, _frame: reload_settings())
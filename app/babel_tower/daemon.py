@@ -1,35 +1,61 @@
 import asyncio
 import signal
 
-from babel_tower.audio import NoSpeechError
-from babel_tower.config import Settings
+from babel_tower.audio import CaptureEngine, NoSpeechError
+from babel_tower.config import Settings, get_settings, reload_settings
+from babel_tower.metrics import start_metrics_server, track_request
 from babel_tower.output import notify
 from babel_tower.pipeline import run_pipeline
+from babel_tower.tracing import trace
+from babel_tower.warmup import start_warm_up
 
 
 class VoiceDaemon:
     def __init__(self, settings: Settings | None = None) -> None:
-        self.settings = settings or Settings()
+        self._settings = settings
         self._running = False
+        self._engine: CaptureEngine | None = None
+
+    @property
+    def settings(self) -> Settings:
+        """Explicit settings, else the process-wide ones (re-read per utterance, SIGHUP reloads)."""
+        return self._settings or get_settings()
 
     async def run(self) -> None:
         self._running = True
         loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, self._shutdown)
+        loop.add_signal_handler(signal.SIGHUP, reload_settings)
+
+        if self.settings.metrics_port:
+            start_metrics_server(self.settings.metrics_port)
+        start_warm_up(self.settings)
+
+        if self.settings.capture_engine:
+            self._engine = CaptureEngine(self.settings)
+        recorder = self._engine.record if self._engine is not None else None
 
         notify("Babel Tower", "Daemon gestartet \u2014 warte auf Sprache...", "low")
 
-        while self._running:
-            try:
-                await run_pipeline(settings=self.settings)
-            except NoSpeechError:
-                continue
-            except Exception as e:
-                notify("Babel Tower", f"Fehler: {e}", "critical")
-                await asyncio.sleep(1)
+        try:
+            while self._running:
+                try:
+                    with track_request("daemon"), trace("daemon.utterance", self.settings):
+                        await run_pipeline(settings=self.settings, recorder=recorder)
+                except NoSpeechError:
+                    continue
+                except Exception as e:
+                    notify("Babel Tower", f"Fehler: {e}", "critical")
+                    await asyncio.sleep(1)
+        finally:
+            if self._engine is not None:
+                self._engine.close()
 
         notify("Babel Tower", "Daemon gestoppt", "low")
 
     def _shutdown(self) -> None:
         self._running = False
+        if self._engine is not None:
+            # Wakes the loop waiting for the next utterance
+            self._engine.close()
@@ -0,0 +1,133 @@
+"""LLM response cache: in-process LRU in front of an optional SQLite tier in the state dir.
+
+Keys hash the mode, the assembled system prompt, the model list and the
+whitespace/Unicode-normalized user message, so editing a prompt file
+invalidates its entries without any bookkeeping; stale rows age out of the
+disk tier by least-recent access. SQLite in WAL mode lets several serve
+workers share the disk tier.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+
+from loguru import logger
+
+from babel_tower.config import Settings
+from babel_tower.metrics import cache_lookups_total
+from babel_tower.state import llm_cache_path
+
+_PRUNE_EVERY = 64
+
+
+def cache_key(mode: str, system_prompt: str, models: list[str], user_message: str) -> str:
+    prompt_hash = hashlib.sha256(system_prompt.encode()).hexdigest()
+    normalized = " ".join(unicodedata.normalize("NFC", user_message).split())
+    raw = "\0".join([mode, prompt_hash, "|".join(models), normalized])
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, size: int, db_path: Path | None = None, disk_entries: int = 10000) -> None:
+        self._size = size
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_entries = disk_entries
+        self._puts = 0
+        self._db: sqlite3.Connection | None = None
+        if db_path is not None:
+            self._db = _open_db(db_path)
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                cache_lookups_total.inc(cache="llm", result="hit")
+                return value
+            value = self._disk_get(key)
+            if value is not None:
+                self._remember(key, value)
+                cache_lookups_total.inc(cache="llm", result="disk_hit")
+                return value
+        cache_lookups_total.inc(cache="llm", result="miss")
+        return None
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._remember(key, value)
+            self._disk_put(key, value)
+
+    def _remember(self, key: str, value: str) -> None:
+        if self._size <= 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._size:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, key: str) -> str | None:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._db.execute("UPDATE cache SET accessed = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.Error as e:
+            logger.debug("LLM cache read failed: {}", e)
+            return None
+        return row[0] if row else None
+
+    def _disk_put(self, key: str, value: str) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO cache (key, value, accessed) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            self._puts += 1
+            if self._puts % _PRUNE_EVERY == 0:
+                self._db.execute(
+                    "DELETE FROM cache WHERE key NOT IN "
+                    "(SELECT key FROM cache ORDER BY accessed DESC LIMIT ?)",
+                    (self._disk_entries,),
+                )
+        except sqlite3.Error as e:
+            logger.debug("LLM cache write failed: {}", e)
+
+
+def _open_db(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Autocommit; the per-instance lock serializes use of the shared connection across threads
+    db = sqlite3.connect(path, isolation_level=None, check_same_thread=False, timeout=5.0)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS cache "
+        "(key TEXT PRIMARY KEY, value TEXT NOT NULL, accessed REAL NOT NULL)"
+    )
+    return db
+
+
+_caches: dict[tuple[object, ...], ResponseCache] = {}
+
+
+def get_cache(settings: Settings) -> ResponseCache | None:
+    """Process-wide cache for the configured tier, or None when caching is off."""
+    if settings.llm_cache == "off":
+        return None
+    db_path = llm_cache_path() if settings.llm_cache == "disk" else None
+    key = (settings.llm_cache, settings.llm_cache_size, settings.llm_cache_disk_entries, db_path)
+    cache = _caches.get(key)
+    if cache is None:
+        cache = _caches[key] = ResponseCache(
+            settings.llm_cache_size, db_path, settings.llm_cache_disk_entries
+        )
+    return cache
@@ -1,13 +1,66 @@
+import asyncio
+from functools import partial
+
 from fastmcp import FastMCP
+from fastmcp.server.dependencies import get_context
+from pydantic import TypeAdapter, ValidationError
 
-from babel_tower.config import Settings
+from babel_tower.audio import CaptureSession, Recorder, record_speech
+from babel_tower.config import Settings, get_settings, reload_on_sighup
 from babel_tower.output import notify
 from babel_tower.pipeline import run_pipeline
 from babel_tower.processing import get_available_modes
+from babel_tower.sessions import SessionSettings
+from babel_tower.tracing import span, trace
+from babel_tower.warmup import start_warm_up
 
 mcp = FastMCP("babel-tower")
 
-_settings = Settings()
+_sessions = SessionSettings(get_settings)
+
+# Settings a client may change for its own session via set_option
+_SESSION_OPTIONS = (
+    "stt_model",
+    "stt_language",
+    "stt_hotwords",
+    "stt_prompt",
+    "vad_threshold",
+    "silence_duration",
+    "inter_segment_timeout",
+    "max_record_seconds",
+    "durchreichen_max_words",
+    "tts_enabled",
+    "tts_voice",
+    "barge_in_enabled",
+)
+
+_capture: CaptureSession | None = None
+
+
+def _session_id() -> str:
+    try:
+        return get_context().session_id
+    except RuntimeError:
+        # Called outside an MCP request (tests, direct calls): the shared default session
+        return ""
+
+
+def _session_settings() -> Settings:
+    return _sessions.get(_session_id())
+
+
+def _recorder(settings: Settings) -> Recorder | None:
+    """Warm capture session recorder when pre-arming is enabled (opened on first use).
+
+    There is one microphone, so all sessions share the capture session opened
+    with the settings of the first one that records.
+    """
+    global _capture
+    if not settings.prearm_capture:
+        return None
+    if _capture is None:
+        _capture = CaptureSession(settings)
+    return _capture.record
 
 
 @mcp.tool(annotations={"title": "Converse", "readOnlyHint": False, "destructiveHint": False})
@@ -43,19 +96,58 @@ async def converse(
         mode: Processing mode override (structure/clean/durchreichen).
               Auto-selects based on transcript length if not specified.
     """
+    settings = _session_settings()
+    with trace("converse", settings, wait_for_response=wait_for_response):
+        return await _converse(message, wait_for_response, mode, settings)
+
+
+async def _converse(
+    message: str | None, wait_for_response: bool, mode: str | None, settings: Settings
+) -> str:
+    if message and settings.tts_enabled and settings.barge_in_enabled and wait_for_response:
+        return await _converse_barge_in(message, mode, settings)
     if message:
-        if _settings.tts_enabled:
+        if settings.tts_enabled:
             try:
                 from babel_tower.tts import speak
 
-                await speak(message, _settings)
+                with span("tts"):
+                    await speak(message, settings)
             except Exception:
                 notify("Babel Tower", message)
         else:
             notify("Babel Tower", message)
     if not wait_for_response:
         return ""
-    return await run_pipeline(mode=mode, settings=_settings, clipboard=False)
+    return await run_pipeline(
+        mode=mode, settings=settings, clipboard=False, recorder=_recorder(settings)
+    )
+
+
+async def _converse_barge_in(message: str, mode: str | None, settings: Settings) -> str:
+    """Speak the message while already listening; user speech cuts playback short."""
+    from babel_tower.tts import Playback, synthesize
+
+    try:
+        playback = Playback(await synthesize(message, settings))
+    except Exception:
+        notify("Babel Tower", message)
+        return await run_pipeline(
+            mode=mode, settings=settings, clipboard=False, recorder=_recorder(settings)
+        )
+
+    recorder = partial(
+        _recorder(settings) or record_speech,
+        on_speech_start=playback.stop,
+        echo_gate=partial(playback.is_echo, ratio=settings.barge_in_echo_ratio),
+    )
+    playback.start()
+    playing = asyncio.create_task(asyncio.to_thread(playback.wait))
+    try:
+        return await run_pipeline(mode=mode, settings=settings, clipboard=False, recorder=recorder)
+    finally:
+        playback.stop()
+        await playing
 
 
 @mcp.tool(annotations={"title": "Set Mode", "readOnlyHint": False, "destructiveHint": False})
@@ -66,12 +158,39 @@ async def set_mode(
 
     Available modes: structure, clean, durchreichen.
     """
-    valid_modes = get_available_modes(_settings)
+    valid_modes = get_available_modes(_session_settings())
     if mode not in valid_modes:
         return f"Unknown mode: {mode}. Valid: {', '.join(sorted(valid_modes))}"
-    _settings.default_mode = mode
+    _sessions.update(_session_id(), default_mode=mode)
     return f"Default mode set to: {mode}"
 
 
+@mcp.tool(annotations={"title": "Set Option", "readOnlyHint": False, "destructiveHint": False})
+async def set_option(
+    name: str,
+    value: str,
+) -> str:
+    """Change a recording, STT or TTS setting for this session only.
+
+    Options: stt_model, stt_language, stt_hotwords, stt_prompt, vad_threshold,
+    silence_duration (seconds of silence that end an utterance),
+    inter_segment_timeout, max_record_seconds, durchreichen_max_words,
+    tts_enabled, tts_voice, barge_in_enabled.
+    """
+    if name not in _SESSION_OPTIONS:
+        return f"Unknown option: {name}. Valid: {', '.join(_SESSION_OPTIONS)}"
+    annotation = Settings.model_fields[name].annotation
+    try:
+        parsed = TypeAdapter(annotation).validate_python(value)
+    except ValidationError as e:
+        return f"Invalid value for {name}: {e.errors()[0]['msg']}"
+    _sessions.update(_session_id(), **{name: parsed})
+    return f"{name} set to: {parsed}"
+
+
 if __name__ == "__main__":
+    settings = get_settings()
+    _recorder(settings)
+    reload_on_sighup()
+    start_warm_up(settings)
     mcp.run()
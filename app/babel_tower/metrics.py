@@ -0,0 +1,201 @@
+"""Prometheus text-format metrics for serve, the daemon and the Telegram bot.
+
+A deliberately small registry (counters, gauges, histograms with labels) that
+renders the text exposition format, so no client library is needed. serve
+mounts `/metrics`; the daemon and bot can expose it on `metrics_port`.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _format_labels(key: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    body = ",".join(f'{k}="{v}"' for k, v in pairs)
+    return "{" + body + "}"
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help_text = help_text
+        self._lock = threading.Lock()
+        _REGISTRY.append(self)
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {self.help_text}\n# TYPE {self.name} {self.kind}\n"
+        with self._lock:
+            return header + "".join(line + "\n" for line in self._samples())
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        super().__init__(name, help_text)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, value: float = 1.0, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(tuple(sorted(labels.items())), 0.0)
+
+    def _samples(self) -> list[str]:
+        return [f"{self.name}{_format_labels(k)} {v}" for k, v in self._values.items()]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, value: float = 1.0, **labels: str) -> None:
+        self.inc(-value, **labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help_text: str, buckets: tuple[float, ...] = _LATENCY_BUCKETS
+    ) -> None:
+        super().__init__(name, help_text)
+        self._buckets = buckets
+        self._counts: dict[LabelKey, list[int]] = {}
+        self._sums: dict[LabelKey, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self._buckets) + 1))
+            for i, bound in enumerate(self._buckets):
+                if value <= bound:
+                    counts[i] += 1
+            counts[-1] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, **labels: str) -> int:
+        counts = self._counts.get(tuple(sorted(labels.items())))
+        return counts[-1] if counts else 0
+
+    def _samples(self) -> list[str]:
+        lines: list[str] = []
+        for key, counts in self._counts.items():
+            for bound, n in zip(self._buckets, counts, strict=False):
+                lines.append(f"{self.name}_bucket{_format_labels(key, (('le', str(bound)),))} {n}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, (('le', '+Inf'),))} {counts[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {self._sums[key]}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {counts[-1]}")
+        return lines
+
+
+_REGISTRY: list[_Metric] = []
+
+requests_total = Counter("babel_requests_total", "Pipeline runs started, by entry point")
+requests_in_flight = Gauge("babel_requests_in_flight", "Pipeline runs in progress")
+stage_seconds = Histogram("babel_stage_duration_seconds", "Upstream stage latency")
+upstream_errors_total = Counter(
+    "babel_upstream_errors_total", "Failed upstream calls by stage and error class"
+)
+cache_lookups_total = Counter("babel_cache_lookups_total", "Cache lookups by cache and result")
+audio_seconds_total = Counter("babel_audio_seconds_total", "Seconds of audio sent to STT")
+hedged_requests_total = Counter(
+    "babel_hedged_requests_total", "Duplicate requests sent to a second endpoint, by stage"
+)
+retries_total = Counter("babel_upstream_retries_total", "Retried upstream calls, by stage")
+llm_tokens_total = Counter(
+    "babel_llm_tokens_total", "LLM tokens by mode and kind (prompt, completion, cached)"
+)
+local_fastpath_total = Counter(
+    "babel_local_fastpath_total", "Transcripts normalized locally instead of by the LLM"
+)
+
+
+@contextmanager
+def track_request(entry: str) -> Iterator[None]:
+    requests_total.inc(entry=entry)
+    requests_in_flight.inc(entry=entry)
+    try:
+        yield
+    finally:
+        requests_in_flight.dec(entry=entry)
+
+
+@contextmanager
+def observe_stage(stage: str) -> Iterator[None]:
+    """Time an upstream call; exceptions are counted by class and re-raised."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        upstream_errors_total.inc(stage=stage, error=type(e).__name__)
+        raise
+    finally:
+        stage_seconds.observe(time.perf_counter() - start, stage=stage)
+
+
+def _render_capture_stats() -> str:
+    # Only processes that capture audio have the module loaded; serve never imports it
+    audio = sys.modules.get("babel_tower.audio")
+    if audio is None:
+        return ""
+    capture_stats = audio.capture_stats
+    lines: list[str] = []
+    for field, help_text in (
+        ("chunks", "Audio chunks read from the input device"),
+        ("overflows", "PortAudio input overflows"),
+        ("dropped", "Chunks dropped because the capture queue was full"),
+        ("underruns", "Capture consumer waits longer than two chunk periods"),
+        ("vad_skipped", "Chunks kept away from the VAD by the energy pre-gate"),
+    ):
+        name = f"babel_capture_{field}_total"
+        lines.append(f"# HELP {name} {help_text}\n# TYPE {name} counter\n")
+        lines.append(f"{name} {getattr(capture_stats, field)}\n")
+    return "".join(lines)
+
+
+def render() -> str:
+    return "".join(metric.render() for metric in _REGISTRY) + _render_capture_stats()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:  # nosec: B104
+    """Serve /metrics on a side port from a daemon thread (daemon and Telegram bot)."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="babel-metrics", daemon=True).start()
+    return server
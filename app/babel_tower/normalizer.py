@@ -0,0 +1,116 @@
+"""Deterministic local normalizer for trivial transcripts (BABEL_LOCAL_FASTPATH).
+
+Short confirmations like "ja äh passt so" do not need an LLM round-trip:
+filler removal, capitalisation, terminal punctuation and simple number
+formatting cover them. `fastpath_confidence` decides whether a transcript is
+simple enough; anything with formatting keywords, code-like tokens or
+self-corrections goes to the LLM as before.
+"""
+
+from __future__ import annotations
+
+import re
+
+from babel_tower.config import Settings
+
+_FILLERS = frozenset({"äh", "ähm", "öh", "öhm", "hm", "hmm", "mhm", "eh", "ehm", "uh", "um"})
+
+# Spoken formatting keywords from prompts/_formatting.md; the LLM must handle these
+_KEYWORDS = frozenset(
+    {
+        "file",
+        "filepath",
+        "path",
+        "branch",
+        "branchname",
+        "quote",
+        "anführungszeichen",
+        "code",
+        "backtick",
+        "backticks",
+        "bold",
+        "bolt",
+        "fett",
+        "line",
+        "linebreak",
+        "zeile",
+        "paragraph",
+        "absatz",
+        "punkt",
+        "slash",
+        "unterstrich",
+        "strich",
+        "cut",
+    }
+)
+
+# Self-corrections and restarts the cleanup prompts resolve
+_REPAIRS = ("nein", "ich meine", "beziehungsweise", "korrektur", "sorry", "also nicht")
+
+_QUESTION_WORDS = frozenset(
+    {
+        "wer",
+        "wie",
+        "was",
+        "wann",
+        "wo",
+        "warum",
+        "wieso",
+        "weshalb",
+        "welche",
+        "welcher",
+        "welches",
+        "woher",
+        "wohin",
+        "kannst",
+        "könntest",
+        "soll",
+        "hast",
+        "habt",
+        "machst",
+        "willst",
+    }
+)
+
+_CODE_TOKEN = re.compile(r"[/\\_`*#<>{}\[\]=@]|\w\.\w|[a-z][A-Z]")
+_TOKEN_EDGE = re.compile(r"^\W+|\W+$")
+_DECIMAL = re.compile(r"\b(\d+) Komma (\d+)\b")
+_PERCENT = re.compile(r"\b(\d+(?:,\d+)?) ?(?:Prozent|%)")
+
+
+def _bare_words(text: str) -> list[str]:
+    return [w for w in (_TOKEN_EDGE.sub("", t).lower() for t in text.split()) if w]
+
+
+def fastpath_confidence(transcript: str, settings: Settings) -> float:
+    """Confidence in [0, 1] that the local normalizer output matches what the LLM would return."""
+    words = _bare_words(transcript)
+    if not words or len(words) > settings.local_fastpath_max_words:
+        return 0.0
+    if any(w in _KEYWORDS for w in words) or _CODE_TOKEN.search(transcript):
+        return 0.0
+    lowered = " ".join(words)
+    if any(re.search(rf"\b{repair}\b", lowered) for repair in _REPAIRS):
+        return 0.0
+    fillers = sum(w in _FILLERS for w in words)
+    confidence = 1.0 - 0.4 * len(words) / settings.local_fastpath_max_words - 0.1 * fillers
+    return max(0.0, confidence)
+
+
+def normalize(transcript: str) -> str:
+    """Remove fillers, format numbers, capitalise and punctuate a short transcript."""
+    tokens = [t for t in transcript.split() if _TOKEN_EDGE.sub("", t).lower() not in _FILLERS]
+    if not tokens:
+        return ""
+    text = " ".join(tokens)
+    text = re.sub(r"\s+([,.!?])", r"\1", text)
+    text = re.sub(r",+(?=[.!?]|$)", "", text).strip(" ,")
+    text = _DECIMAL.sub(r"\1,\2", text)
+    text = _PERCENT.sub(r"\1 %", text)
+    text = text[0].upper() + text[1:]
+    if not text.endswith((".", "!", "?", "%")):
+        question = _bare_words(text)[0] in _QUESTION_WORDS
+        text += "?" if question else "."
+    elif text.endswith("%"):
+        text += "."
+    return text
@@ -1,13 +1,19 @@
 import re
 import sys
 import threading
+from functools import partial
 
-from babel_tower.audio import NoSpeechError, record_speech
-from babel_tower.config import Settings
+from babel_tower.audio import NoSpeechError, Recorder, record_speech
+from babel_tower.config import Settings, get_settings
 from babel_tower.output import copy_to_clipboard, notify, read_from_clipboard
-from babel_tower.processing import ProcessingError, process_transcript
+from babel_tower.processing import ProcessingError, format_user_message, process_transcript
+from babel_tower.revision import resume_chain, save_chain
+from babel_tower.sections import revise_sections
+from babel_tower.speculative import SpeculativeProcessor, speculative_mode
 from babel_tower.state import load_result, save_audio, save_result, save_transcript
 from babel_tower.stt import STTError, transcribe
+from babel_tower.tracing import span, trace
+from babel_tower.warmup import schedule_warm_up
 
 _TERMINATOR_RE = re.compile(r"\s*\b[Oo]ver\.?\s*$")
 
@@ -22,16 +28,54 @@ async def run_pipeline(
     clipboard: bool = True,
     stop_event: threading.Event | None = None,
     strict: bool = False,
+    recorder: Recorder | None = None,
 ) -> str:
     """Record speech, transcribe, process, and output. Returns processed text.
 
     When strict=True, errors propagate as exceptions instead of degrading gracefully.
+    recorder replaces the default `record_speech` (e.g. barge-in recording in the MCP server).
     """
-    settings = settings or Settings()
-
+    settings = settings or get_settings()
+    with trace("pipeline", settings, mode=mode or "auto"):
+        return await _run_pipeline(mode, settings, clipboard, stop_event, strict, recorder)
+
+
+async def _run_pipeline(
+    mode: str | None,
+    settings: Settings,
+    clipboard: bool,
+    stop_event: threading.Event | None,
+    strict: bool,
+    recorder: Recorder | None,
+) -> str:
+    record = recorder or record_speech
+    speculation = None
+    if speculative_mode(mode, settings) is not None:
+        speculation = SpeculativeProcessor(mode, settings)
+        record = partial(record, on_segment=speculation.on_segment)
+    try:
+        return await _record_and_process(
+            record, mode, settings, clipboard, stop_event, strict, speculation
+        )
+    finally:
+        if speculation is not None:
+            speculation.cancel()
+
+
+async def _record_and_process(
+    record: Recorder,
+    mode: str | None,
+    settings: Settings,
+    clipboard: bool,
+    stop_event: threading.Event | None,
+    strict: bool,
+    speculation: SpeculativeProcessor | None,
+) -> str:
+    if settings.warmup_on_record:
+        schedule_warm_up(settings)
     notify("Babel Tower", "Aufnahme gestartet...")
     try:
-        audio = await record_speech(settings, stop_event=stop_event)
+        audio = await record(settings, stop_event=stop_event)
     except NoSpeechError:
         notify("Babel Tower", "Keine Sprache erkannt", "low")
         if strict:
@@ -41,7 +85,16 @@ async def run_pipeline(
 
     notify("Babel Tower", "Transkribiere...")
     try:
-        transcript = await transcribe(audio, settings)
+        transcript = None
+        if speculation is not None:
+            try:
+                transcript = await speculation.transcript()
+            except STTError:
+                # A segment failed: retry the recording as a whole, without speculation
+                speculation.cancel()
+                speculation = None
+        if transcript is None:
+            transcript = await transcribe(audio, settings)
     except STTError as e:
         notify("Babel Tower", f"STT-Fehler: {e}", "critical")
         if strict:
@@ -58,7 +111,10 @@ async def run_pipeline(
 
     notify("Babel Tower", "Verarbeite...")
     try:
-        result = await process_transcript(transcript, mode, settings)
+        if speculation is not None:
+            result = await speculation.process(transcript)
+        else:
+            result = await process_transcript(transcript, mode, settings)
     except ProcessingError as e:
         notify("Babel Tower", f"LLM-Fehler: {e}", "critical")
         if strict:
@@ -66,20 +122,27 @@ async def run_pipeline(
         print(f"LLM-Fehler: {e}", file=sys.stderr)
         result = transcript
 
+    return _finish(result, settings, clipboard)
+
+
+def _finish(result: str, settings: Settings, clipboard: bool) -> str:
+    """Optional review, then persist and output the result."""
     if settings.review_enabled:
         from babel_tower.review import review_text
 
-        reviewed = review_text(result)
+        with span("review"):
+            reviewed = review_text(result)
         if reviewed is None:
             notify("Babel Tower", "Verworfen", "low")
             return ""
         result = reviewed
 
-    save_result(result)
+    with span("output"):
+        save_result(result)
 
-    if clipboard:
-        copy_to_clipboard(result)
-        notify("Babel Tower", result[:100])
+        if clipboard:
+            copy_to_clipboard(result)
+            notify("Babel Tower", result[:100])
 
     return result
 
@@ -94,7 +157,14 @@ async def run_revise_pipeline(
     strict: bool = False,
 ) -> str:
     """Read last result (state or clipboard), record change instructions, apply revision via LLM."""
-    settings = settings or Settings()
+    settings = settings or get_settings()
+    with trace("revise", settings):
+        return await _run_revise_pipeline(settings, stop_event, strict)
+
+
+async def _run_revise_pipeline(
+    settings: Settings, stop_event: threading.Event | None, strict: bool
+) -> str:
 
     original = load_result() or read_from_clipboard()
     if not original or not original.strip():
@@ -129,12 +199,21 @@ async def run_revise_pipeline(
             raise NoSpeechError("Empty transcript")
         return ""
 
-    context = f"## Originaltext\n\n{original.strip()}\n\n## Änderungsanweisungen"
+    chain = resume_chain(original, settings)
+    context = chain.context()
     notify("Babel Tower", "Überarbeite...")
     try:
-        result = await process_transcript(
-            transcript, mode="revise", settings=settings, context=context
-        )
+        result = None
+        if settings.revise_targeted:
+            result = await revise_sections(original, transcript, settings)
+        if result is None:
+            result = await process_transcript(
+                transcript,
+                mode="revise",
+                settings=settings,
+                context=context,
+                history=chain.history(),
+            )
     except ProcessingError as e:
         notify("Babel Tower", f"LLM-Fehler: {e}", "critical")
         if strict:
@@ -142,9 +221,12 @@ async def run_revise_pipeline(
         print(f"LLM-Fehler: {e}", file=sys.stderr)
         return ""
 
-    save_result(result)
-    copy_to_clipboard(result)
-    notify("Babel Tower", result[:100])
+    chain.append(format_user_message(transcript, context), result)
+    with span("output"):
+        save_result(result)
+        save_chain(chain)
+        copy_to_clipboard(result)
+        notify("Babel Tower", result[:100])
 
     return result
 
@@ -157,8 +239,14 @@ async def process_file(
     strict: bool = False,
 ) -> str:
     """Process an existing audio file through the pipeline."""
-    settings = settings or Settings()
+    settings = settings or get_settings()
+    with trace("process_file", settings, mode=mode or "auto"):
+        return await _process_file(audio_path, mode, settings, clipboard, strict)
+
 
+async def _process_file(
+    audio_path: str, mode: str | None, settings: Settings, clipboard: bool, strict: bool
+) -> str:
     with open(audio_path, "rb") as f:
         audio_bytes = f.read()
 
@@ -186,19 +274,4 @@ async def process_file(
         print(f"LLM-Fehler: {e}", file=sys.stderr)
         result = transcript
 
-    if settings.review_enabled:
-        from babel_tower.review import review_text
-
-        reviewed = review_text(result)
-        if reviewed is None:
-            notify("Babel Tower", "Verworfen", "low")
-            return ""
-        result = reviewed
-
-    save_result(result)
-
-    if clipboard:
-        copy_to_clipboard(result)
-        notify("Babel Tower", result[:100])
-
-    return result
+    return _finish(result, settings, clipboard)
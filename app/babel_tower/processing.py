@@ -1,21 +1,55 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from pathlib import Path
 
 import httpx
 
-from babel_tower.config import Settings
+from babel_tower.config import Settings, get_settings
+from babel_tower.llm_cache import cache_key, get_cache
+from babel_tower.metrics import local_fastpath_total, observe_stage, retries_total
+from babel_tower.normalizer import fastpath_confidence, normalize
+from babel_tower.tracing import record_span, span
+from babel_tower.upstream import Endpoint, get_breaker, hedged, parse_endpoints
+from babel_tower.usage import parse_usage, record_usage
 
 
 class ProcessingError(Exception):
     pass
 
 
+Message = dict[str, str]
+
+
+def format_user_message(transcript: str, context: str | None = None) -> str:
+    content = transcript if context is None else f"{context}\n\n{transcript}"
+    return f"<<<TRANSKRIPT>>>\n{content}\n<<<ENDE>>>"
+
+
 async def process_transcript(
     transcript: str,
     mode: str | None = None,
     settings: Settings | None = None,
     context: str | None = None,
+    history: list[Message] | None = None,
 ) -> str:
-    settings = settings or Settings()
+    """Process a transcript with the mode's prompt.
+
+    history holds earlier chat turns (user/assistant messages) sent between the
+    system prompt and this transcript, e.g. prior passes of a revision session.
+    """
+    settings = settings or get_settings()
+    history = history or []
+
+    fastpath_mode = mode in (None, "durchreichen")
+    if settings.local_fastpath and context is None and not history and fastpath_mode:
+        confidence = fastpath_confidence(transcript, settings)
+        if confidence >= settings.local_fastpath_min_confidence:
+            with span("local_fastpath", confidence=round(confidence, 2)):
+                local_fastpath_total.inc()
+                return normalize(transcript)
 
     if mode is None:
         word_count = len(transcript.split())
@@ -25,10 +59,27 @@ async def process_transcript(
             else settings.default_mode
         )
 
-    system_prompt = _load_prompt(mode, settings)
-    content = transcript if context is None else f"{context}\n\n{transcript}"
-    user_message = f"<<<TRANSKRIPT>>>\n{content}\n<<<ENDE>>>"
-    return await _call_llm(user_message, system_prompt, settings)
+    with span("prompt_load", mode=mode):
+        system_prompt = _load_prompt(mode, settings)
+    messages = [
+        {"role": "system", "content": system_prompt},
+        *history,
+        {"role": "user", "content": format_user_message(transcript, context)},
+    ]
+
+    cache = get_cache(settings)
+    if cache is None:
+        return await _call_llm(messages, settings, mode)
+    models = _parse_mode_models(settings.llm_mode_models).get(mode, [settings.llm_model])
+    conversation = "\0".join(f"{m['role']}:{m['content']}" for m in messages[1:])
+    key = cache_key(mode, system_prompt, models, conversation)
+    with span("llm_cache"):
+        cached = cache.get(key)
+    if cached is not None:
+        return cached
+    result = await _call_llm(messages, settings, mode)
+    cache.put(key, result)
+    return result
 
 
 def resolve_prompts_dir(settings: Settings) -> Path:
@@ -42,7 +93,7 @@ def resolve_prompts_dir(settings: Settings) -> Path:
 
 
 def get_available_modes(settings: Settings | None = None) -> set[str]:
-    settings = settings or Settings()
+    settings = settings or get_settings()
     return {
         p.stem
         for p in resolve_prompts_dir(settings).glob("*.md")
@@ -50,28 +101,85 @@ def get_available_modes(settings: Settings | None = None) -> set[str]:
     }
 
 
+_prompts: dict[Path, tuple[tuple[int, ...], str]] = {}
+
+
 def _load_prompt(mode: str, settings: Settings) -> str:
+    """Shared `_formatting.md` first, then the mode prompt, assembled byte-for-byte stable.
+
+    Line endings and trailing whitespace are normalized so an editor touching
+    a file does not change the bytes sent upstream, and the assembled prompt is
+    reused until a file's mtime changes. Keeping the shared rules first lets the
+    upstream's prefix cache reuse them across modes.
+    """
     prompts_dir = resolve_prompts_dir(settings)
     prompt_file = prompts_dir / f"{mode}.md"
-    if not prompt_file.exists():
+    formatting_file = prompts_dir / "_formatting.md"
+    files = [f for f in (formatting_file, prompt_file) if f.exists()]
+    if prompt_file not in files:
         raise ProcessingError(f"Unknown mode: {mode}")
 
-    parts: list[str] = []
-    formatting_file = prompts_dir / "_formatting.md"
-    if formatting_file.exists():
-        parts.append(formatting_file.read_text())
-    parts.append(prompt_file.read_text())
-    return "\n\n".join(parts)
+    stamp = tuple(f.stat().st_mtime_ns for f in files)
+    cached = _prompts.get(prompt_file)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    parts = [_normalize_prompt(f.read_text()) for f in files]
+    prompt = "\n\n".join(parts)
+    _prompts[prompt_file] = (stamp, prompt)
+    return prompt
+
+
+def _normalize_prompt(text: str) -> str:
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+class _UpstreamUnavailableError(ProcessingError):
+    """Connect error or 5xx — worth retrying on the next target."""
+
 
+@dataclass(frozen=True)
+class _Target:
+    url: str
+    model: str
 
-async def _call_llm(transcript: str, system_prompt: str, settings: Settings) -> str:
-    url = f"{settings.llm_url}/v1/chat/completions"
+
+def _parse_mode_models(raw: str) -> dict[str, list[str]]:
+    """Parse `mode:model|fallback,…` into ordered model lists per mode."""
+    mapping: dict[str, list[str]] = {}
+    for entry in raw.split(","):
+        mode, _, models = entry.partition(":")
+        ordered = [m.strip() for m in models.split("|") if m.strip()]
+        if mode.strip() and ordered:
+            mapping[mode.strip()] = ordered
+    return mapping
+
+
+def _llm_targets(mode: str | None, settings: Settings) -> list[_Target]:
+    """Every (endpoint, model) pair in preference order: first model on all endpoints first."""
+    urls = [url for url, _ in parse_endpoints(settings.llm_urls, settings.llm_url)]
+    models = _parse_mode_models(settings.llm_mode_models).get(mode or "", [settings.llm_model])
+    return [_Target(url, model) for model in models for url in urls]
+
+
+_latencies: dict[tuple[_Target, str], Endpoint] = {}
+
+
+def _latency_window(target: _Target, mode: str | None) -> Endpoint:
+    key = (target, mode or "")
+    window = _latencies.get(key)
+    if window is None:
+        window = _latencies[key] = Endpoint(url=target.url)
+    return window
+
+
+async def _post_llm(
+    target: _Target, messages: list[Message], settings: Settings, mode: str | None
+) -> str:
+    url = f"{target.url}/v1/chat/completions"
     payload: dict[str, object] = {
-        "model": settings.llm_model,
-        "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": transcript},
-        ],
+        "model": target.model,
+        "messages": messages,
         "reasoning_effort": "none",
     }
 
@@ -79,18 +187,38 @@ async def _call_llm(transcript: str, system_prompt: str, settings: Settings) ->
     if settings.llm_api_key:
         headers["Authorization"] = f"Bearer {settings.llm_api_key}"
 
-    async with httpx.AsyncClient(timeout=settings.llm_timeout) as client:
+    breaker = get_breaker(target.url, settings.llm_breaker_failures, settings.llm_breaker_reset)
+    sent_ns = time.time_ns()
+
+    async def _mark_first_byte(_response: httpx.Response) -> None:
+        # Response hooks run once headers arrive, before the body is read
+        record_span("llm_ttfb", sent_ns, time.time_ns())
+
+    async with httpx.AsyncClient(
+        timeout=settings.llm_timeout, event_hooks={"response": [_mark_first_byte]}
+    ) as client:
         try:
             response = await client.post(url, json=payload, headers=headers)
         except httpx.ConnectError as e:
-            raise ProcessingError(f"LLM unreachable at {settings.llm_url}") from e
+            breaker.record_failure()
+            raise _UpstreamUnavailableError(f"LLM unreachable at {target.url}") from e
         except httpx.TimeoutException as e:
+            breaker.record_failure()
             raise ProcessingError("LLM request timed out") from e
 
+    if response.status_code >= 500:
+        breaker.record_failure()
+        raise _UpstreamUnavailableError(f"LLM returned {response.status_code}: {response.text}")
     if response.status_code != 200:
         raise ProcessingError(f"LLM returned {response.status_code}: {response.text}")
+    breaker.record_success()
+    end_ns = time.time_ns()
+    _latency_window(target, mode).samples.append((end_ns - sent_ns) / 1e9)
 
     result: dict[str, object] = response.json()
+    usage = parse_usage(result)
+    if usage is not None:
+        record_usage(usage, mode, target.model, sent_ns, end_ns)
     choices = result["choices"]
     assert isinstance(choices, list)
     first_choice: dict[str, object] = choices[0]  # pyright: ignore[reportUnknownVariableType]
@@ -99,3 +227,42 @@ async def _call_llm(transcript: str, system_prompt: str, settings: Settings) ->
     content = message["content"]  # pyright: ignore[reportUnknownVariableType]
     assert isinstance(content, str)
     return content.strip()
+
+
+async def _call_llm(messages: list[Message], settings: Settings, mode: str | None = None) -> str:
+    """Post to the first target whose circuit is closed; retry the next one on connect/5xx.
+
+    Retries back off with full jitter. For modes in llm_hedge_modes the first
+    attempt is hedged to the next target once it runs past its p95 latency.
+    """
+    targets = _llm_targets(mode, settings)
+    breakers = [
+        get_breaker(t.url, settings.llm_breaker_failures, settings.llm_breaker_reset)
+        for t in targets
+    ]
+    candidates = [t for t, b in zip(targets, breakers, strict=True) if b.allow()] or targets
+
+    def attempt(target: _Target) -> Callable[[], Awaitable[str]]:
+        return lambda: _post_llm(target, messages, settings, mode)
+
+    delay: float | None = None
+    backup = candidates[1] if len(candidates) > 1 else candidates[0]
+    hedge_modes = {m.strip() for m in settings.llm_hedge_modes.split(",") if m.strip()}
+    p95 = _latency_window(candidates[0], mode).p95()
+    if mode in hedge_modes and p95 is not None:
+        delay = max(settings.llm_hedge_min_delay, p95)
+
+    with span("llm", model=candidates[0].model), observe_stage("llm"):
+        try:
+            return await hedged("llm", attempt(candidates[0]), attempt(backup), delay)
+        except _UpstreamUnavailableError as e:
+            error = e
+        for retry in range(1, settings.llm_retries + 1):
+            retries_total.inc(stage="llm")
+            await asyncio.sleep(random.uniform(0, settings.llm_retry_backoff * 2 ** (retry - 1)))
+            try:
+                return await attempt(candidates[retry % len(candidates)])()
+            except _UpstreamUnavailableError as e:
+                error = e
+        # Surface the public error type (metrics label upstream errors by class)
+        raise ProcessingError(str(error)) from error
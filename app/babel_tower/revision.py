@@ -0,0 +1,80 @@
+"""Revision sessions: successive `babel revise` passes as one multi-turn chat.
+
+The first pass sends the original text together with the spoken instructions.
+Every follow-up sends only the new instructions and replays the earlier
+passes verbatim as user/assistant turns, so the request prefix is
+byte-identical to the previous request and an upstream prefix cache skips
+reprocessing it. The chain lives in the state directory and continues as long
+as the last result is still the chain's latest revision; after
+`revise_max_turns` passes it is rebased onto that revision, which bounds the
+prompt and keeps the latency per revision flat.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+
+from loguru import logger
+
+from babel_tower.config import Settings
+from babel_tower.processing import Message
+from babel_tower.state import load_revisions, save_revisions
+
+
+@dataclass
+class RevisionChain:
+    original: str
+    # (user message as sent, assistant result) per completed pass
+    turns: list[tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def latest(self) -> str:
+        return self.turns[-1][1] if self.turns else self.original
+
+    def history(self) -> list[Message]:
+        messages: list[Message] = []
+        for user, assistant in self.turns:
+            messages.append({"role": "user", "content": user})
+            messages.append({"role": "assistant", "content": assistant})
+        return messages
+
+    def context(self) -> str:
+        """Text placed before the instructions in the next user message."""
+        if self.turns:
+            return "## Änderungsanweisungen"
+        return f"## Originaltext\n\n{self.original.strip()}\n\n## Änderungsanweisungen"
+
+    def append(self, user_message: str, result: str) -> None:
+        self.turns.append((user_message, result))
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"original": self.original, "turns": [list(t) for t in self.turns]},
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> RevisionChain:
+        raw = json.loads(data)
+        return cls(raw["original"], [(user, result) for user, result in raw["turns"]])
+
+
+def resume_chain(current: str, settings: Settings) -> RevisionChain:
+    """The stored chain if `current` is its latest revision and it has room; else a new chain."""
+    data = load_revisions()
+    if data and settings.revise_max_turns > 0:
+        try:
+            chain = RevisionChain.from_json(data)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable revision chain: {}", e)
+        else:
+            if chain.latest.strip() == current.strip():
+                if len(chain.turns) < settings.revise_max_turns:
+                    return chain
+                logger.debug("Revision chain reached {} turns, rebasing", len(chain.turns))
+    return RevisionChain(current)
+
+
+def save_chain(chain: RevisionChain) -> None:
+    save_revisions(chain.to_json())
@@ -0,0 +1,102 @@
+"""Paragraph-scoped revision: rewrite only the sections an instruction touches.
+
+Regenerating a multi-page text for an instruction that concerns one paragraph
+spends most of the time on output tokens that reproduce unchanged text. With
+`revise_targeted`, a `revise-locate` pass (a few output tokens, route it to a
+fast model via `llm_mode_models`) names the affected sections, those are
+revised concurrently with the regular `revise` prompt, and the document is
+spliced back together. Returns None whenever the full regeneration is the
+better choice: short documents, instructions affecting the whole text, or an
+unusable locator answer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+
+from loguru import logger
+
+from babel_tower.config import Settings
+from babel_tower.processing import process_transcript
+from babel_tower.tracing import span
+
+# Beyond this share of affected sections, splicing saves too little to be worth the extra pass
+_MAX_AFFECTED_SHARE = 0.5
+
+_FENCE = re.compile(r"^\s*(```|~~~)")
+
+
+def split_sections(text: str) -> list[str]:
+    """Blank-line separated blocks; headings stay with the block below, code fences stay whole."""
+    blocks: list[list[str]] = [[]]
+    in_fence = False
+    for line in text.strip().splitlines():
+        if _FENCE.match(line):
+            in_fence = not in_fence
+        if not line.strip() and not in_fence:
+            if blocks[-1]:
+                blocks.append([])
+            continue
+        blocks[-1].append(line)
+
+    sections: list[str] = []
+    heading: list[str] = []
+    for block in (b for b in blocks if b):
+        if all(line.lstrip().startswith("#") for line in block):
+            heading.extend([*block, ""])
+            continue
+        sections.append("\n".join([*heading, *block]))
+        heading = []
+    if heading:
+        sections.append("\n".join(heading).strip())
+    return sections
+
+
+def splice(sections: list[str]) -> str:
+    return "\n\n".join(s.strip() for s in sections if s.strip())
+
+
+def parse_locator(answer: str, count: int) -> list[int] | None:
+    """Zero-based indices from the locator's 1-based section numbers; None means whole text."""
+    if "ALLE" in answer.upper():
+        return None
+    indices = sorted({int(n) - 1 for n in re.findall(r"\d+", answer) if 0 < int(n) <= count})
+    return indices or None
+
+
+async def revise_sections(original: str, instructions: str, settings: Settings) -> str | None:
+    sections = split_sections(original)
+    if len(sections) < settings.revise_targeted_min_sections:
+        return None
+
+    numbered = "\n\n".join(f"[{i}]\n{s}" for i, s in enumerate(sections, start=1))
+    with span("revise_locate", sections=len(sections)):
+        answer = await process_transcript(
+            instructions,
+            mode="revise-locate",
+            settings=settings,
+            context=f"## Abschnitte\n\n{numbered}\n\n## Änderungsanweisungen",
+        )
+    affected = parse_locator(answer, len(sections))
+    if affected is None or len(affected) > len(sections) * _MAX_AFFECTED_SHARE:
+        logger.debug("Targeted revise not applicable (locator: {!r})", answer)
+        return None
+
+    with span("revise_sections", sections=len(sections), affected=len(affected)):
+        revised = await asyncio.gather(
+            *(
+                process_transcript(
+                    instructions,
+                    mode="revise",
+                    settings=settings,
+                    context=(
+                        f"## Originaltext (Ausschnitt)\n\n{sections[i]}\n\n## Änderungsanweisungen"
+                    ),
+                )
+                for i in affected
+            )
+        )
+    for i, text in zip(affected, revised, strict=True):
+        sections[i] = text
+    return splice(sections)
@@ -6,12 +6,14 @@ from pathlib import Path
 from loguru import logger
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.routing import Route
 
-from babel_tower.config import Settings
+from babel_tower.config import get_settings
+from babel_tower.metrics import CONTENT_TYPE, render, track_request
 from babel_tower.processing import ProcessingError, process_transcript
 from babel_tower.stt import STTError, transcribe
+from babel_tower.tracing import trace
 
 
 async def process_endpoint(request: Request) -> JSONResponse:
@@ -46,23 +48,24 @@ async def process_endpoint(request: Request) -> JSONResponse:
         tmp_path = tmp.name
 
     try:
-        settings = Settings()
+        settings = get_settings()
 
-        with open(tmp_path, "rb") as f:
-            raw_audio = f.read()
+        with track_request("serve"), trace("serve.process", settings, mode=str(mode or "auto")):
+            with open(tmp_path, "rb") as f:
+                raw_audio = f.read()
 
-        transcript = await transcribe(raw_audio, settings)
+            transcript = await transcribe(raw_audio, settings)
 
-        if not transcript:
-            return JSONResponse({"text": "", "transcript": ""})
+            if not transcript:
+                return JSONResponse({"text": "", "transcript": ""})
 
-        try:
-            cleaned = await process_transcript(transcript, mode, settings)
-        except ProcessingError as e:
-            logger.warning("LLM postprocessing failed, returning raw transcript: {}", e)
-            cleaned = transcript
+            try:
+                cleaned = await process_transcript(transcript, mode, settings)
+            except ProcessingError as e:
+                logger.warning("LLM postprocessing failed, returning raw transcript: {}", e)
+                cleaned = transcript
 
-        return JSONResponse({"text": cleaned, "transcript": transcript})
+            return JSONResponse({"text": cleaned, "transcript": transcript})
 
     except STTError as e:
         logger.error("STT error in serve endpoint: {}", e)
@@ -74,10 +77,16 @@ async def process_endpoint(request: Request) -> JSONResponse:
         Path(tmp_path).unlink(missing_ok=True)
 
 
+async def metrics_endpoint(_request: Request) -> Response:
+    """GET /metrics — Prometheus text exposition."""
+    return Response(render(), media_type=CONTENT_TYPE)
+
+
 def create_app() -> Starlette:
     """Create the Starlette ASGI application."""
     return Starlette(
         routes=[
             Route("/process", process_endpoint, methods=["POST"]),
+            Route("/metrics", metrics_endpoint, methods=["GET"]),
         ],
     )
@@ -0,0 +1,71 @@
+"""Per-session settings overlays for the MCP server.
+
+Every client session reads the process-wide settings until it changes one of
+them (`set_mode`, `set_option`). Only then does it get its own copy: the
+overrides are kept per session and applied with `model_copy`, which is cached
+and rebuilt only when the overrides change or the base settings are reloaded.
+Sessions whose overrides have not been used for `mcp_session_idle_seconds`
+are evicted and fall back to the shared settings.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+
+from babel_tower.config import Settings
+
+
+@dataclass
+class _Session:
+    overrides: dict[str, Any] = field(default_factory=dict)
+    # The copy handed out, and the base instance it was derived from
+    settings: Settings | None = None
+    base: Settings | None = None
+    last_used: float = 0.0
+
+
+class SessionSettings:
+    def __init__(self, base: Callable[[], Settings]) -> None:
+        self._base = base
+        # Least recently used first, so eviction stops at the first active session
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, session_id: str) -> Settings:
+        """The session's settings: the shared instance unless the session overrode something."""
+        base = self._base()
+        now = time.monotonic()
+        self._evict(now, base.mcp_session_idle_seconds)
+        session = self._sessions.get(session_id)
+        if session is None:
+            return base
+        self._sessions.move_to_end(session_id)
+        session.last_used = now
+        if session.settings is None or session.base is not base:
+            session.settings = base.model_copy(update=session.overrides)
+            session.base = base
+        return session.settings
+
+    def update(self, session_id: str, **changes: Any) -> Settings:
+        """Override settings for one session; other sessions and the shared base are untouched."""
+        session = self._sessions.setdefault(session_id, _Session())
+        session.overrides.update(changes)
+        session.settings = None
+        session.last_used = time.monotonic()
+        return self.get(session_id)
+
+    def _evict(self, now: float, idle_seconds: float) -> None:
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if now - session.last_used < idle_seconds:
+                return
+            del self._sessions[session_id]
+            logger.debug("Evicted settings of idle MCP session {}", session_id)
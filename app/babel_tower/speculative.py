@@ -0,0 +1,113 @@
+"""Speculative LLM processing while the user is still dictating (BABEL_SPECULATIVE_MODES).
+
+Every VAD segment is transcribed as soon as it ends. Once the in-order
+transcript since the last cut holds `speculative_paragraph_words` words and
+ends a sentence, that paragraph is sent to the LLM while recording goes on.
+After the stop only the tail is left to process, so stop-to-result latency is
+one segment's STT plus one paragraph's LLM call, whatever the dictation
+length. For `structure`, an optional reconciliation pass runs the joined
+paragraphs through the prompt once more so headings and lists stay coherent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from io import BytesIO
+
+from babel_tower.config import Settings
+from babel_tower.processing import process_transcript
+from babel_tower.stt import transcribe
+
+_SENTENCE_END = (".", "!", "?", ":")
+
+
+def speculative_mode(mode: str | None, settings: Settings) -> str | None:
+    """The mode paragraphs are processed with, or None when speculation is off for this run."""
+    enabled = {m.strip() for m in settings.speculative_modes.split(",") if m.strip()}
+    effective = mode or settings.default_mode
+    if effective not in enabled or settings.inter_segment_timeout <= 0:
+        return None
+    return effective
+
+
+class SpeculativeProcessor:
+    def __init__(self, mode: str | None, settings: Settings) -> None:
+        """mode is the requested mode (None = auto); paragraphs use the speculative mode."""
+        self._requested_mode = mode
+        self._mode = speculative_mode(mode, settings) or settings.default_mode
+        self._settings = settings
+        self._loop = asyncio.get_running_loop()
+        self._segments: list[asyncio.Task[str]] = []
+        self._consumed = 0
+        self._pending: list[str] = []
+        self._paragraph_texts: list[str] = []
+        self._paragraphs: list[asyncio.Task[str]] = []
+
+    def on_segment(self, wav: BytesIO) -> None:
+        """Capture-thread callback: start transcribing a finished segment."""
+        self._loop.call_soon_threadsafe(self._start_segment, wav)
+
+    def _start_segment(self, wav: BytesIO) -> None:
+        task = self._loop.create_task(transcribe(wav, self._settings))
+        task.add_done_callback(lambda _task: self._advance())
+        self._segments.append(task)
+
+    def _advance(self) -> None:
+        """Consume finished segment transcripts in order and cut paragraphs."""
+        while self._consumed < len(self._segments) and self._segments[self._consumed].done():
+            task = self._segments[self._consumed]
+            self._consumed += 1
+            if task.cancelled() or task.exception() is not None:
+                continue  # raised from transcript()
+            text = task.result().strip()
+            if text:
+                self._pending.append(text)
+            if self._paragraph_ready():
+                paragraph = " ".join(self._pending)
+                self._pending = []
+                self._paragraph_texts.append(paragraph)
+                self._paragraphs.append(
+                    self._loop.create_task(
+                        process_transcript(paragraph, self._mode, self._settings)
+                    )
+                )
+
+    def _paragraph_ready(self) -> bool:
+        if not self._pending:
+            return False
+        words = sum(len(text.split()) for text in self._pending)
+        threshold = self._settings.speculative_paragraph_words
+        if words >= threshold and self._pending[-1].endswith(_SENTENCE_END):
+            return True
+        # Unpunctuated STT output: cut at segment boundaries after twice the budget
+        return words >= 2 * threshold
+
+    async def transcript(self) -> str:
+        """Wait for every segment's transcription; the full transcript in order.
+
+        Raises STTError if a segment failed; the caller can fall back to the
+        recording as a whole.
+        """
+        texts = await asyncio.gather(*self._segments)
+        return " ".join(text.strip() for text in texts if text.strip())
+
+    async def process(self, transcript: str) -> str:
+        """Process the tail after the speculative paragraphs and join the results in order."""
+        if not self._paragraphs:
+            return await process_transcript(transcript, self._requested_mode, self._settings)
+        prefix = " ".join(self._paragraph_texts)
+        tail = transcript[len(prefix) :].strip() if transcript.startswith(prefix) else ""
+        pending = list(self._paragraphs)
+        if tail:
+            pending.append(
+                self._loop.create_task(process_transcript(tail, self._mode, self._settings))
+            )
+        parts = await asyncio.gather(*pending)
+        result = "\n\n".join(part.strip() for part in parts)
+        if self._mode == "structure" and self._settings.speculative_reconcile:
+            result = await process_transcript(result, "structure", self._settings)
+        return result
+
+    def cancel(self) -> None:
+        for task in [*self._segments, *self._paragraphs]:
+            task.cancel()
@@ -0,0 +1,93 @@
+"""Cold-start profiling for `babel listen` (`babel debug --startup`, benchmarks/startup.py).
+
+Runs the listen start-up path in a fresh interpreter — CLI import, pipeline
+import, VAD model load — up to the point where the input stream is opened,
+optionally under `-X importtime` to attribute the time to packages.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+
+# Executed in a fresh interpreter; prints its phase timings as one JSON line
+_LISTEN_COLD_START = """
+import json, time
+t0 = time.perf_counter()
+import babel_tower.cli
+t1 = time.perf_counter()
+from babel_tower.audio import _load_vad_model, _new_vad_iterator
+from babel_tower.config import Settings
+from babel_tower.pipeline import run_pipeline
+t2 = time.perf_counter()
+settings = Settings()
+_new_vad_iterator(_load_vad_model(settings), settings)
+t3 = time.perf_counter()
+print(json.dumps({"cli import": t1 - t0, "pipeline import": t2 - t1, "VAD model load": t3 - t2}))
+"""
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupReport:
+    total_s: float
+    phases: dict[str, float]
+    imports: list[ImportTiming] = field(default_factory=list)
+
+    def packages(self, limit: int = 15) -> list[tuple[str, float]]:
+        """Cumulative import seconds per top-level package, slowest first."""
+        costs: dict[str, int] = {}
+        for timing in self.imports:
+            package = timing.module.split(".")[0]
+            # The outermost import of a package carries the largest cumulative time
+            costs[package] = max(costs.get(package, 0), timing.cumulative_us)
+        ranked = sorted(costs.items(), key=lambda kv: kv[1], reverse=True)
+        return [(name, us / 1e6) for name, us in ranked[:limit]]
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Parse `-X importtime` lines: `import time: self | cumulative | <indent>module`."""
+    timings: list[ImportTiming] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(
+            ImportTiming(
+                module=stripped,
+                self_us=int(parts[0]),
+                cumulative_us=int(parts[1]),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return timings
+
+
+def measure_listen_cold_start(importtime: bool = False) -> StartupReport:
+    """Cold start of `babel listen` up to opening the input stream, in a fresh interpreter."""
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", _LISTEN_COLD_START]
+    t0 = time.perf_counter()
+    proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    total = time.perf_counter() - t0
+    if proc.returncode != 0:
+        raise RuntimeError(f"Cold-start probe failed: {proc.stderr.strip().splitlines()[-1:]}")
+    phases: dict[str, float] = json.loads(proc.stdout.strip().splitlines()[-1])
+    imports = parse_importtime(proc.stderr) if importtime else []
+    return StartupReport(total_s=total, phases=phases, imports=imports)
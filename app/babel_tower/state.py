@@ -36,6 +36,32 @@ def save_result(text: str) -> None:
     _atomic_write(_state_dir() / "result.txt", text.encode())
 
 
+def traces_path() -> Path:
+    return _state_dir() / "traces.jsonl"
+
+
+def append_trace(line: str) -> None:
+    path = traces_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as f:
+        f.write(line + "\n")
+
+
+def llm_cache_path() -> Path:
+    return _state_dir() / "llm_cache.sqlite3"
+
+
+def save_revisions(data: str) -> None:
+    _atomic_write(_state_dir() / "revisions.json", data.encode())
+
+
+def load_revisions() -> str | None:
+    try:
+        return (_state_dir() / "revisions.json").read_text()
+    except FileNotFoundError:
+        return None
+
+
 def load_result() -> str | None:
     path = _state_dir() / "result.txt"
     try:
@@ -1,9 +1,14 @@
 import re
+import time
+from collections.abc import Awaitable, Callable
 from io import BytesIO
 
 import httpx
 
-from babel_tower.config import Settings
+from babel_tower.config import Settings, get_settings
+from babel_tower.metrics import audio_seconds_total, observe_stage
+from babel_tower.tracing import span
+from babel_tower.upstream import Endpoint, EndpointPool, get_pool, hedged, parse_endpoints
 
 
 class STTError(Exception):
@@ -30,9 +35,93 @@ def apply_corrections(text: str, settings: Settings) -> str:
     return text
 
 
+def _audio_seconds(audio: bytes) -> float | None:
+    """Duration of an encoded audio payload, if libsndfile can read its header."""
+    import soundfile as sf  # pyright: ignore[reportUnknownVariableType]
+
+    try:
+        info = sf.info(BytesIO(audio))  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    except (RuntimeError, TypeError):
+        return None
+    return float(info.duration)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+
+
+async def _post(
+    endpoint: Endpoint,
+    pool: EndpointPool,
+    files: dict[str, tuple[str, bytes, str]],
+    data: dict[str, str],
+    duration: float | None,
+    settings: Settings,
+) -> str:
+    url = f"{endpoint.url}/v1/audio/transcriptions"
+    start = time.perf_counter()
+    with pool.track(endpoint):
+        async with httpx.AsyncClient(timeout=settings.stt_timeout) as client:
+            try:
+                response = await client.post(url, files=files, data=data)
+            except httpx.ConnectError as e:
+                pool.eject(endpoint)
+                raise STTError(f"STT service unreachable at {endpoint.url}") from e
+            except httpx.TimeoutException as e:
+                raise STTError("STT request timed out") from e
+
+    if response.status_code != 200:
+        if response.status_code >= 500:
+            pool.eject(endpoint)
+        raise STTError(f"STT returned {response.status_code}: {response.text}")
+    if duration:
+        endpoint.samples.append((time.perf_counter() - start) / duration)
+    return response.json().get("text", "").strip()
+
+
+async def _route(
+    files: dict[str, tuple[str, bytes, str]],
+    data: dict[str, str],
+    duration: float | None,
+    settings: Settings,
+) -> str:
+    """Send to the least-loaded healthy STT endpoint, failing over once on connect errors.
+
+    With stt_hedge, a duplicate goes to a second endpoint once the primary has
+    run longer than its p95 (scaled to this clip's duration).
+    """
+    pool = get_pool(
+        parse_endpoints(settings.stt_urls, settings.stt_url),
+        settings.stt_eject_seconds,
+        settings.stt_health_interval,
+    )
+    pool.maybe_probe()
+    primary = pool.pick()
+    assert primary is not None
+    backup = pool.pick(exclude=(primary,))
+
+    attempted: set[str] = set()
+
+    def send(endpoint: Endpoint) -> Callable[[], Awaitable[str]]:
+        def call() -> Awaitable[str]:
+            attempted.add(endpoint.url)
+            return _post(endpoint, pool, files, data, duration, settings)
+
+        return call
+
+    delay: float | None = None
+    p95 = primary.p95()
+    if settings.stt_hedge and backup is not None and duration and p95 is not None:
+        delay = max(settings.stt_hedge_min_delay, p95 * duration)
+
+    try:
+        return await hedged("stt", send(primary), send(backup) if backup else None, delay)
+    except STTError as e:
+        if backup is None or backup.url in attempted:
+            raise
+        if not isinstance(e.__cause__, httpx.ConnectError):
+            raise
+        return await send(backup)()
+
+
 async def transcribe(audio: bytes | BytesIO, settings: Settings | None = None) -> str:
-    settings = settings or Settings()
-    url = f"{settings.stt_url}/v1/audio/transcriptions"
+    settings = settings or get_settings()
 
     if isinstance(audio, BytesIO):
         audio = audio.getvalue()
@@ -44,17 +133,11 @@ async def transcribe(audio: bytes | BytesIO, settings: Settings | None = None) -
     if settings.stt_prompt:
         data["prompt"] = settings.stt_prompt
 
-    async with httpx.AsyncClient(timeout=settings.stt_timeout) as client:
-        try:
-            response = await client.post(url, files=files, data=data)
-        except httpx.ConnectError as e:
-            raise STTError(f"STT service unreachable at {settings.stt_url}") from e
-        except httpx.TimeoutException as e:
-            raise STTError("STT request timed out") from e
-
-    if response.status_code != 200:
-        raise STTError(f"STT returned {response.status_code}: {response.text}")
+    duration = _audio_seconds(audio)
+    if duration is not None:
+        audio_seconds_total.inc(duration)
 
-    result = response.json()
-    text = result.get("text", "").strip()
-    return apply_corrections(text, settings)
+    with span("stt", upload_bytes=len(audio)), observe_stage("stt"):
+        text = await _route(files, data, duration, settings)
+    with span("corrections"):
+        return apply_corrections(text, settings)
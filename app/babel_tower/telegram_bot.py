@@ -7,9 +7,12 @@ from loguru import logger
 from telegram import Update
 from telegram.ext import Application, ContextTypes, MessageHandler, filters
 
-from babel_tower.config import Settings
+from babel_tower.config import Settings, get_settings
+from babel_tower.metrics import start_metrics_server, track_request
 from babel_tower.processing import ProcessingError, process_transcript
 from babel_tower.stt import STTError, transcribe
+from babel_tower.tracing import trace
+from babel_tower.warmup import start_warm_up
 
 _TELEGRAM_MESSAGE_LIMIT = 4000
 
@@ -31,20 +34,21 @@ async def handle_voice(
     settings: Settings,
 ) -> str:
     """Run audio through the babel_tower pipeline. Returns reply text (cleaned or error message)."""
-    try:
-        transcript = await transcribe(audio_bytes, settings)
-    except STTError as e:
-        logger.error("STT failed: {}", e)
-        return f"❌ STT: {e}"
+    with track_request("telegram"), trace("telegram.voice", settings):
+        try:
+            transcript = await transcribe(audio_bytes, settings)
+        except STTError as e:
+            logger.error("STT failed: {}", e)
+            return f"❌ STT: {e}"
 
-    if not transcript:
-        return "⚠️ Keine Sprache erkannt."
+        if not transcript:
+            return "⚠️ Keine Sprache erkannt."
 
-    try:
-        return await process_transcript(transcript, mode=None, settings=settings)
-    except ProcessingError as e:
-        logger.warning("LLM postprocessing failed, returning raw transcript: {}", e)
-        return transcript
+        try:
+            return await process_transcript(transcript, mode=None, settings=settings)
+        except ProcessingError as e:
+            logger.warning("LLM postprocessing failed, returning raw transcript: {}", e)
+            return transcript
 
 
 def build_application(settings: Settings) -> Application:
@@ -102,9 +106,12 @@ def build_application(settings: Settings) -> Application:
 
 
 def run() -> None:
-    settings = Settings()
+    settings = get_settings()
     app = build_application(settings)
     allowed = parse_allowed_users(settings.telegram_allowed_users)
+    if settings.metrics_port:
+        start_metrics_server(settings.metrics_port)
+    start_warm_up(settings)
     logger.info(
         "Starting Babel Tower Telegram Bot (allowed users: {})",
         sorted(allowed) if allowed else "ALL (no ACL)",
@@ -0,0 +1,195 @@
+"""Per-stage latency tracing: one trace per utterance, one span per pipeline stage.
+
+`trace()` opens a root span (or a child span if a trace is already active) and
+exports the finished trace as a JSON line in the state dir or as OTLP/HTTP
+JSON to a local collector. `span()` is a no-op outside a trace, so library
+code can be instrumented unconditionally.
+"""
+
+from __future__ import annotations
+
+import json
+import secrets
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import httpx
+from loguru import logger
+
+from babel_tower.config import Settings
+from babel_tower.state import append_trace
+
+
+@dataclass
+class Span:
+    name: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict[str, str | int | float | bool] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+
+@dataclass
+class _Trace:
+    trace_id: str
+    settings: Settings
+    spans: list[Span] = field(default_factory=list)
+
+
+_current_trace: ContextVar[_Trace | None] = ContextVar("babel_trace", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("babel_span", default=None)
+
+
+@contextmanager
+def trace(name: str, settings: Settings, **attributes: str | int | float | bool) -> Iterator[None]:
+    """Record a trace for one run; nests as a child span inside an active trace."""
+    if _current_trace.get() is not None:
+        with span(name, **attributes):
+            yield
+        return
+    if settings.trace_export == "off":
+        yield
+        return
+
+    active = _Trace(trace_id=secrets.token_hex(16), settings=settings)
+    token = _current_trace.set(active)
+    try:
+        with span(name, **attributes):
+            yield
+    finally:
+        _current_trace.reset(token)
+        _export(active)
+
+
+@contextmanager
+def span(name: str, **attributes: str | int | float | bool) -> Iterator[Span | None]:
+    active = _current_trace.get()
+    if active is None:
+        yield None
+        return
+    parent = _current_span.get()
+    current = Span(
+        name=name,
+        span_id=secrets.token_hex(8),
+        parent_id=parent.span_id if parent else None,
+        start_ns=time.time_ns(),
+        attributes=dict(attributes),
+    )
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.attributes["error"] = type(e).__name__
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current_span.reset(token)
+        active.spans.append(current)
+
+
+def record_span(name: str, start_ns: int, end_ns: int, **attributes: str | int | float) -> None:
+    """Record an already measured interval (e.g. time to first byte) under the current span."""
+    active = _current_trace.get()
+    if active is None:
+        return
+    parent = _current_span.get()
+    active.spans.append(
+        Span(
+            name=name,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start_ns=start_ns,
+            end_ns=end_ns,
+            attributes=dict(attributes),
+        )
+    )
+
+
+def _export(active: _Trace) -> None:
+    if not active.spans:
+        return
+    try:
+        if active.settings.trace_export == "jsonl":
+            append_trace(json.dumps(_to_json_record(active), ensure_ascii=False))
+        elif active.settings.trace_export == "otlp":
+            payload = _to_otlp(active)
+            url = active.settings.trace_otlp_url
+            threading.Thread(target=_post_otlp, args=(url, payload), daemon=True).start()
+    except Exception as e:
+        logger.debug("Trace export failed: {}", e)
+
+
+def _to_json_record(active: _Trace) -> dict[str, object]:
+    root = next(s for s in active.spans if s.parent_id is None)
+    return {
+        "trace_id": active.trace_id,
+        "name": root.name,
+        "start": root.start_ns / 1e9,
+        "duration_ms": round(root.duration_ms, 3),
+        "spans": [
+            {
+                "name": s.name,
+                "span_id": s.span_id,
+                "parent_id": s.parent_id,
+                "offset_ms": round((s.start_ns - root.start_ns) / 1e6, 3),
+                "duration_ms": round(s.duration_ms, 3),
+                "attributes": s.attributes,
+            }
+            for s in sorted(active.spans, key=lambda s: s.start_ns)
+        ],
+    }
+
+
+def _otlp_value(value: str | int | float | bool) -> dict[str, object]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": value}
+
+
+def _to_otlp(active: _Trace) -> dict[str, object]:
+    spans: list[dict[str, object]] = []
+    for s in active.spans:
+        otlp_span: dict[str, object] = {
+            "traceId": active.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": 1,
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in s.attributes.items()],
+        }
+        if s.parent_id:
+            otlp_span["parentSpanId"] = s.parent_id
+        spans.append(otlp_span)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": "babel-tower"}}
+                    ]
+                },
+                "scopeSpans": [{"scope": {"name": "babel_tower"}, "spans": spans}],
+            }
+        ]
+    }
+
+
+def _post_otlp(url: str, payload: dict[str, object]) -> None:
+    try:
+        httpx.post(url, json=payload, timeout=5.0)
+    except httpx.HTTPError as e:
+        logger.debug("OTLP export to {} failed: {}", url, e)
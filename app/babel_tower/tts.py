@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from io import BytesIO
 from typing import Any
 
 import httpx
+import numpy as np
 import sounddevice as sd
 import soundfile as sf  # pyright: ignore[reportUnknownVariableType]
+from numpy.typing import NDArray
 
 from babel_tower.config import Settings
 
@@ -46,6 +49,64 @@ def _play_audio_blocking(audio_bytes: bytes) -> None:
     sd.wait()  # pyright: ignore[reportUnknownMemberType]
 
 
+_LEVEL_WINDOW_SECONDS = 0.02
+
+
+class Playback:
+    """Non-blocking TTS playback that exposes its own signal level for echo gating.
+
+    The RMS envelope of the decoded audio is precomputed in 20 ms windows, so
+    `level()` is a clock lookup instead of a computation on the audio thread.
+    """
+
+    def __init__(self, audio_bytes: bytes) -> None:
+        data: Any
+        sr: int
+        data, sr = sf.read(BytesIO(audio_bytes), dtype="float32")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        self._data: NDArray[np.float32] = np.asarray(data, dtype=np.float32)
+        self._sr = sr
+        self._envelope = _rms_envelope(self._data, max(1, int(sr * _LEVEL_WINDOW_SECONDS)))
+        self._started_at: float | None = None
+        self._stopped = False
+
+    def start(self) -> None:
+        self._started_at = time.monotonic()
+        sd.play(self._data, self._sr)  # pyright: ignore[reportUnknownMemberType]
+
+    def wait(self) -> None:
+        sd.wait()  # pyright: ignore[reportUnknownMemberType]
+
+    def stop(self) -> None:
+        if not self._stopped:
+            self._stopped = True
+            sd.stop()  # pyright: ignore[reportUnknownMemberType]
+
+    def level(self) -> float:
+        """RMS of the playback signal at the current play position (0.0 when silent)."""
+        if self._started_at is None or self._stopped:
+            return 0.0
+        window = int((time.monotonic() - self._started_at) / _LEVEL_WINDOW_SECONDS)
+        if window >= len(self._envelope):
+            return 0.0
+        return float(self._envelope[window])
+
+    def is_echo(self, chunk: NDArray[np.float32], ratio: float) -> bool:
+        """True if the mic chunk is quieter than ratio x the current playback level."""
+        playback_level = self.level()
+        if playback_level == 0.0:
+            return False
+        chunk_level = float(np.sqrt(np.mean(np.square(chunk))))
+        return chunk_level < ratio * playback_level
+
+
+def _rms_envelope(data: NDArray[np.float32], window: int) -> NDArray[np.float32]:
+    mono = data if data.ndim == 1 else data.mean(axis=1)
+    n_windows = -(-len(mono) // window)
+    padded = np.zeros(n_windows * window, dtype=np.float32)
+    padded[: len(mono)] = mono
+    return np.sqrt(np.mean(np.square(padded.reshape(n_windows, window)), axis=1))
+
+
 async def speak(text: str, settings: Settings) -> None:
     audio_bytes = await synthesize(text, settings)
     await asyncio.to_thread(_play_audio_blocking, audio_bytes)
@@ -0,0 +1,224 @@
+"""Upstream resilience: weighted least-outstanding pools, circuit breakers, hedging.
+
+A pool is shared process-wide per endpoint list (`get_pool`), so concurrent
+requests from serve, the Telegram bot or the MCP server see each other's
+outstanding counts. Failed endpoints are ejected for a cool-down and
+re-admitted by a background health probe or once the cool-down expires.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import httpx
+from loguru import logger
+
+from babel_tower.metrics import hedged_requests_total
+
+_LATENCY_WINDOW = 100
+_MIN_SAMPLES = 10
+_PROBE_TIMEOUT = 2.0
+
+
+@dataclass
+class Endpoint:
+    url: str
+    weight: float = 1.0
+    outstanding: int = 0
+    ejected_until: float = 0.0
+    # Latency samples in caller-defined units (e.g. seconds per audio second for STT)
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+
+    def healthy(self, now: float) -> bool:
+        return now >= self.ejected_until
+
+    def p95(self) -> float | None:
+        if len(self.samples) < _MIN_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+
+def parse_endpoints(raw: str, default_url: str) -> list[tuple[str, float]]:
+    """Parse `url[=weight],...`; an empty list falls back to the single default URL."""
+    endpoints: list[tuple[str, float]] = []
+    for entry in raw.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        url, _, weight = entry.rpartition("=")
+        if url and weight.replace(".", "", 1).isdigit():
+            endpoints.append((url.rstrip("/"), float(weight)))
+        else:
+            endpoints.append((entry.rstrip("/"), 1.0))
+    return endpoints or [(default_url.rstrip("/"), 1.0)]
+
+
+class EndpointPool:
+    def __init__(
+        self,
+        endpoints: list[tuple[str, float]],
+        eject_seconds: float = 30.0,
+        health_interval: float = 15.0,
+        health_path: str = "/health",
+    ) -> None:
+        self.endpoints = [Endpoint(url=url, weight=max(weight, 0.01)) for url, weight in endpoints]
+        self._eject_seconds = eject_seconds
+        self._health_interval = health_interval
+        self._health_path = health_path
+        self._last_probe = 0.0
+        self._probe_task: asyncio.Task[None] | None = None
+
+    def pick(self, exclude: tuple[Endpoint, ...] = ()) -> Endpoint | None:
+        """Healthy endpoint with the fewest outstanding requests per unit of weight."""
+        candidates = [e for e in self.endpoints if e not in exclude]
+        if not candidates:
+            return None
+        now = time.monotonic()
+        healthy = [e for e in candidates if e.healthy(now)]
+        if not healthy:
+            # Never fail closed: try whichever endpoint comes back soonest
+            return min(candidates, key=lambda e: e.ejected_until)
+        return min(healthy, key=lambda e: ((e.outstanding + 1) / e.weight, -e.weight))
+
+    @contextmanager
+    def track(self, endpoint: Endpoint) -> Iterator[None]:
+        endpoint.outstanding += 1
+        try:
+            yield
+        finally:
+            endpoint.outstanding -= 1
+
+    def eject(self, endpoint: Endpoint) -> None:
+        if len(self.endpoints) > 1:
+            logger.warning("Ejecting {} for {:.0f}s", endpoint.url, self._eject_seconds)
+        endpoint.ejected_until = time.monotonic() + self._eject_seconds
+
+    def restore(self, endpoint: Endpoint) -> None:
+        endpoint.ejected_until = 0.0
+
+    def maybe_probe(self) -> None:
+        """Start a background health probe if the last one is older than the interval."""
+        if len(self.endpoints) < 2 or self._health_interval <= 0:
+            return
+        now = time.monotonic()
+        if now - self._last_probe < self._health_interval:
+            return
+        if self._probe_task is not None and not self._probe_task.done():
+            return
+        self._last_probe = now
+        self._probe_task = asyncio.get_running_loop().create_task(self.probe())
+
+    async def probe(self) -> None:
+        async with httpx.AsyncClient(timeout=_PROBE_TIMEOUT) as client:
+
+            async def check(endpoint: Endpoint) -> None:
+                try:
+                    response = await client.get(f"{endpoint.url}{self._health_path}")
+                except httpx.HTTPError:
+                    self.eject(endpoint)
+                    return
+                if response.status_code < 500:
+                    self.restore(endpoint)
+                else:
+                    self.eject(endpoint)
+
+            await asyncio.gather(*(check(e) for e in self.endpoints))
+
+
+@dataclass
+class CircuitBreaker:
+    """Opens after consecutive failures; after reset_seconds lets trial requests through."""
+
+    failure_threshold: int
+    reset_seconds: float
+    failures: int = 0
+    opened_at: float | None = None
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        return time.monotonic() - self.opened_at >= self.reset_seconds
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                logger.warning("Circuit opened after {} failures", self.failures)
+            self.opened_at = time.monotonic()
+
+
+_breakers: dict[tuple[str, int, float], CircuitBreaker] = {}
+
+
+def get_breaker(url: str, failure_threshold: int, reset_seconds: float) -> CircuitBreaker:
+    key = (url, failure_threshold, reset_seconds)
+    breaker = _breakers.get(key)
+    if breaker is None:
+        breaker = _breakers[key] = CircuitBreaker(failure_threshold, reset_seconds)
+    return breaker
+
+
+_pools: dict[tuple[object, ...], EndpointPool] = {}
+
+
+def get_pool(
+    endpoints: list[tuple[str, float]],
+    eject_seconds: float,
+    health_interval: float,
+    health_path: str = "/health",
+) -> EndpointPool:
+    key = (tuple(endpoints), eject_seconds, health_interval, health_path)
+    pool = _pools.get(key)
+    if pool is None:
+        pool = _pools[key] = EndpointPool(endpoints, eject_seconds, health_interval, health_path)
+    return pool
+
+
+async def hedged[T](
+    stage: str,
+    primary: Callable[[], Awaitable[T]],
+    backup: Callable[[], Awaitable[T]] | None,
+    delay: float | None,
+) -> T:
+    """Run primary; if it is still pending after delay, race a backup and take the first success.
+
+    Without a backup or a delay this is just `await primary()`. If the first
+    request to finish failed, the other one is still awaited; the loser of the
+    race is cancelled.
+    """
+    if backup is None or delay is None:
+        return await primary()
+
+    first = asyncio.ensure_future(primary())
+    tasks: list[asyncio.Future[T]] = [first]
+    try:
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done:
+            return first.result()
+
+        hedged_requests_total.inc(stage=stage)
+        tasks.append(asyncio.ensure_future(backup()))
+        pending: set[asyncio.Future[T]] = set(tasks)
+        error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = error or task.exception()
+        assert error is not None
+        raise error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
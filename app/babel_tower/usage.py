@@ -0,0 +1,140 @@
+"""LLM token accounting: `usage` parsing, token counters and a per-mode report from traces.
+
+Every successful chat completion increments `babel_llm_tokens_total` and, in
+an active trace, records an `llm_request` span carrying the prompt, completion
+and cached prompt token counts. `summarize` fits request latency against
+uncached prompt tokens and completion tokens per mode, which splits the LLM
+time into prompt processing and generation and shows whether the upstream's
+prefix cache is being hit (`babel debug --tokens`).
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from babel_tower.metrics import llm_tokens_total
+from babel_tower.tracing import record_span
+
+_MIN_FIT_REQUESTS = 3
+
+
+@dataclass(frozen=True)
+class Usage:
+    prompt_tokens: int
+    completion_tokens: int
+    cached_tokens: int = 0
+
+
+def parse_usage(response: Mapping[str, object]) -> Usage | None:
+    """Token counts from an OpenAI-style response; LiteLLM's Anthropic cache field as fallback."""
+    usage = response.get("usage")
+    if not isinstance(usage, dict):
+        return None
+    details = usage.get("prompt_tokens_details")
+    cached = details.get("cached_tokens") if isinstance(details, dict) else None
+    if cached is None:
+        cached = usage.get("cache_read_input_tokens")
+    return Usage(
+        prompt_tokens=int(usage.get("prompt_tokens") or 0),
+        completion_tokens=int(usage.get("completion_tokens") or 0),
+        cached_tokens=int(cached or 0),
+    )
+
+
+def record_usage(usage: Usage, mode: str | None, model: str, sent_ns: int, end_ns: int) -> None:
+    label = mode or "none"
+    llm_tokens_total.inc(usage.prompt_tokens, mode=label, kind="prompt")
+    llm_tokens_total.inc(usage.completion_tokens, mode=label, kind="completion")
+    llm_tokens_total.inc(usage.cached_tokens, mode=label, kind="cached")
+    record_span(
+        "llm_request",
+        sent_ns,
+        end_ns,
+        mode=label,
+        model=model,
+        prompt_tokens=usage.prompt_tokens,
+        completion_tokens=usage.completion_tokens,
+        cached_tokens=usage.cached_tokens,
+    )
+
+
+@dataclass
+class ModeUsage:
+    mode: str
+    requests: int
+    prompt_tokens: float
+    completion_tokens: float
+    cached_ratio: float
+    latency_s: float
+    # Least-squares fit of latency; None with too few or too uniform requests
+    prefill_ms_per_1k: float | None = None
+    decode_ms_per_token: float | None = None
+
+    @property
+    def completion_tokens_per_s(self) -> float:
+        return self.completion_tokens / self.latency_s if self.latency_s else 0.0
+
+    @property
+    def prompt_share(self) -> float | None:
+        """Estimated fraction of the mean latency spent processing the uncached prompt."""
+        if self.prefill_ms_per_1k is None or not self.latency_s:
+            return None
+        uncached = self.prompt_tokens * (1 - self.cached_ratio)
+        return min(1.0, uncached / 1000 * self.prefill_ms_per_1k / 1000 / self.latency_s)
+
+
+def summarize(trace_lines: Iterable[str]) -> list[ModeUsage]:
+    """Per-mode token usage and latency split from `llm_request` spans in JSONL trace records."""
+    rows: dict[str, list[tuple[int, int, int, float]]] = {}
+    for line in trace_lines:
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        for s in record.get("spans", []):
+            if s.get("name") != "llm_request":
+                continue
+            attrs = s.get("attributes", {})
+            rows.setdefault(attrs.get("mode", "none"), []).append(
+                (
+                    int(attrs.get("prompt_tokens", 0)),
+                    int(attrs.get("completion_tokens", 0)),
+                    int(attrs.get("cached_tokens", 0)),
+                    float(s.get("duration_ms", 0.0)) / 1000,
+                )
+            )
+
+    summaries: list[ModeUsage] = []
+    for mode, samples in sorted(rows.items()):
+        n = len(samples)
+        prompt = sum(r[0] for r in samples)
+        summary = ModeUsage(
+            mode=mode,
+            requests=n,
+            prompt_tokens=prompt / n,
+            completion_tokens=sum(r[1] for r in samples) / n,
+            cached_ratio=sum(r[2] for r in samples) / prompt if prompt else 0.0,
+            latency_s=sum(r[3] for r in samples) / n,
+        )
+        _fit(summary, samples)
+        summaries.append(summary)
+    return summaries
+
+
+def _fit(summary: ModeUsage, samples: list[tuple[int, int, int, float]]) -> None:
+    """latency ≈ overhead + prefill * uncached prompt tokens + decode * completion tokens."""
+    if len(samples) < _MIN_FIT_REQUESTS:
+        return
+    import numpy as np
+
+    design = np.array(
+        [[1.0, prompt - cached, completion] for prompt, completion, cached, _ in samples]
+    )
+    latency = np.array([r[3] for r in samples])
+    coefficients, _, rank, _ = np.linalg.lstsq(design, latency, rcond=None)
+    if rank < 3:
+        return
+    summary.prefill_ms_per_1k = max(0.0, float(coefficients[1]) * 1e6)
+    summary.decode_ms_per_token = max(0.0, float(coefficients[2]) * 1e3)
@@ -0,0 +1,138 @@
+"""Upstream warm-up: a silent transcription and a one-token completion per endpoint.
+
+The first request after the GPU box unloaded its models pays for loading them.
+Long-running entry points (daemon, MCP server, serve, Telegram bot) call
+`start_warm_up` to warm every STT endpoint and LLM model at startup and,
+with `warmup_keepalive_seconds`, periodically so the models stay resident.
+`run_pipeline` calls `schedule_warm_up` when a recording starts, so the
+upstreams load while the user is still speaking. Failures are only logged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import wave
+from collections.abc import Awaitable
+from io import BytesIO
+
+import httpx
+from loguru import logger
+
+from babel_tower.config import Settings
+from babel_tower.processing import _llm_targets, _parse_mode_models
+from babel_tower.upstream import parse_endpoints
+
+_SILENCE_SECONDS = 0.5
+
+_last_warm_up = 0.0
+_in_flight: asyncio.Task[dict[str, float | None]] | None = None
+
+
+def _silent_wav(seconds: float, sample_rate: int) -> bytes:
+    buf = BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\0\0" * int(seconds * sample_rate))
+    return buf.getvalue()
+
+
+def _llm_models(settings: Settings) -> list[tuple[str, str]]:
+    """Every distinct (url, model) pair a request in any configured mode may use."""
+    modes: list[str | None] = [None, *_parse_mode_models(settings.llm_mode_models)]
+    pairs = {(t.url, t.model) for mode in modes for t in _llm_targets(mode, settings)}
+    return sorted(pairs)
+
+
+async def _warm_stt(client: httpx.AsyncClient, url: str, settings: Settings) -> None:
+    files = {
+        "file": (
+            "warmup.wav",
+            _silent_wav(_SILENCE_SECONDS, settings.audio_sample_rate),
+            "audio/wav",
+        )
+    }
+    data = {"model": settings.stt_model, "language": settings.stt_language}
+    response = await client.post(
+        f"{url}/v1/audio/transcriptions", files=files, data=data, timeout=settings.stt_timeout
+    )
+    response.raise_for_status()
+
+
+async def _warm_llm(client: httpx.AsyncClient, url: str, model: str, settings: Settings) -> None:
+    payload = {
+        "model": model,
+        "messages": [{"role": "user", "content": "ping"}],
+        "max_tokens": 1,
+        "reasoning_effort": "none",
+    }
+    headers: dict[str, str] = {}
+    if settings.llm_api_key:
+        headers["Authorization"] = f"Bearer {settings.llm_api_key}"
+    response = await client.post(
+        f"{url}/v1/chat/completions", json=payload, headers=headers, timeout=settings.llm_timeout
+    )
+    response.raise_for_status()
+
+
+async def warm_up(settings: Settings) -> dict[str, float | None]:
+    """Warm all STT endpoints and LLM models concurrently; seconds per upstream, None on failure."""
+    global _last_warm_up
+    _last_warm_up = time.monotonic()
+    results: dict[str, float | None] = {}
+
+    async def timed(label: str, call: Awaitable[None]) -> None:
+        t0 = time.perf_counter()
+        try:
+            await call
+        except httpx.HTTPError as e:
+            logger.warning("Warm-up of {} failed: {}", label, e)
+            results[label] = None
+            return
+        results[label] = time.perf_counter() - t0
+        logger.debug("Warm-up of {} took {:.2f}s", label, results[label])
+
+    async with httpx.AsyncClient() as client:
+        stt = [
+            timed(f"stt {url}", _warm_stt(client, url, settings))
+            for url, _ in parse_endpoints(settings.stt_urls, settings.stt_url)
+        ]
+        llm = [
+            timed(f"llm {url} {model}", _warm_llm(client, url, model, settings))
+            for url, model in _llm_models(settings)
+        ]
+        await asyncio.gather(*stt, *llm)
+    return results
+
+
+def schedule_warm_up(settings: Settings) -> None:
+    """Fire-and-forget warm-up on the running loop, unless one ran within warmup_min_interval."""
+    global _in_flight
+    if _in_flight is not None and not _in_flight.done():
+        return
+    if _last_warm_up and time.monotonic() - _last_warm_up < settings.warmup_min_interval:
+        return
+    _in_flight = asyncio.get_running_loop().create_task(warm_up(settings))
+
+
+async def _background(settings: Settings) -> None:
+    if settings.warmup_on_start:
+        await warm_up(settings)
+    interval = settings.warmup_keepalive_seconds
+    while interval > 0:
+        await asyncio.sleep(interval)
+        await warm_up(settings)
+
+
+def start_warm_up(settings: Settings) -> threading.Thread | None:
+    """Startup warm-up and keep-alive from a daemon thread, if either is enabled."""
+    if not settings.warmup_on_start and settings.warmup_keepalive_seconds <= 0:
+        return None
+    thread = threading.Thread(
+        target=asyncio.run, args=(_background(settings),), name="babel-warmup", daemon=True
+    )
+    thread.start()
+    return thread
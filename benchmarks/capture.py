@@ -0,0 +1,104 @@
+"""Capture-path microbenchmark: CPU and allocations per second of recorded audio.
+
+Compares the preallocated capture core (`_capture_utterance`) with the previous
+per-chunk list + concatenate + soundfile implementation, fed by synthetic chunks
+and a VAD stub that reports speech for the whole run (worst case for capture).
+
+Usage: uv run python benchmarks/capture.py [--seconds 60] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from io import BytesIO
+from typing import Any
+
+import numpy as np
+import soundfile as sf  # pyright: ignore[reportUnknownVariableType]
+from babel_tower.audio import VAD_CHUNK_SIZE, _capture_utterance
+from babel_tower.config import Settings
+from numpy.typing import NDArray
+
+
+class _AlwaysSpeech:
+    def __init__(self) -> None:
+        self._calls = 0
+
+    def __call__(self, _x: Any) -> dict[str, int] | None:
+        self._calls += 1
+        return {"start": 0} if self._calls == 1 else None
+
+    def reset_states(self) -> None:
+        pass
+
+
+def _chunk_reader(n_chunks: int) -> Callable[[], NDArray[np.int16]]:
+    rng = np.random.default_rng(0)
+    raw = rng.integers(-8000, 8000, size=(n_chunks, VAD_CHUNK_SIZE, 1), dtype=np.int16)
+    chunks = iter(raw)
+
+    def read() -> NDArray[np.int16]:
+        return next(chunks)[:, 0]
+
+    return read
+
+
+def _legacy_capture(read: Callable[[], NDArray[np.int16]], settings: Settings) -> BytesIO:
+    vad = _AlwaysSpeech()
+    frames: list[NDArray[np.int16]] = []
+    n_chunks = int(settings.max_record_seconds * settings.audio_sample_rate / VAD_CHUNK_SIZE)
+    for _ in range(n_chunks):
+        mono = np.asarray(read(), dtype=np.int16)
+        vad(mono.astype(np.float32) / 32768.0)
+        frames.append(np.array(mono, dtype=np.int16, copy=True))
+    buf = BytesIO()
+    audio_data = np.concatenate(frames)
+    sf.write(buf, audio_data, settings.audio_sample_rate, format="WAV", subtype="PCM_16")  # pyright: ignore[reportUnknownMemberType]
+    buf.seek(0)
+    return buf
+
+
+def _current_capture(read: Callable[[], NDArray[np.int16]], settings: Settings) -> BytesIO:
+    return _capture_utterance(read, _AlwaysSpeech(), settings)
+
+
+def _measure(
+    impl: Callable[[Callable[[], NDArray[np.int16]], Settings], BytesIO],
+    settings: Settings,
+    repeat: int,
+) -> tuple[float, int]:
+    n_chunks = int(settings.max_record_seconds * settings.audio_sample_rate / VAD_CHUNK_SIZE)
+    cpu_times: list[float] = []
+    peaks: list[int] = []
+    for _ in range(repeat):
+        read = _chunk_reader(n_chunks)
+        tracemalloc.start()
+        t0 = time.process_time()
+        impl(read, settings)
+        cpu_times.append(time.process_time() - t0)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return min(cpu_times), min(peaks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Capture-path CPU/allocation benchmark")
+    parser.add_argument("--seconds", type=int, default=60, help="Audio seconds per run")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per implementation")
+    args = parser.parse_args()
+
+    settings = Settings(max_record_seconds=args.seconds, inter_segment_timeout=0.0)
+
+    print(f"\n## Capture benchmark ({args.seconds} s audio, best of {args.repeat})\n")
+    print("| Implementation | CPU ms / audio s | Peak traced MiB |")
+    print("|----------------|------------------|-----------------|")
+    for name, impl in (("legacy", _legacy_capture), ("preallocated", _current_capture)):
+        cpu, peak = _measure(impl, settings, args.repeat)
+        print(f"| {name:14s} | {cpu / args.seconds * 1000:16.3f} | {peak / 2**20:15.2f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""End-to-end latency/throughput benchmark against local stub upstreams.
+
+Starts the stub STT/LLM/TTS server from `stubs.py`, points babel_tower at it
+and drives `process_file`, serve `/process`, the Telegram `handle_voice` and
+the daemon loop at a fixed concurrency. Reports throughput, p50/p95/p99 and
+babel_tower's own overhead (measured latency minus the delay the stubs
+injected). Desktop notifications and the clipboard are disabled; results land
+in a temporary state dir.
+
+Usage: uv run python benchmarks/e2e.py [--requests 200] [--concurrency 8]
+       [--stt-latency-ms 300] [--llm-latency-ms 400] [--jitter-ms 50]
+       [--targets process_file,serve,telegram,daemon] [--audio speech.wav]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import numpy as np
+import soundfile as sf  # pyright: ignore[reportUnknownVariableType]
+from babel_tower.audio import NoSpeechError
+from babel_tower.config import Settings
+from babel_tower.daemon import VoiceDaemon
+from babel_tower.pipeline import process_file
+from babel_tower.serve import create_app
+from babel_tower.telegram_bot import handle_voice
+from stubs import StubConfig, StubStats, run_stub_server
+
+Request = Callable[[], Awaitable[object]]
+
+_TARGETS = ("process_file", "serve", "telegram", "daemon")
+
+
+def _synthetic_wav(path: Path, seconds: float, sample_rate: int = 16000) -> None:
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    tone = 0.2 * np.sin(2 * np.pi * 220 * t) * (1 + np.sin(2 * np.pi * 3 * t)) / 2
+    sf.write(path, (tone * 32767).astype(np.int16), sample_rate)  # pyright: ignore[reportUnknownMemberType]
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def _drive(request: Request, n: int, concurrency: int) -> tuple[list[float], float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            t0 = time.perf_counter()
+            await request()
+            latencies.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(n)))
+    return latencies, time.perf_counter() - t0
+
+
+async def _drive_daemon(settings: Settings, audio: bytes, n: int) -> tuple[list[float], float]:
+    """The daemon records one utterance at a time, so it always runs at concurrency 1."""
+    daemon = VoiceDaemon(settings)
+    latencies: list[float] = []
+    started: list[float] = []
+
+    async def recorder(_settings: Settings, stop_event: object = None) -> BytesIO:
+        now = time.perf_counter()
+        if started:
+            latencies.append(now - started[-1])
+        started.append(now)
+        if len(started) > n:
+            daemon._shutdown()  # pyright: ignore[reportPrivateUsage]
+            raise NoSpeechError("benchmark finished")
+        return BytesIO(audio)
+
+    with (
+        patch("babel_tower.pipeline.record_speech", recorder),
+        patch("babel_tower.daemon.notify"),
+    ):
+        await daemon.run()
+    return latencies, started[-1] - started[0]
+
+
+def _report_row(
+    target: str, concurrency: int, latencies: list[float], wall: float, upstream: float
+) -> str:
+    ordered = sorted(latencies)
+    p50, p95, p99 = (_percentile(ordered, q) * 1000 for q in (0.5, 0.95, 0.99))
+    overhead = (sum(latencies) - upstream) / len(latencies) * 1000
+    throughput = len(latencies) / wall
+    return (
+        f"| {target:12s} | {len(latencies):8d} | {concurrency:11d} | {throughput:9.1f} "
+        f"| {p50:7.1f} | {p95:7.1f} | {p99:7.1f} | {overhead:11.1f} |"
+    )
+
+
+async def _run(args: argparse.Namespace, base_url: str, stats: StubStats, audio_path: Path) -> None:
+    os.environ.update(
+        {
+            "BABEL_STT_URL": base_url,
+            "BABEL_LLM_URL": base_url,
+            "BABEL_TTS_URL": base_url,
+            "BABEL_REVIEW_ENABLED": "false",
+        }
+    )
+    settings = Settings()
+    audio = audio_path.read_bytes()
+    app_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=create_app()), base_url="http://serve"
+    )
+
+    requests: dict[str, Request] = {
+        "process_file": lambda: process_file(
+            str(audio_path), mode=args.mode, settings=settings, clipboard=False
+        ),
+        "serve": lambda: app_client.post(
+            "/process", files={"file": ("audio.wav", audio, "audio/wav")}, data={"mode": args.mode}
+        ),
+        "telegram": lambda: handle_voice(audio, settings),
+    }
+
+    print(
+        f"\n## End-to-end (STT {args.stt_latency_ms:.0f} ms, LLM {args.llm_latency_ms:.0f} ms, "
+        f"jitter ±{args.jitter_ms:.0f} ms, {args.requests} requests)\n"
+    )
+    print(
+        "| Target       | Requests | Concurrency | Req/s     "
+        "| p50 ms  | p95 ms  | p99 ms  | Overhead ms |"
+    )
+    print(
+        "|--------------|----------|-------------|-----------"
+        "|---------|---------|---------|-------------|"
+    )
+    with patch("babel_tower.pipeline.notify"), patch("babel_tower.pipeline.copy_to_clipboard"):
+        for target in args.targets:
+            stats.reset()
+            if target == "daemon":
+                latencies, wall = await _drive_daemon(settings, audio, args.requests)
+                concurrency = 1
+            else:
+                latencies, wall = await _drive(requests[target], args.requests, args.concurrency)
+                concurrency = args.concurrency
+            print(_report_row(target, concurrency, latencies, wall, stats.total()))
+    await app_client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end benchmark with stub upstreams")
+    parser.add_argument("--requests", type=int, default=100, help="Requests per target")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight")
+    parser.add_argument("--targets", default=",".join(_TARGETS), help="Comma-separated targets")
+    parser.add_argument("--mode", default="clean", help="Processing mode for file/serve targets")
+    parser.add_argument("--audio", type=Path, help="Audio file to send (default: 3 s tone)")
+    parser.add_argument("--stt-latency-ms", type=float, default=300.0)
+    parser.add_argument("--llm-latency-ms", type=float, default=400.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--token-delay-ms", type=float, default=0.0)
+    parser.add_argument("--stream", action="store_true", help="Stub LLM answers with SSE chunks")
+    args = parser.parse_args()
+    args.targets = [t.strip() for t in args.targets.split(",") if t.strip()]
+    unknown = set(args.targets) - set(_TARGETS)
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(sorted(unknown))}")
+
+    config = StubConfig(
+        stt_latency_ms=args.stt_latency_ms,
+        llm_latency_ms=args.llm_latency_ms,
+        jitter_ms=args.jitter_ms,
+        token_delay_ms=args.token_delay_ms,
+        stream=args.stream,
+    )
+    stats = StubStats()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["XDG_STATE_HOME"] = tmp
+        audio_path = args.audio
+        if audio_path is None:
+            audio_path = Path(tmp) / "speech.wav"
+            _synthetic_wav(audio_path, 3.0)
+        with run_stub_server(config, stats) as base_url:
+            asyncio.run(_run(args, base_url, stats, audio_path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""LLM traffic and latency removed by the local normalizer fast path.
+
+Runs every transcript of a corpus through `process_transcript` in auto mode
+against the stub LLM, once with BABEL_LOCAL_FASTPATH off and once on, and
+reports how many requests reached the LLM and the resulting latency. The
+corpus is a text file with one transcript per line, a JSONL file with a
+`transcript` or `text` field per line, or a JSON list like
+tests/stt_evaluation/sentences.json (the default, extended by a few typical
+short daemon replies). Collect real daemon transcripts with e.g.
+`cat ~/.local/state/babel_tower/transcript.txt >> corpus.txt` after each run.
+
+Usage: uv run python benchmarks/fastpath.py [--corpus corpus.txt] [--llm-latency-ms 400]
+       [--min-confidence 0.7] [--max-words 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+
+from babel_tower.config import Settings
+from babel_tower.normalizer import fastpath_confidence, normalize
+from babel_tower.processing import process_transcript
+from stubs import StubConfig, StubStats, run_stub_server
+
+_SENTENCES = Path(__file__).resolve().parent.parent / "tests" / "stt_evaluation" / "sentences.json"
+
+_SHORT_REPLIES = [
+    "ja passt",
+    "okay mach das",
+    "äh nein lass das erstmal",
+    "danke",
+    "ja genau so",
+    "ähm ja klingt gut",
+    "kannst du das nochmal prüfen",
+    "sieht gut aus",
+    "bitte noch die Tests laufen lassen",
+    "mach weiter",
+]
+
+
+def load_corpus(path: Path | None) -> list[str]:
+    if path is None:
+        sentences = json.loads(_SENTENCES.read_text())
+        return [s["expected"] for s in sentences] + _SHORT_REPLIES
+    raw = path.read_text()
+    if path.suffix == ".json":
+        return [s["expected"] if isinstance(s, dict) else str(s) for s in json.loads(raw)]
+    if path.suffix == ".jsonl":
+        rows = [json.loads(line) for line in raw.splitlines() if line.strip()]
+        return [row.get("transcript") or row.get("text", "") for row in rows]
+    return [line.strip() for line in raw.splitlines() if line.strip()]
+
+
+async def _run(corpus: list[str], settings: Settings) -> list[float]:
+    latencies: list[float] = []
+    for transcript in corpus:
+        t0 = time.perf_counter()
+        await process_transcript(transcript, settings=settings)
+        latencies.append(time.perf_counter() - t0)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local normalizer fast-path benchmark")
+    parser.add_argument("--corpus", type=Path, help="Transcripts (.txt lines, .jsonl, .json)")
+    parser.add_argument("--llm-latency-ms", type=float, default=400.0)
+    parser.add_argument("--min-confidence", type=float, default=0.7)
+    parser.add_argument("--max-words", type=int, default=8)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    rows: list[tuple[str, int, list[float]]] = []
+    stats = StubStats()
+    with run_stub_server(StubConfig(llm_latency_ms=args.llm_latency_ms), stats) as url:
+        for enabled in (False, True):
+            settings = Settings(
+                llm_url=url,
+                llm_cache="off",
+                local_fastpath=enabled,
+                local_fastpath_min_confidence=args.min_confidence,
+                local_fastpath_max_words=args.max_words,
+            )
+            before = len(stats.delays["llm"])
+            latencies = asyncio.run(_run(corpus, settings))
+            rows.append(("on" if enabled else "off", len(stats.delays["llm"]) - before, latencies))
+
+    print(f"\n## Local fast path ({len(corpus)} transcripts, LLM {args.llm_latency_ms:.0f} ms)\n")
+    print("| Fast path | LLM requests | Mean ms | p50 ms | Total s |")
+    print("|-----------|--------------|---------|--------|---------|")
+    for label, llm_requests, latencies in rows:
+        print(
+            f"| {label} | {llm_requests:12d} | {statistics.mean(latencies) * 1000:7.0f} "
+            f"| {statistics.median(latencies) * 1000:6.0f} | {sum(latencies):7.2f} |"
+        )
+
+    settings = Settings(
+        local_fastpath_min_confidence=args.min_confidence, local_fastpath_max_words=args.max_words
+    )
+    print("\n| Handled locally | Output |")
+    print("|-----------------|--------|")
+    for transcript in corpus:
+        if fastpath_confidence(transcript, settings) >= args.min_confidence:
+            print(f"| {transcript} | {normalize(transcript)} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Paragraph-scoped revise against full regeneration on long documents.
+
+Builds a Markdown document of `--sections` paragraphs from the STT evaluation
+sentences and applies an instruction that touches `--affected` of them, once
+by regenerating the whole text (`revise` prompt) and once with
+`revise_sections` (locator pass, then only the affected sections). The stub
+LLM answers the locator with the affected section numbers and every revise
+request with its original text, so output length matches a real revision, and
+`--token-delay-ms` models decode speed. Prompt and completion tokens come from
+`babel_llm_tokens_total` (the stub counts words of the last user message).
+
+Usage: uv run python benchmarks/revise.py [--sections 24] [--affected 1] [--runs 5]
+       [--llm-latency-ms 300] [--token-delay-ms 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from babel_tower.config import Settings
+from babel_tower.metrics import llm_tokens_total
+from babel_tower.processing import process_transcript
+from babel_tower.sections import revise_sections, split_sections
+from stubs import StubConfig, StubStats, run_stub_server
+
+_SENTENCES = Path(__file__).resolve().parent.parent / "tests" / "stt_evaluation" / "sentences.json"
+_INSTRUCTION = "im Abschnitt über die Konfiguration bitte den zweiten Satz kürzer formulieren"
+_MODES = ("revise", "revise-locate")
+
+
+def build_document(sections: int) -> str:
+    sentences = [s["expected"] for s in json.loads(_SENTENCES.read_text())]
+    blocks: list[str] = []
+    for i in range(sections):
+        if i % 4 == 0:
+            blocks.append(f"## Teil {i // 4 + 1}")
+        # Rotate through the corpus so every paragraph has ~4 distinct sentences
+        start = (i * 4) % len(sentences)
+        blocks.append(" ".join((sentences * 2)[start : start + 4]))
+    return "\n\n".join(blocks)
+
+
+def _responder(affected: list[int]) -> Callable[[list[dict[str, str]]], str]:
+    def reply(messages: list[dict[str, str]]) -> str:
+        system, user = messages[0]["content"], messages[-1]["content"]
+        if "Lokalisierer" in system:
+            return ", ".join(str(i + 1) for i in affected)
+        marker = (
+            "## Originaltext (Ausschnitt)\n\n" if "(Ausschnitt)" in user else "## Originaltext\n\n"
+        )
+        return user.split(marker, 1)[-1].split("\n\n## Änderungsanweisungen", 1)[0]
+
+    return reply
+
+
+def _tokens(kind: str) -> float:
+    return sum(llm_tokens_total.value(mode=mode, kind=kind) for mode in _MODES)
+
+
+async def _full(document: str, settings: Settings) -> str:
+    context = f"## Originaltext\n\n{document}\n\n## Änderungsanweisungen"
+    return await process_transcript(_INSTRUCTION, mode="revise", settings=settings, context=context)
+
+
+async def _targeted(document: str, settings: Settings) -> str:
+    revised = await revise_sections(document, _INSTRUCTION, settings)
+    return revised if revised is not None else await _full(document, settings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Paragraph-scoped revise benchmark")
+    parser.add_argument("--sections", type=int, default=24)
+    parser.add_argument("--affected", type=int, default=1, help="Sections the instruction touches")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0)
+    parser.add_argument("--token-delay-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    document = build_document(args.sections)
+    count = len(split_sections(document))
+    # Spread the affected sections over the document
+    affected = sorted({i * count // args.affected for i in range(args.affected)})
+    config = StubConfig(
+        llm_latency_ms=args.llm_latency_ms,
+        token_delay_ms=args.token_delay_ms,
+        responder=_responder(affected),
+    )
+
+    rows: list[tuple[str, float, float, float, list[float]]] = []
+    stats = StubStats()
+    with run_stub_server(config, stats) as url:
+        settings = Settings(llm_url=url, llm_cache="off", revise_targeted=True)
+        for label, strategy in (("full", _full), ("targeted", _targeted)):
+            before = (len(stats.delays["llm"]), _tokens("prompt"), _tokens("completion"))
+            latencies: list[float] = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                result = asyncio.run(strategy(document, settings))
+                latencies.append(time.perf_counter() - t0)
+                assert result == document, "stub revision must reproduce the document"
+            rows.append(
+                (
+                    label,
+                    (len(stats.delays["llm"]) - before[0]) / args.runs,
+                    (_tokens("prompt") - before[1]) / args.runs,
+                    (_tokens("completion") - before[2]) / args.runs,
+                    latencies,
+                )
+            )
+
+    words = len(document.split())
+    print(
+        f"\n## Revise ({count} sections, {words} words, {len(affected)} affected, "
+        f"LLM {args.llm_latency_ms:.0f} ms + {args.token_delay_ms:.0f} ms/token)\n"
+    )
+    print("| Strategy | LLM requests | Prompt tokens | Completion tokens | Mean s | p50 s |")
+    print("|----------|--------------|---------------|-------------------|--------|-------|")
+    for label, requests, prompt, completion, latencies in rows:
+        print(
+            f"| {label} | {requests:12.0f} | {prompt:13.0f} | {completion:17.0f} "
+            f"| {statistics.mean(latencies):6.2f} | {statistics.median(latencies):5.2f} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Cold-start budget for `babel listen`.
+
+Measures the time from interpreter start to the point where `babel listen`
+opens the input stream (CLI import, pipeline import, VAD model load) in fresh
+interpreters, and exits non-zero when the median exceeds the budget — e.g.
+when a module-level import pulls torch back in.
+
+Usage: uv run python benchmarks/startup.py [--runs 7] [--budget-ms 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+
+from babel_tower.startup import measure_listen_cold_start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="babel listen cold-start budget")
+    parser.add_argument("--runs", type=int, default=7, help="Fresh interpreters to measure")
+    parser.add_argument("--budget-ms", type=float, default=1000.0, help="Median budget")
+    args = parser.parse_args()
+
+    measure_listen_cold_start()  # warm the OS page cache so run 1 is not an outlier
+    reports = [measure_listen_cold_start() for _ in range(args.runs)]
+    totals = [r.total_s * 1000 for r in reports]
+    median = statistics.median(totals)
+
+    print(f"\n## babel listen cold start ({args.runs} runs, budget {args.budget_ms:.0f} ms)\n")
+    print("| Phase | Median ms |")
+    print("|-------|-----------|")
+    for phase in reports[0].phases:
+        phase_median = statistics.median(r.phases[phase] * 1000 for r in reports)
+        print(f"| {phase} | {phase_median:9.0f} |")
+    print(f"| total (incl. interpreter) | {median:9.0f} |")
+
+    if median > args.budget_ms:
+        print(f"\nFAIL: median {median:.0f} ms exceeds budget {args.budget_ms:.0f} ms")
+        print("Run `babel debug --startup` to see which imports regressed.")
+        sys.exit(1)
+    print(f"\nOK: {args.budget_ms - median:.0f} ms under budget")
+
+
+if __name__ == "__main__":
+    main()
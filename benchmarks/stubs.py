@@ -0,0 +1,184 @@
+"""Local stand-ins for the OpenAI-compatible STT, chat-completions and TTS services.
+
+One Starlette app serves all three APIs with configurable latency, jitter and
+token streaming, so end-to-end benchmarks run without a GPU or network. Every
+injected delay is recorded per API so drivers can subtract upstream time from
+the measured latency and report babel_tower's own overhead.
+
+Standalone: uv run python benchmarks/stubs.py --port 8900 --stt-latency-ms 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from io import BytesIO
+
+import numpy as np
+import soundfile as sf  # pyright: ignore[reportUnknownVariableType]
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+_DEFAULT_TRANSCRIPT = (
+    "Also ich würde gerne ähm die Konfiguration für den Server anpassen, "
+    "damit die Antwortzeiten kürzer werden und wir das morgen testen können."
+)
+
+
+@dataclass
+class StubConfig:
+    stt_latency_ms: float = 300.0
+    llm_latency_ms: float = 400.0
+    tts_latency_ms: float = 200.0
+    jitter_ms: float = 0.0
+    token_delay_ms: float = 0.0
+    stream: bool = False
+    transcript: str = _DEFAULT_TRANSCRIPT
+    seed: int = 0
+    # Chat reply for a request's messages; default echoes the transcript
+    responder: Callable[[list[dict[str, str]]], str] | None = None
+
+
+@dataclass
+class StubStats:
+    """Injected delay per API in seconds, one entry per request served."""
+
+    delays: dict[str, list[float]] = field(
+        default_factory=lambda: {"stt": [], "llm": [], "tts": []}
+    )
+
+    def total(self) -> float:
+        return sum(sum(v) for v in self.delays.values())
+
+    def reset(self) -> None:
+        for values in self.delays.values():
+            values.clear()
+
+
+def _silence_wav(seconds: float, sample_rate: int = 24000) -> bytes:
+    buf = BytesIO()
+    sf.write(buf, np.zeros(int(seconds * sample_rate), dtype=np.int16), sample_rate, format="WAV")  # pyright: ignore[reportUnknownMemberType]
+    return buf.getvalue()
+
+
+def create_stub_app(config: StubConfig, stats: StubStats | None = None) -> Starlette:
+    stats = stats or StubStats()
+    rng = random.Random(config.seed)
+    speech_wav = _silence_wav(1.0)
+
+    def delay(api: str, base_ms: float) -> float:
+        seconds = max(0.0, base_ms + rng.uniform(-config.jitter_ms, config.jitter_ms)) / 1000
+        stats.delays[api].append(seconds)
+        return seconds
+
+    async def transcriptions(request: Request) -> JSONResponse:
+        await request.form()
+        await asyncio.sleep(delay("stt", config.stt_latency_ms))
+        return JSONResponse({"text": config.transcript})
+
+    async def chat_completions(request: Request) -> Response:
+        payload = await request.json()
+        messages = payload.get("messages", [])
+        user = messages[-1]["content"] if messages else ""
+        # Echo the transcript between the markers so output length tracks input length
+        text = user.split("<<<TRANSKRIPT>>>")[-1].split("<<<ENDE>>>")[0].strip() or user
+        if config.responder is not None:
+            text = config.responder(messages)
+        tokens = text.split()
+        first_token = delay("llm", config.llm_latency_ms)
+        per_token = config.token_delay_ms / 1000
+        stats.delays["llm"][-1] += per_token * len(tokens)
+
+        if config.stream or payload.get("stream"):
+
+            async def events() -> AsyncIterator[str]:
+                await asyncio.sleep(first_token)
+                for token in tokens:
+                    chunk = {"choices": [{"index": 0, "delta": {"content": token + " "}}]}
+                    yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+                    if per_token:
+                        await asyncio.sleep(per_token)
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        await asyncio.sleep(first_token + per_token * len(tokens))
+        usage = {"prompt_tokens": len(user.split()), "completion_tokens": len(tokens)}
+        return JSONResponse(
+            {
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}}],
+                "usage": usage,
+            }
+        )
+
+    async def speech(_request: Request) -> Response:
+        await asyncio.sleep(delay("tts", config.tts_latency_ms))
+        return Response(speech_wav, media_type="audio/wav")
+
+    return Starlette(
+        routes=[
+            Route("/v1/audio/transcriptions", transcriptions, methods=["POST"]),
+            Route("/v1/chat/completions", chat_completions, methods=["POST"]),
+            Route("/v1/audio/speech", speech, methods=["POST"]),
+        ]
+    )
+
+
+@contextmanager
+def run_stub_server(config: StubConfig, stats: StubStats | None = None) -> Iterator[str]:
+    """Serve the stub app on an ephemeral localhost port; yields its base URL."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(create_stub_app(config, stats), log_level="warning", access_log=False)
+    )
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+        sock.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stub STT/LLM/TTS server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--stt-latency-ms", type=float, default=300.0)
+    parser.add_argument("--llm-latency-ms", type=float, default=400.0)
+    parser.add_argument("--tts-latency-ms", type=float, default=200.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--token-delay-ms", type=float, default=0.0)
+    parser.add_argument("--stream", action="store_true", help="Always answer with SSE chunks")
+    args = parser.parse_args()
+
+    config = StubConfig(
+        stt_latency_ms=args.stt_latency_ms,
+        llm_latency_ms=args.llm_latency_ms,
+        tts_latency_ms=args.tts_latency_ms,
+        jitter_ms=args.jitter_ms,
+        token_delay_ms=args.token_delay_ms,
+        stream=args.stream,
+    )
+    uvicorn.run(create_stub_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Silero VAD inference benchmark across ONNX Runtime session configurations.
+
+Runs the VAD model chunk by chunk over the recorded STT evaluation fixtures
+(`--wav-dir`, 16 kHz mono WAVs as produced for tests/stt_evaluation) or, if
+none are given, over synthetic speech-band noise. Reports per-chunk inference
+latency and CPU time for each thread/optimization combination.
+
+Usage: uv run python benchmarks/vad_onnx.py [--wav-dir ./wavs] [--threads 1,2,4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import soundfile as sf  # pyright: ignore[reportUnknownVariableType]
+from babel_tower.audio import VAD_CHUNK_SIZE, _load_vad_model
+from babel_tower.config import Settings
+from numpy.typing import NDArray
+
+_SAMPLE_RATE = 16000
+
+
+def _load_chunks(wav_dir: Path | None, seconds: int) -> list[NDArray[np.float32]]:
+    if wav_dir is None:
+        rng = np.random.default_rng(0)
+        audio = rng.normal(0.0, 0.1, size=seconds * _SAMPLE_RATE).astype(np.float32)
+    else:
+        parts: list[NDArray[np.float32]] = []
+        for wav in sorted(wav_dir.glob("*.wav")):
+            data: Any
+            data, sr = sf.read(wav, dtype="float32")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+            if sr != _SAMPLE_RATE:
+                print(f"Skipping {wav.name}: {sr} Hz (need {_SAMPLE_RATE})")
+                continue
+            parts.append(data if data.ndim == 1 else data.mean(axis=1))
+        if not parts:
+            raise SystemExit(f"No 16 kHz WAV files in {wav_dir}")
+        audio = np.concatenate(parts)
+    n_chunks = len(audio) // VAD_CHUNK_SIZE
+    return list(audio[: n_chunks * VAD_CHUNK_SIZE].reshape(n_chunks, VAD_CHUNK_SIZE))
+
+
+def _run(settings: Settings, chunks: list[NDArray[np.float32]]) -> tuple[float, float, float]:
+    model = _load_vad_model(settings)
+    for chunk in chunks[:20]:  # warm-up
+        model(chunk, _SAMPLE_RATE)
+    model.reset_states()
+
+    latencies: list[float] = []
+    cpu0 = time.process_time()
+    for chunk in chunks:
+        t0 = time.perf_counter()
+        model(chunk, _SAMPLE_RATE)
+        latencies.append(time.perf_counter() - t0)
+    cpu = time.process_time() - cpu0
+    p50, p95 = np.percentile(latencies, [50, 95])
+    return float(p50), float(p95), cpu / len(chunks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Silero VAD ONNX Runtime benchmark")
+    parser.add_argument("--wav-dir", type=Path, default=None, help="Directory with 16 kHz WAVs")
+    parser.add_argument("--seconds", type=int, default=60, help="Synthetic audio length")
+    parser.add_argument("--threads", default="1,2,4", help="intra-op thread counts to try")
+    parser.add_argument("--levels", default="basic,all", help="graph optimization levels")
+    args = parser.parse_args()
+
+    chunks = _load_chunks(args.wav_dir, args.seconds)
+    source = args.wav_dir or "synthetic noise"
+
+    print(f"\n## VAD ONNX benchmark ({len(chunks)} chunks from {source})\n")
+    print("| intra | inter | graph | p50 µs | p95 µs | CPU µs / chunk |")
+    print("|-------|-------|-------|--------|--------|----------------|")
+    for threads in (int(t) for t in args.threads.split(",")):
+        for level in args.levels.split(","):
+            settings = Settings(
+                vad_intra_op_threads=threads,
+                vad_inter_op_threads=1,
+                vad_graph_optimization=level,
+            )
+            p50, p95, cpu = _run(settings, chunks)
+            print(
+                f"| {threads:5d} | {1:5d} | {level:5s} "
+                f"| {p50 * 1e6:6.0f} | {p95 * 1e6:6.0f} | {cpu * 1e6:14.0f} |"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Idle-CPU benchmark for the energy pre-gate in front of Silero VAD.
+
+Feeds synthetic room noise (no speech) through the capture core with the real
+ONNX VAD, once with and once without `vad_pregate`, and extrapolates the CPU
+time to one hour of silence.
+
+Usage: uv run python benchmarks/vad_pregate.py [--seconds 120] [--noise-dbfs -60]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from babel_tower.audio import (
+    VAD_CHUNK_SIZE,
+    NoSpeechError,
+    _capture_utterance,
+    _new_vad_iterator,
+    load_silero_vad,
+)
+from babel_tower.config import Settings
+from numpy.typing import NDArray
+
+
+def _noise_reader(seconds: int, sample_rate: int, dbfs: float) -> Callable[[], NDArray[np.int16]]:
+    n_chunks = int(seconds * sample_rate / VAD_CHUNK_SIZE)
+    amplitude = 32767 * 10 ** (dbfs / 20)
+    rng = np.random.default_rng(0)
+    noise = rng.normal(0.0, amplitude, size=(n_chunks, VAD_CHUNK_SIZE))
+    chunks = iter(noise.astype(np.int16))
+    return lambda: next(chunks)
+
+
+def _cpu_seconds(settings: Settings, model: Any, seconds: int, dbfs: float) -> float:
+    read = _noise_reader(seconds, settings.audio_sample_rate, dbfs)
+    vad = _new_vad_iterator(model, settings)
+    t0 = time.process_time()
+    with contextlib.suppress(NoSpeechError):
+        _capture_utterance(read, vad, settings)
+    return time.process_time() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="VAD energy pre-gate idle CPU benchmark")
+    parser.add_argument("--seconds", type=int, default=120, help="Seconds of silence per run")
+    parser.add_argument("--noise-dbfs", type=float, default=-60.0, help="Room noise level")
+    args = parser.parse_args()
+
+    model = load_silero_vad(onnx=True)
+    base = Settings(max_record_seconds=args.seconds, inter_segment_timeout=0.0)
+
+    print(f"\n## VAD pre-gate ({args.seconds} s of {args.noise_dbfs:.0f} dBFS noise)\n")
+    print("| Pre-gate | CPU s | CPU s / hour of silence |")
+    print("|----------|-------|-------------------------|")
+    for enabled in (False, True):
+        settings = base.model_copy(update={"vad_pregate": enabled})
+        cpu = _cpu_seconds(settings, model, args.seconds, args.noise_dbfs)
+        label = "on" if enabled else "off"
+        print(f"| {label:8s} | {cpu:5.2f} | {cpu * 3600 / args.seconds:23.1f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,14 @@ import babel_tower.config as _config_mod
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _fresh_settings() -> Generator[None]:
+    """Tests change the environment; never hand out a Settings instance cached by another test."""
+    _config_mod.reload_settings()
+    yield
+    _config_mod.reload_settings()
+
+
 @pytest.fixture
 def clean_env(monkeypatch: pytest.MonkeyPatch) -> Generator[pytest.MonkeyPatch]:
     """Remove all BABEL_ env vars and disable .env loading so tests start from a clean state."""
@@ -1,13 +1,80 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import itertools
 import json
 import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
 import httpx
 import jiwer
+import soundfile as sf  # pyright: ignore[reportUnknownVariableType]
+
+_CODEC_FORMATS = {
+    "wav": ("WAV", "PCM_16", "audio/wav"),
+    "flac": ("FLAC", "PCM_16", "audio/flac"),
+    "ogg": ("OGG", "VORBIS", "audio/ogg"),
+    "opus": ("OGG", "OPUS", "audio/ogg"),
+}
+
+
+@dataclass(frozen=True)
+class STTConfig:
+    model: str
+    codec: str = "wav"
+    hotwords: str = ""
+    prompt: str = ""
+
+    @property
+    def label(self) -> str:
+        parts = [self.model, self.codec]
+        if self.hotwords:
+            parts.append("hotwords")
+        if self.prompt:
+            parts.append("prompt")
+        return "/".join(parts)
+
+
+@dataclass
+class FileResult:
+    id: int
+    expected: str
+    transcript: str
+    wer: float
+    latency_s: float
+    audio_s: float
+    rtf: float
+    upload_bytes: int
+
+
+@dataclass
+class ConfigResult:
+    config: STTConfig
+    files: list[FileResult] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self) -> dict[str, float]:
+        if not self.files:
+            return {}
+        latencies = sorted(f.latency_s for f in self.files)
+        return {
+            "avg_wer": sum(f.wer for f in self.files) / len(self.files),
+            "p50_latency_s": _percentile(latencies, 0.5),
+            "p95_latency_s": _percentile(latencies, 0.95),
+            "mean_rtf": sum(f.rtf for f in self.files) / len(self.files),
+            "upload_bytes": sum(f.upload_bytes for f in self.files),
+        }
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
 
 
 def load_sentences(script_dir: Path) -> list[dict[str, Any]]:
@@ -24,31 +91,110 @@ def wav_path_for_id(wav_dir: Path, sentence_id: int) -> Path:
     return wav_dir / f"sentence_{sentence_id:02d}.wav"
 
 
-def transcribe(wav_path: Path, stt_url: str) -> str:
+def encode(wav_path: Path, codec: str) -> tuple[bytes, float]:
+    """Re-encode a WAV file for upload; returns the payload and the audio duration."""
+    data: Any
+    sr: int
+    data, sr = sf.read(wav_path, dtype="int16")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    duration = len(data) / sr  # pyright: ignore[reportUnknownArgumentType]
+    if codec == "wav":
+        return wav_path.read_bytes(), duration
+    file_format, subtype, _ = _CODEC_FORMATS[codec]
+    buf = BytesIO()
+    sf.write(buf, data, sr, format=file_format, subtype=subtype)  # pyright: ignore[reportUnknownMemberType]
+    return buf.getvalue(), duration
+
+
+async def transcribe(
+    client: httpx.AsyncClient, stt_url: str, audio: bytes, config: STTConfig, language: str
+) -> str:
     url = f"{stt_url}/v1/audio/transcriptions"
-    with open(wav_path, "rb") as f:
-        audio_bytes = f.read()
-    files = {"file": ("audio.wav", audio_bytes, "audio/wav")}
-    data = {"model": "large-v3", "language": "de"}
-    with httpx.Client(timeout=30.0) as client:
-        response = client.post(url, files=files, data=data)
+    _, _, mime = _CODEC_FORMATS[config.codec]
+    files = {"file": (f"audio.{config.codec}", audio, mime)}
+    data = {"model": config.model, "language": language}
+    if config.hotwords:
+        data["hotwords"] = config.hotwords
+    if config.prompt:
+        data["prompt"] = config.prompt
+    response = await client.post(url, files=files, data=data)
     response.raise_for_status()
     result: dict[str, Any] = response.json()
     text: str = result.get("text", "")
     return text.strip()
 
 
-def print_report(results: list[dict[str, Any]]) -> None:
+async def evaluate(
+    matched: list[tuple[dict[str, Any], Path]],
+    configs: list[STTConfig],
+    stt_url: str,
+    language: str,
+    concurrency: int,
+    timeout: float,
+) -> list[ConfigResult]:
+    """Transcribe every file under every config, at most `concurrency` requests in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    results = [ConfigResult(config=c) for c in configs]
+
+    # Encode up front so codec cost stays out of the measured request latency
+    payloads = {
+        (sentence["id"], codec): encode(wp, codec)
+        for sentence, wp in matched
+        for codec in {c.codec for c in configs}
+    }
+
+    async def one(
+        result: ConfigResult, sentence: dict[str, Any], client: httpx.AsyncClient
+    ) -> None:
+        audio, duration = payloads[(sentence["id"], result.config.codec)]
+        async with semaphore:
+            t0 = time.perf_counter()
+            try:
+                transcript = await transcribe(client, stt_url, audio, result.config, language)
+            except httpx.HTTPError as e:
+                print(
+                    f"  Error transcribing sentence {sentence['id']} ({result.config.label}): {e}"
+                )
+                result.errors += 1
+                return
+            latency = time.perf_counter() - t0
+
+        expected: str = sentence["expected"]
+        result.files.append(
+            FileResult(
+                id=sentence["id"],
+                expected=expected,
+                transcript=transcript,
+                wer=jiwer.wer(expected, transcript),
+                latency_s=latency,
+                audio_s=duration,
+                rtf=latency / duration if duration else 0.0,
+                upload_bytes=len(audio),
+            )
+        )
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+        await asyncio.gather(
+            *(one(result, sentence, client) for result in results for sentence, _ in matched)
+        )
+    for result in results:
+        result.files.sort(key=lambda f: f.id)
+    return results
+
+
+def print_report(results: list[FileResult]) -> None:
     print("\n## STT Evaluation Report\n")
-    print("| ID | WER | Expected | Transcript |")
-    print("|----|-----|----------|------------|")
+    print("| ID | WER | Latency | RTF | Expected | Transcript |")
+    print("|----|-----|---------|-----|----------|------------|")
 
     wer_values: list[float] = []
     for r in results:
-        wer_val: float = r["wer"]
-        wer_values.append(wer_val)
-        wer_pct = f"{wer_val:.1%}"
-        print(f"| {r['id']:2d} | {wer_pct:>6s} | {r['expected']} | {r['transcript']} |")
+        wer_values.append(r.wer)
+        wer_pct = f"{r.wer:.1%}"
+        print(
+            f"| {r.id:2d} | {wer_pct:>6s} | {r.latency_s:5.2f} s | {r.rtf:.2f} "
+            f"| {r.expected} | {r.transcript} |"
+        )
 
     if wer_values:
         avg_wer = sum(wer_values) / len(wer_values)
@@ -57,6 +203,42 @@ def print_report(results: list[dict[str, Any]]) -> None:
         print("\nNo sentences evaluated.")
 
 
+def print_comparison(results: list[ConfigResult]) -> None:
+    print("\n## STT Configuration Comparison\n")
+    print("| Config | Files | Errors | Avg WER | p50 latency | p95 latency | Mean RTF | Upload |")
+    print("|--------|-------|--------|---------|-------------|-------------|----------|--------|")
+    for r in results:
+        s = r.summary()
+        if not s:
+            print(f"| {r.config.label} | 0 | {r.errors} | - | - | - | - | - |")
+            continue
+        print(
+            f"| {r.config.label} | {len(r.files)} | {r.errors} | {s['avg_wer']:.1%} "
+            f"| {s['p50_latency_s']:.2f} s | {s['p95_latency_s']:.2f} s | {s['mean_rtf']:.2f} "
+            f"| {s['upload_bytes'] / 1024:.0f} KiB |"
+        )
+
+
+def write_json(path: Path, results: list[ConfigResult], stt_url: str, concurrency: int) -> None:
+    payload = {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "stt_url": stt_url,
+        "concurrency": concurrency,
+        "configs": [
+            {
+                **asdict(r.config),
+                "label": r.config.label,
+                "errors": r.errors,
+                "summary": r.summary(),
+                "files": [asdict(f) for f in r.files],
+            }
+            for r in results
+        ],
+    }
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2))
+    print(f"\nResults written to {path}")
+
+
 def print_recording_instructions(sentences: list[dict[str, Any]], wav_dir: Path) -> None:
     print("No WAV files found. Record sentences with these steps:\n")
     print(f"1. Create WAV files in: {wav_dir.resolve()}")
@@ -71,6 +253,10 @@ def print_recording_instructions(sentences: list[dict[str, Any]], wav_dir: Path)
         print(f"      -> sentence_{sid:02d}.wav")
 
 
+def _split(raw: str) -> list[str]:
+    return [x.strip() for x in raw.split(",") if x.strip()]
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Evaluate STT accuracy using Word Error Rate")
     parser.add_argument(
@@ -83,12 +269,49 @@ def main() -> None:
         default=".",
         help="Directory containing WAV files (default: current directory)",
     )
+    parser.add_argument(
+        "--models", default="large-v3", help="Comma-separated STT models to compare"
+    )
+    parser.add_argument(
+        "--codecs",
+        default="wav",
+        help=f"Comma-separated upload codecs to compare ({', '.join(_CODEC_FORMATS)})",
+    )
+    parser.add_argument(
+        "--hotwords",
+        action="append",
+        default=[],
+        help="Hotwords variant to compare against none (repeatable)",
+    )
+    parser.add_argument(
+        "--prompt",
+        action="append",
+        default=[],
+        help="Initial prompt variant to compare against none (repeatable)",
+    )
+    parser.add_argument("--language", default="de", help="Transcription language (default: de)")
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="Requests in flight (default: 1)"
+    )
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout (s)")
+    parser.add_argument("--json", type=Path, help="Write per-file results to this JSON file")
     args = parser.parse_args()
 
     script_dir = Path(__file__).resolve().parent
     wav_dir = Path(args.wav_dir)
     stt_url: str = args.stt_url
 
+    codecs = _split(args.codecs)
+    unknown = set(codecs) - set(_CODEC_FORMATS)
+    if unknown:
+        parser.error(f"unknown codecs: {', '.join(sorted(unknown))}")
+    configs = [
+        STTConfig(model=m, codec=c, hotwords=h, prompt=p)
+        for m, c, h, p in itertools.product(
+            _split(args.models), codecs, ["", *args.hotwords], ["", *args.prompt]
+        )
+    ]
+
     sentences = load_sentences(script_dir)
 
     matched: list[tuple[dict[str, Any], Path]] = []
@@ -101,29 +324,21 @@ def main() -> None:
         print_recording_instructions(sentences, wav_dir)
         sys.exit(0)
 
-    print(f"Found {len(matched)}/{len(sentences)} WAV files. Evaluating against {stt_url} ...\n")
-
-    results: list[dict[str, Any]] = []
-    for sentence, wp in matched:
-        try:
-            transcript = transcribe(wp, stt_url)
-        except httpx.HTTPError as e:
-            print(f"  Error transcribing sentence {sentence['id']}: {e}")
-            continue
-
-        expected: str = sentence["expected"]
-        wer_val: float = jiwer.wer(expected, transcript)
+    print(
+        f"Found {len(matched)}/{len(sentences)} WAV files. Evaluating {len(configs)} "
+        f"config(s) against {stt_url} (concurrency {args.concurrency}) ...\n"
+    )
 
-        results.append(
-            {
-                "id": sentence["id"],
-                "expected": expected,
-                "transcript": transcript,
-                "wer": wer_val,
-            }
-        )
+    results = asyncio.run(
+        evaluate(matched, configs, stt_url, args.language, args.concurrency, args.timeout)
+    )
 
-    print_report(results)
+    if len(results) == 1:
+        print_report(results[0].files)
+    else:
+        print_comparison(results)
+    if args.json:
+        write_json(args.json, results, stt_url, args.concurrency)
 
 
 if __name__ == "__main__":
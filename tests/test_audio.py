@@ -290,6 +290,41 @@ class TestMultiSegmentRecording:
         # Only first segment: calls 2,3,4,5 = 4 chunks (breaks at first end)
         assert len(data) == 4 * 512
 
+    @patch("babel_tower.audio.load_silero_vad")
+    @patch("babel_tower.audio.sd.InputStream")
+    def test_on_segment_receives_each_segment(
+        self,
+        mock_input_stream: MagicMock,
+        mock_load_vad: MagicMock,
+    ) -> None:
+        # Segment 1: calls 2-4. Segment 2 starts at call 6; stop arrives during call 10.
+        vad = FakeVADIterator(None)
+        vad.configure_multi([(2, 4), (6, 12)])
+        stream = FakeStream([_make_chunk(0.0)] * 20)
+        stop = threading.Event()
+        reads = iter(range(1, 100))
+
+        def read(frames: int) -> tuple[NDArray[np.int16], bool]:
+            if next(reads) == 10:
+                stop.set()
+            return FakeStream.read(stream, frames)
+
+        stream.read = read  # type: ignore[method-assign]
+        mock_input_stream.return_value = stream
+        mock_load_vad.return_value = MagicMock()
+        segments: list[int] = []
+
+        def on_segment(wav: BytesIO) -> None:
+            data, _ = sf.read(wav)
+            segments.append(len(data))
+
+        with patch("babel_tower.audio.VADIterator", return_value=vad):
+            settings = _make_settings(inter_segment_timeout=3.2)
+            _record_speech_blocking(settings, stop_event=stop, on_segment=on_segment)
+
+        # The unfinished second segment (calls 6-10) is emitted as the tail
+        assert segments == [3 * 512, 5 * 512]
+
 
 class TestRecordSpeechAsync:
     @pytest.mark.anyio
@@ -314,3 +349,410 @@ class TestRecordSpeechAsync:
         data, samplerate = sf.read(result)
         assert samplerate == 16000
         assert len(data) > 0
+
+
+class TestBargeInHooks:
+    @patch("babel_tower.audio.load_silero_vad")
+    @patch("babel_tower.audio.VADIterator", FakeVADIterator)
+    @patch("babel_tower.audio.sd.InputStream")
+    def test_on_speech_start_called_once(
+        self,
+        mock_input_stream: MagicMock,
+        mock_load_vad: MagicMock,
+    ) -> None:
+        mock_input_stream.return_value = FakeStream([_make_chunk(0.0)] * 10)
+        mock_load_vad.return_value = MagicMock()
+        on_start = MagicMock()
+
+        _record_speech_blocking(_make_settings(), on_speech_start=on_start)
+
+        on_start.assert_called_once_with()
+
+    @patch("babel_tower.audio.load_silero_vad")
+    @patch("babel_tower.audio.sd.InputStream")
+    def test_echo_gate_rejects_segment(
+        self,
+        mock_input_stream: MagicMock,
+        mock_load_vad: MagicMock,
+    ) -> None:
+        # First segment (start@2) is echo, second segment (start@6, end@8) is real speech.
+        vad = FakeVADIterator(None)
+        vad.configure_multi([(2, 4), (6, 8)])
+        mock_input_stream.return_value = FakeStream([_make_chunk(0.0)] * 20)
+        mock_load_vad.return_value = MagicMock()
+        gate_results = iter([True, False])
+        on_start = MagicMock()
+
+        with patch("babel_tower.audio.VADIterator", return_value=vad):
+            result = _record_speech_blocking(
+                _make_settings(),
+                on_speech_start=on_start,
+                echo_gate=lambda _chunk: next(gate_results),
+            )
+
+        result.seek(0)
+        data, _ = sf.read(result)
+        # Only the second segment: calls 6, 7, 8 = 3 chunks
+        assert len(data) == 3 * 512
+        on_start.assert_called_once_with()
+
+
+class PrefilledFakeStream:
+    """Fake persistent stream: yields its chunks, then blocks until stopped."""
+
+    def __init__(self, chunks: list[NDArray[np.int16]]) -> None:
+        self._chunks = iter(chunks)
+        self.exhausted = threading.Event()
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        pass
+
+    def read(self, _frames: int) -> tuple[NDArray[np.int16], bool]:
+        try:
+            return next(self._chunks), False
+        except StopIteration:
+            self.exhausted.set()
+            self._stopped.wait()
+            raise RuntimeError("stream stopped") from None
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def close(self) -> None:
+        pass
+
+
+class TestCaptureSession:
+    @pytest.mark.anyio
+    @patch("babel_tower.audio.load_silero_vad")
+    @patch("babel_tower.audio.VADIterator", FakeVADIterator)
+    @patch("babel_tower.audio.sd.InputStream")
+    async def test_record_replays_pre_roll(
+        self,
+        mock_input_stream: MagicMock,
+        mock_load_vad: MagicMock,
+    ) -> None:
+        from babel_tower.audio import CaptureSession
+
+        stream = PrefilledFakeStream([_make_chunk(0.1)] * 8)
+        mock_input_stream.return_value = stream
+        mock_load_vad.return_value = MagicMock()
+        settings = _make_settings().model_copy(update={"prearm_pre_roll_ms": 1000})
+
+        session = CaptureSession(settings)
+        try:
+            assert stream.exhausted.wait(timeout=2.0)
+            result = await session.record()
+        finally:
+            session.close()
+
+        result.seek(0)
+        data, _ = sf.read(result)
+        # Speech started and ended inside the buffered audio: calls 2..5 = 4 chunks
+        assert len(data) == 4 * 512
+        mock_load_vad.assert_called_once_with(onnx=True)
+        mock_input_stream.assert_called_once()
+
+    @patch("babel_tower.audio.load_silero_vad")
+    @patch("babel_tower.audio.sd.InputStream")
+    def test_pre_roll_keeps_only_latest_chunks(
+        self,
+        mock_input_stream: MagicMock,
+        mock_load_vad: MagicMock,
+    ) -> None:
+        from babel_tower.audio import CaptureSession
+
+        stream = PrefilledFakeStream([_make_chunk(i / 100) for i in range(20)])
+        mock_input_stream.return_value = stream
+        mock_load_vad.return_value = MagicMock()
+        # 96 ms = 3 chunks of 32 ms
+        settings = _make_settings().model_copy(update={"prearm_pre_roll_ms": 96})
+
+        session = CaptureSession(settings)
+        try:
+            assert stream.exhausted.wait(timeout=2.0)
+            kept = [int(chunk[0]) for chunk in session._pre_roll]
+        finally:
+            session.close()
+
+        assert kept == [int(i / 100 * 32767) for i in (17, 18, 19)]
+
+
+class TestEncodeWav:
+    def test_roundtrips_through_soundfile(self) -> None:
+        from babel_tower.audio import encode_wav
+
+        samples = np.arange(-1000, 1000, dtype=np.int16)
+        buf = encode_wav(samples, 16000)
+
+        data, samplerate = sf.read(buf, dtype="int16")
+        assert samplerate == 16000
+        np.testing.assert_array_equal(data, samples)
+
+    def test_header_matches_payload_size(self) -> None:
+        from babel_tower.audio import encode_wav
+
+        wav = encode_wav(np.zeros(512, dtype=np.int16), 16000).getvalue()
+        assert len(wav) == 44 + 1024
+        assert wav[:4] == b"RIFF"
+        assert int.from_bytes(wav[40:44], "little") == 1024
+
+
+class FakeCallbackStream:
+    """Fake sd.InputStream in callback mode: start() pushes all chunks through the callback."""
+
+    def __init__(self, chunks: list[NDArray[np.int16]], overflow_at: int = -1) -> None:
+        self._chunks = chunks
+        self._overflow_at = overflow_at
+        self.callback: Any = None
+        self.closed = False
+
+    def __call__(self, **kwargs: Any) -> FakeCallbackStream:
+        self.callback = kwargs["callback"]
+        return self
+
+    def start(self) -> None:
+        for i, chunk in enumerate(self._chunks):
+            self.callback(chunk, len(chunk), None, MagicMock(input_overflow=i == self._overflow_at))
+
+    def stop(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _callback_settings(queue_chunks: int = 64) -> Settings:
+    return _make_settings().model_copy(
+        update={"capture_mode": "callback", "capture_queue_chunks": queue_chunks}
+    )
+
+
+class TestCallbackCapture:
+    @patch("babel_tower.audio.load_silero_vad")
+    @patch("babel_tower.audio.VADIterator", FakeVADIterator)
+    def test_records_from_callback_queue(self, mock_load_vad: MagicMock) -> None:
+        stream = FakeCallbackStream([_make_chunk(0.1)] * 10)
+        mock_load_vad.return_value = MagicMock()
+
+        with patch("babel_tower.audio.sd.InputStream", stream):
+            result = _record_speech_blocking(_callback_settings())
+
+        data, _ = sf.read(result)
+        assert len(data) == 4 * 512
+        assert stream.closed
+
+    @patch("babel_tower.audio.load_silero_vad")
+    @patch("babel_tower.audio.VADIterator", FakeVADIterator)
+    def test_counts_overflow_and_dropped_chunks(self, mock_load_vad: MagicMock) -> None:
+        from babel_tower.audio import capture_stats
+
+        stream = FakeCallbackStream([_make_chunk(0.1)] * 10, overflow_at=0)
+        mock_load_vad.return_value = MagicMock()
+        overflows, dropped = capture_stats.overflows, capture_stats.dropped
+
+        with patch("babel_tower.audio.sd.InputStream", stream):
+            result = _record_speech_blocking(_callback_settings(queue_chunks=6))
+
+        data, _ = sf.read(result)
+        assert len(data) == 4 * 512
+        assert capture_stats.overflows == overflows + 1
+        assert capture_stats.dropped == dropped + 4
+
+    @patch("babel_tower.audio.load_silero_vad")
+    @patch("babel_tower.audio.VADIterator", FakeVADIterator)
+    @patch("babel_tower.audio._INPUT_STALL_SECONDS", 0.01)
+    def test_stalled_input_counts_underrun_and_raises(self, mock_load_vad: MagicMock) -> None:
+        from babel_tower.audio import capture_stats
+
+        stream = FakeCallbackStream([_make_chunk(0.1)] * 1)
+        mock_load_vad.return_value = MagicMock()
+        underruns = capture_stats.underruns
+
+        with (
+            patch("babel_tower.audio.sd.InputStream", stream),
+            pytest.raises(RuntimeError, match="No audio"),
+        ):
+            _record_speech_blocking(_callback_settings())
+
+        assert capture_stats.underruns == underruns + 1
+
+
+def _pregate_settings() -> Settings:
+    return _make_settings().model_copy(
+        update={"vad_pregate": True, "vad_pregate_ratio": 3.0, "vad_pregate_lookback_ms": 96}
+    )
+
+
+class TestEnergyPregate:
+    @patch("babel_tower.audio.load_silero_vad")
+    @patch("babel_tower.audio.sd.InputStream")
+    def test_silent_chunks_skip_vad(
+        self,
+        mock_input_stream: MagicMock,
+        mock_load_vad: MagicMock,
+    ) -> None:
+        from babel_tower.audio import capture_stats
+
+        vad = FakeVADIterator(None)
+        # Calls 1-3 replay the lookback, call 4 is the first loud chunk
+        vad.configure(5, 8)
+        chunks = [_make_chunk(0.0)] * 20 + [_make_chunk(0.5)] * 6 + [_make_chunk(0.0)] * 4
+        mock_input_stream.return_value = FakeStream(chunks)
+        mock_load_vad.return_value = MagicMock()
+        skipped = capture_stats.vad_skipped
+
+        with patch("babel_tower.audio.VADIterator", return_value=vad):
+            result = _record_speech_blocking(_pregate_settings())
+
+        data, _ = sf.read(result)
+        assert len(data) == 4 * 512
+        assert vad._call_count == 8
+        assert capture_stats.vad_skipped == skipped + 20
+
+    @patch("babel_tower.audio.load_silero_vad")
+    @patch("babel_tower.audio.sd.InputStream")
+    def test_onset_in_lookback_is_captured(
+        self,
+        mock_input_stream: MagicMock,
+        mock_load_vad: MagicMock,
+    ) -> None:
+        vad = FakeVADIterator(None)
+        # VAD fires start on the second replayed lookback chunk
+        vad.configure(2, 5)
+        chunks = [_make_chunk(0.0)] * 10 + [_make_chunk(0.5)] * 6
+        mock_input_stream.return_value = FakeStream(chunks)
+        mock_load_vad.return_value = MagicMock()
+
+        with patch("babel_tower.audio.VADIterator", return_value=vad):
+            result = _record_speech_blocking(_pregate_settings())
+
+        data, _ = sf.read(result, dtype="int16")
+        # Lookback chunks 2 and 3 (silent) + loud chunks at calls 4 and 5
+        assert len(data) == 4 * 512
+        assert not data[: 2 * 512].any()
+        assert data[2 * 512 :].all()
+
+    @patch("babel_tower.audio.load_silero_vad")
+    @patch("babel_tower.audio.VADIterator", FakeVADIterator)
+    @patch("babel_tower.audio.sd.InputStream")
+    def test_disabled_runs_vad_on_every_chunk(
+        self,
+        mock_input_stream: MagicMock,
+        mock_load_vad: MagicMock,
+    ) -> None:
+        from babel_tower.audio import capture_stats
+
+        mock_input_stream.return_value = FakeStream([_make_chunk(0.0)] * 10)
+        mock_load_vad.return_value = MagicMock()
+        skipped = capture_stats.vad_skipped
+
+        _record_speech_blocking(_make_settings())
+
+        assert capture_stats.vad_skipped == skipped
+
+
+class TestVadSessionTuning:
+    @patch("babel_tower.audio.load_silero_vad")
+    @patch("babel_tower.audio._build_vad_session")
+    def test_default_settings_keep_silero_session(
+        self, mock_build: MagicMock, mock_load_vad: MagicMock
+    ) -> None:
+        from babel_tower.audio import _load_vad_model
+
+        _load_vad_model(_make_settings())
+
+        mock_build.assert_not_called()
+
+    @patch("babel_tower.audio.load_silero_vad")
+    @patch("babel_tower.audio._build_vad_session")
+    def test_tuned_settings_replace_session(
+        self, mock_build: MagicMock, mock_load_vad: MagicMock
+    ) -> None:
+        from babel_tower.audio import _load_vad_model
+
+        settings = _make_settings().model_copy(update={"vad_intra_op_threads": 4})
+        model = _load_vad_model(settings)
+
+        mock_build.assert_called_once_with(settings)
+        assert model.session is mock_build.return_value
+
+    def test_session_options_applied(self) -> None:
+        import onnxruntime as ort
+        from babel_tower.audio import _build_vad_session
+
+        settings = _make_settings().model_copy(
+            update={"vad_intra_op_threads": 2, "vad_graph_optimization": "basic"}
+        )
+        session = _build_vad_session(settings)
+
+        opts = session.get_session_options()
+        assert opts.intra_op_num_threads == 2
+        assert opts.graph_optimization_level == ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+
+    def test_optimized_model_cached_and_reused(self, tmp_path: Any) -> None:
+        import onnxruntime as ort
+        from babel_tower.audio import _build_vad_session
+
+        cache = tmp_path / "vad" / "silero_vad.opt.onnx"
+        settings = _make_settings().model_copy(update={"vad_optimized_model_path": str(cache)})
+
+        _build_vad_session(settings)
+        assert cache.exists()
+
+        session = _build_vad_session(settings)
+        opts = session.get_session_options()
+        assert opts.graph_optimization_level == ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+
+
+class ScriptedVADModel:
+    """Returns scripted speech probabilities, one per call."""
+
+    def __init__(self, probs: list[float]) -> None:
+        self._probs = iter(probs)
+
+    def reset_states(self) -> None:
+        pass
+
+    def __call__(self, _x: NDArray[np.float32], _sr: int) -> float:
+        return next(self._probs)
+
+
+class TestTorchFreeVad:
+    def test_iterator_emits_padded_start_and_end(self) -> None:
+        from babel_tower.audio import VADIterator
+
+        probs = [0.1, 0.9, 0.9, 0.1, 0.1, 0.1, 0.1]
+        vad = VADIterator(ScriptedVADModel(probs), min_silence_duration_ms=64, speech_pad_ms=30)
+        chunk = np.zeros(512, dtype=np.float32)
+
+        events = [vad(chunk) for _ in probs]
+
+        assert events[1] == {"start": 512 - 480}
+        assert events[3] is None  # silence shorter than min_silence_duration_ms
+        assert events[5] == {"end": 2048 + 480 - 512}
+        assert events[6] is None
+
+    def test_brief_dip_does_not_end_segment(self) -> None:
+        from babel_tower.audio import VADIterator
+
+        probs = [0.9, 0.1, 0.9, 0.1, 0.1, 0.1]
+        vad = VADIterator(ScriptedVADModel(probs), min_silence_duration_ms=64)
+        chunk = np.zeros(512, dtype=np.float32)
+
+        events = [vad(chunk) for _ in probs]
+
+        assert [e for e in events if e] == [{"start": 0}, {"end": 2048 + 480 - 512}]
+
+    def test_onnx_model_returns_probability(self) -> None:
+        from babel_tower.audio import load_silero_vad
+
+        model = load_silero_vad()
+        noise = np.random.default_rng(0).normal(0, 0.01, 512).astype(np.float32)
+
+        prob = model(noise, 16000)
+
+        assert 0.0 <= prob <= 1.0
+        model.reset_states()
+        assert model(noise, 16000) == pytest.approx(prob)
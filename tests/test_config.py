@@ -1,7 +1,11 @@
+import os
+import signal
+from pathlib import Path
 from typing import Any
 
+import babel_tower.config as config
 import pytest
-from babel_tower.config import Settings
+from babel_tower.config import Settings, get_settings, reload_on_sighup
 
 
 class TestSettingsDefaults:
@@ -71,3 +75,45 @@ class TestSettingsEnvOverride:
         settings = Settings()
         assert settings.audio_sample_rate == 44100
         assert settings.vad_threshold == 0.8
+
+
+@pytest.fixture
+def env_file(clean_env: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    path = tmp_path / ".env"
+    path.write_text("BABEL_DEFAULT_MODE=structure\n")
+    clean_env.setattr(Settings, "model_config", {**Settings.model_config, "env_file": path})
+    clean_env.setattr(config, "_RELOAD_CHECK_INTERVAL", 0.0)
+    return path
+
+
+class TestGetSettings:
+    def test_returns_cached_instance(self, env_file: Path) -> None:
+        assert get_settings() is get_settings()
+        assert get_settings().default_mode == "structure"
+
+    def test_reloads_when_env_file_changes(self, env_file: Path) -> None:
+        first = get_settings()
+        # Different size, so the change is seen even within the mtime granularity
+        env_file.write_text("BABEL_DEFAULT_MODE=clean\n")
+
+        second = get_settings()
+
+        assert second is not first
+        assert second.default_mode == "clean"
+
+    def test_sighup_reloads(self, env_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        previous = signal.getsignal(signal.SIGHUP)
+        first = get_settings()
+        monkeypatch.setenv("BABEL_DEFAULT_MODE", "durchreichen")
+        try:
+            reload_on_sighup()
+            os.kill(os.getpid(), signal.SIGHUP)
+            assert get_settings() is not first
+            assert get_settings().default_mode == "durchreichen"
+        finally:
+            signal.signal(signal.SIGHUP, previous)
+
+    def test_overrides_are_copies(self, env_file: Path) -> None:
+        override = get_settings().model_copy(update={"default_mode": "clean"})
+        assert override.default_mode == "clean"
+        assert get_settings().default_mode == "structure"
@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import httpx
+import pytest
+from babel_tower.config import Settings
+from babel_tower.llm_cache import ResponseCache, cache_key, get_cache
+from babel_tower.processing import process_transcript
+
+
+class TestCacheKey:
+    def test_normalizes_whitespace_and_unicode(self) -> None:
+        composed = cache_key("clean", "prompt", ["babel"], "Grüße  aus\nBerlin ")
+        decomposed = cache_key("clean", "prompt", ["babel"], "Gru\u0308\u00dfe aus Berlin")
+        assert composed == decomposed
+
+    def test_prompt_change_changes_key(self) -> None:
+        assert cache_key("clean", "v1", ["babel"], "text") != cache_key(
+            "clean", "v2", ["babel"], "text"
+        )
+
+    def test_mode_and_models_are_part_of_key(self) -> None:
+        base = cache_key("clean", "p", ["babel"], "text")
+        assert base != cache_key("structure", "p", ["babel"], "text")
+        assert base != cache_key("clean", "p", ["babel-fast"], "text")
+
+
+class TestResponseCache:
+    def test_lru_evicts_least_recently_used(self) -> None:
+        cache = ResponseCache(size=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        assert cache.get("a") == "A"
+        cache.put("c", "C")
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+
+    def test_disk_tier_survives_new_instance(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "cache.sqlite3"
+        ResponseCache(size=4, db_path=db_path).put("k", "Wert")
+        assert ResponseCache(size=4, db_path=db_path).get("k") == "Wert"
+
+    def test_disk_tier_is_pruned(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("babel_tower.llm_cache._PRUNE_EVERY", 1)
+        cache = ResponseCache(size=0, db_path=tmp_path / "cache.sqlite3", disk_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, key.upper())
+        assert cache.get("a") is None
+        assert cache.get("c") == "C"
+
+
+class TestProcessTranscriptCache:
+    @pytest.fixture
+    def cache_settings(
+        self, clean_env: pytest.MonkeyPatch, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> Settings:
+        prompts = tmp_path / "prompts"
+        prompts.mkdir()
+        (prompts / "clean.md").write_text("Cleanup prompt.")
+        clean_env.setenv("BABEL_LLM_URL", "http://test-llm:4000")
+        clean_env.setenv("BABEL_PROMPTS_DIR", str(prompts))
+        monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state"))
+        monkeypatch.setattr("babel_tower.llm_cache._caches", {})
+        return Settings(llm_cache="disk")
+
+    @pytest.mark.anyio
+    async def test_repeated_input_skips_llm(
+        self, cache_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            calls.append(url)
+            return httpx.Response(200, json={"choices": [{"message": {"content": "Bereinigt"}}]})
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        first = await process_transcript("Das ist ein Test", mode="clean", settings=cache_settings)
+        second = await process_transcript(
+            "Das ist  ein Test ", mode="clean", settings=cache_settings
+        )
+
+        assert first == second == "Bereinigt"
+        assert len(calls) == 1
+
+    @pytest.mark.anyio
+    async def test_prompt_edit_invalidates(
+        self, cache_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            calls.append(url)
+            return httpx.Response(200, json={"choices": [{"message": {"content": "Bereinigt"}}]})
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        await process_transcript("Das ist ein Test", mode="clean", settings=cache_settings)
+        (Path(cache_settings.prompts_dir) / "clean.md").write_text("Cleanup prompt v2.")
+        await process_transcript("Das ist ein Test", mode="clean", settings=cache_settings)
+
+        assert len(calls) == 2
+
+    def test_off_by_default(self, clean_env: pytest.MonkeyPatch) -> None:
+        assert get_cache(Settings()) is None
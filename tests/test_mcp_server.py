@@ -9,21 +9,32 @@ import pytest
 if "sounddevice" not in sys.modules:
     sys.modules["sounddevice"] = MagicMock()
 
-from babel_tower.mcp_server import _settings, converse, mcp, set_mode  # noqa: E402
+import babel_tower.mcp_server as server  # noqa: E402
+from babel_tower.config import Settings  # noqa: E402
+from babel_tower.mcp_server import converse, mcp, set_mode, set_option  # noqa: E402
+from babel_tower.sessions import SessionSettings  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def base_settings(clean_env: pytest.MonkeyPatch) -> Settings:
+    """Shared base settings of a fresh session registry."""
+    base = Settings()
+    clean_env.setattr(server, "_sessions", SessionSettings(lambda: base))
+    return base
 
 
 class TestMcpServerSetup:
     def test_mcp_server_name(self) -> None:
         assert mcp.name == "babel-tower"
 
-    def test_settings_initialized(self) -> None:
-        assert _settings is not None
-        assert isinstance(_settings.default_mode, str)
+    def test_settings_initialized(self, base_settings: Settings) -> None:
+        assert base_settings is not None
+        assert isinstance(base_settings.default_mode, str)
 
 
 class TestConverseTool:
     @pytest.mark.anyio
-    async def test_calls_pipeline_with_default_mode(self) -> None:
+    async def test_calls_pipeline_with_default_mode(self, base_settings: Settings) -> None:
         with patch(
             "babel_tower.mcp_server.run_pipeline",
             new_callable=AsyncMock,
@@ -32,11 +43,11 @@ class TestConverseTool:
             result = await converse()
             assert result == "processed text"
             mock_pipeline.assert_called_once_with(
-                mode=None, settings=_settings, clipboard=False
+                mode=None, settings=base_settings, clipboard=False, recorder=None
             )
 
     @pytest.mark.anyio
-    async def test_calls_pipeline_with_explicit_mode(self) -> None:
+    async def test_calls_pipeline_with_explicit_mode(self, base_settings: Settings) -> None:
         with patch(
             "babel_tower.mcp_server.run_pipeline",
             new_callable=AsyncMock,
@@ -45,7 +56,7 @@ class TestConverseTool:
             result = await converse(mode="structure")
             assert result == "structured text"
             mock_pipeline.assert_called_once_with(
-                mode="structure", settings=_settings, clipboard=False
+                mode="structure", settings=base_settings, clipboard=False, recorder=None
             )
 
     @pytest.mark.anyio
@@ -101,9 +112,9 @@ class TestConverseTool:
 
 class TestConverseToolTTS:
     @pytest.mark.anyio
-    async def test_tts_enabled_speaks_instead_of_notify(self) -> None:
-        original = _settings.tts_enabled
-        _settings.tts_enabled = True
+    async def test_tts_enabled_speaks_instead_of_notify(self, base_settings: Settings) -> None:
+        original = base_settings.tts_enabled
+        base_settings.tts_enabled = True
         try:
             with (
                 patch(
@@ -115,15 +126,15 @@ class TestConverseToolTTS:
                 patch("babel_tower.tts.speak", new_callable=AsyncMock) as mock_speak,
             ):
                 await converse(message="Hallo")
-                mock_speak.assert_called_once_with("Hallo", _settings)
+                mock_speak.assert_called_once_with("Hallo", base_settings)
                 mock_notify.assert_not_called()
         finally:
-            _settings.tts_enabled = original
+            base_settings.tts_enabled = original
 
     @pytest.mark.anyio
-    async def test_tts_error_falls_back_to_notify(self) -> None:
-        original = _settings.tts_enabled
-        _settings.tts_enabled = True
+    async def test_tts_error_falls_back_to_notify(self, base_settings: Settings) -> None:
+        original = base_settings.tts_enabled
+        base_settings.tts_enabled = True
         try:
             with (
                 patch(
@@ -141,11 +152,11 @@ class TestConverseToolTTS:
                 await converse(message="Hallo")
                 mock_notify.assert_called_once_with("Babel Tower", "Hallo")
         finally:
-            _settings.tts_enabled = original
+            base_settings.tts_enabled = original
 
     @pytest.mark.anyio
-    async def test_tts_disabled_uses_notify(self) -> None:
-        assert not _settings.tts_enabled
+    async def test_tts_disabled_uses_notify(self, base_settings: Settings) -> None:
+        assert not base_settings.tts_enabled
         with (
             patch(
                 "babel_tower.mcp_server.run_pipeline",
@@ -160,49 +171,161 @@ class TestConverseToolTTS:
 
 class TestSetModeTool:
     @pytest.mark.anyio
-    async def test_set_valid_mode_structure(self) -> None:
-        original = _settings.default_mode
-        try:
-            result = await set_mode(mode="structure")
-            assert result == "Default mode set to: structure"
-            assert _settings.default_mode == "structure"
-        finally:
-            _settings.default_mode = original
+    async def test_set_valid_mode_structure(self, base_settings: Settings) -> None:
+        result = await set_mode(mode="structure")
+        assert result == "Default mode set to: structure"
+        assert server._session_settings().default_mode == "structure"
 
     @pytest.mark.anyio
-    async def test_set_valid_mode_clean(self) -> None:
-        original = _settings.default_mode
-        try:
-            result = await set_mode(mode="clean")
-            assert result == "Default mode set to: clean"
-            assert _settings.default_mode == "clean"
-        finally:
-            _settings.default_mode = original
+    async def test_set_valid_mode_clean(self, base_settings: Settings) -> None:
+        result = await set_mode(mode="clean")
+        assert result == "Default mode set to: clean"
+        assert server._session_settings().default_mode == "clean"
 
     @pytest.mark.anyio
-    async def test_set_valid_mode_durchreichen(self) -> None:
-        original = _settings.default_mode
-        try:
-            result = await set_mode(mode="durchreichen")
-            assert result == "Default mode set to: durchreichen"
-            assert _settings.default_mode == "durchreichen"
-        finally:
-            _settings.default_mode = original
+    async def test_set_valid_mode_durchreichen(self, base_settings: Settings) -> None:
+        result = await set_mode(mode="durchreichen")
+        assert result == "Default mode set to: durchreichen"
+        assert server._session_settings().default_mode == "durchreichen"
 
     @pytest.mark.anyio
-    async def test_set_invalid_mode(self) -> None:
-        original = _settings.default_mode
+    async def test_set_invalid_mode(self, base_settings: Settings) -> None:
+        original = base_settings.default_mode
         result = await set_mode(mode="invalid")
         assert "Unknown mode: invalid" in result
         assert "clean" in result
         assert "durchreichen" in result
         assert "structure" in result
         # Settings should not change
-        assert _settings.default_mode == original
+        assert base_settings.default_mode == original
 
     @pytest.mark.anyio
-    async def test_set_empty_mode(self) -> None:
-        original = _settings.default_mode
+    async def test_set_empty_mode(self, base_settings: Settings) -> None:
+        original = base_settings.default_mode
         result = await set_mode(mode="")
         assert "Unknown mode: " in result
-        assert _settings.default_mode == original
+        assert base_settings.default_mode == original
+
+
+class TestSessionIsolation:
+    @pytest.mark.anyio
+    async def test_set_mode_only_affects_own_session(self, base_settings: Settings) -> None:
+        with patch("babel_tower.mcp_server._session_id", return_value="agent-a"):
+            await set_mode(mode="structure")
+        with patch("babel_tower.mcp_server._session_id", return_value="agent-b"):
+            assert server._session_settings() is base_settings
+
+        assert base_settings.default_mode == "clean"
+
+    @pytest.mark.anyio
+    async def test_converse_uses_session_settings(self, base_settings: Settings) -> None:
+        with (
+            patch("babel_tower.mcp_server._session_id", return_value="agent-a"),
+            patch(
+                "babel_tower.mcp_server.run_pipeline",
+                new_callable=AsyncMock,
+                return_value="response",
+            ) as mock_pipeline,
+        ):
+            await set_option(name="silence_duration", value="0.8")
+            await converse()
+
+        settings = mock_pipeline.call_args.kwargs["settings"]
+        assert settings.silence_duration == 0.8
+        assert base_settings.silence_duration == 2.0
+
+
+class TestSetOptionTool:
+    @pytest.mark.anyio
+    async def test_parses_value_by_field_type(self) -> None:
+        assert await set_option(name="tts_enabled", value="true") == "tts_enabled set to: True"
+        assert server._session_settings().tts_enabled is True
+
+    @pytest.mark.anyio
+    async def test_rejects_unknown_option(self) -> None:
+        result = await set_option(name="llm_api_key", value="secret")
+        assert result.startswith("Unknown option: llm_api_key")
+
+    @pytest.mark.anyio
+    async def test_rejects_invalid_value(self, base_settings: Settings) -> None:
+        result = await set_option(name="vad_threshold", value="hoch")
+        assert result.startswith("Invalid value for vad_threshold")
+        assert server._session_settings() is base_settings
+
+
+class TestConverseBargeIn:
+    @pytest.mark.anyio
+    async def test_listens_during_playback(self, base_settings: Settings) -> None:
+        original = (base_settings.tts_enabled, base_settings.barge_in_enabled)
+        base_settings.tts_enabled = True
+        base_settings.barge_in_enabled = True
+        playback = MagicMock()
+        try:
+            with (
+                patch(
+                    "babel_tower.mcp_server.run_pipeline",
+                    new_callable=AsyncMock,
+                    return_value="interrupted answer",
+                ) as mock_pipeline,
+                patch("babel_tower.tts.synthesize", new_callable=AsyncMock, return_value=b"wav"),
+                patch("babel_tower.tts.Playback", return_value=playback),
+            ):
+                result = await converse(message="Lange Antwort...")
+                assert result == "interrupted answer"
+                playback.start.assert_called_once()
+                playback.stop.assert_called()
+                recorder = mock_pipeline.call_args.kwargs["recorder"]
+                assert recorder.keywords["on_speech_start"] is playback.stop
+        finally:
+            base_settings.tts_enabled, base_settings.barge_in_enabled = original
+
+    @pytest.mark.anyio
+    async def test_synthesis_error_falls_back_to_notify(self, base_settings: Settings) -> None:
+        original = (base_settings.tts_enabled, base_settings.barge_in_enabled)
+        base_settings.tts_enabled = True
+        base_settings.barge_in_enabled = True
+        try:
+            with (
+                patch(
+                    "babel_tower.mcp_server.run_pipeline",
+                    new_callable=AsyncMock,
+                    return_value="response",
+                ) as mock_pipeline,
+                patch("babel_tower.mcp_server.notify", return_value=True) as mock_notify,
+                patch(
+                    "babel_tower.tts.synthesize",
+                    new_callable=AsyncMock,
+                    side_effect=Exception("TTS down"),
+                ),
+            ):
+                await converse(message="Hallo")
+                mock_notify.assert_called_once_with("Babel Tower", "Hallo")
+                mock_pipeline.assert_called_once_with(
+                    mode=None, settings=base_settings, clipboard=False, recorder=None
+                )
+        finally:
+            base_settings.tts_enabled, base_settings.barge_in_enabled = original
+
+
+class TestPrearmedCapture:
+    @pytest.mark.anyio
+    async def test_converse_uses_warm_session(self, base_settings: Settings) -> None:
+        original = base_settings.prearm_capture
+        base_settings.prearm_capture = True
+        session = MagicMock()
+        try:
+            with (
+                patch("babel_tower.mcp_server.CaptureSession", return_value=session) as mock_cls,
+                patch(
+                    "babel_tower.mcp_server.run_pipeline",
+                    new_callable=AsyncMock,
+                    return_value="response",
+                ) as mock_pipeline,
+            ):
+                await converse()
+                await converse()
+                mock_cls.assert_called_once_with(base_settings)
+                assert mock_pipeline.call_args.kwargs["recorder"] is session.record
+        finally:
+            base_settings.prearm_capture = original
+            server._capture = None
@@ -0,0 +1,76 @@
+import httpx
+import pytest
+from babel_tower.metrics import (
+    Counter,
+    Histogram,
+    observe_stage,
+    render,
+    requests_in_flight,
+    requests_total,
+    stage_seconds,
+    start_metrics_server,
+    track_request,
+    upstream_errors_total,
+)
+from babel_tower.processing import ProcessingError
+
+
+class TestRegistry:
+    def test_counter_renders_labels(self) -> None:
+        counter = Counter("babel_test_counter_total", "Test counter")
+        counter.inc(entry="serve")
+        counter.inc(2, entry="serve")
+        text = counter.render()
+        assert "# TYPE babel_test_counter_total counter" in text
+        assert 'babel_test_counter_total{entry="serve"} 3.0' in text
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        histogram = Histogram("babel_test_seconds", "Test histogram", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5.0)
+        text = histogram.render()
+        assert 'babel_test_seconds_bucket{le="0.1"} 1' in text
+        assert 'babel_test_seconds_bucket{le="1.0"} 2' in text
+        assert 'babel_test_seconds_bucket{le="+Inf"} 3' in text
+        assert "babel_test_seconds_count 3" in text
+        assert "babel_test_seconds_sum 5.55" in text
+
+    def test_render_includes_all_metrics(self) -> None:
+        text = render()
+        assert "babel_requests_total" in text
+        assert "babel_stage_duration_seconds" in text
+        assert "babel_upstream_errors_total" in text
+        assert "babel_audio_seconds_total" in text
+
+
+class TestInstrumentation:
+    def test_track_request_balances_in_flight(self) -> None:
+        before = requests_total.value(entry="unit")
+        with track_request("unit"):
+            assert requests_in_flight.value(entry="unit") == 1
+        assert requests_in_flight.value(entry="unit") == 0
+        assert requests_total.value(entry="unit") == before + 1
+
+    def test_observe_stage_counts_errors_by_class(self) -> None:
+        errors = upstream_errors_total.value(stage="unit", error="ProcessingError")
+        observed = stage_seconds.count(stage="unit")
+        with pytest.raises(ProcessingError), observe_stage("unit"):
+            raise ProcessingError("down")
+        assert upstream_errors_total.value(stage="unit", error="ProcessingError") == errors + 1
+        assert stage_seconds.count(stage="unit") == observed + 1
+
+
+class TestSidePort:
+    def test_serves_metrics(self) -> None:
+        server = start_metrics_server(0, host="127.0.0.1")
+        try:
+            port = server.server_address[1]
+            response = httpx.get(f"http://127.0.0.1:{port}/metrics")
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/plain")
+            assert "babel_requests_total" in response.text
+            assert httpx.get(f"http://127.0.0.1:{port}/other").status_code == 404
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import httpx
+import pytest
+from babel_tower.config import Settings
+from babel_tower.normalizer import fastpath_confidence, normalize
+from babel_tower.processing import process_transcript
+
+
+class TestNormalize:
+    def test_removes_fillers_and_punctuates(self) -> None:
+        assert normalize("ja äh passt so") == "Ja passt so."
+
+    def test_keeps_existing_punctuation(self) -> None:
+        assert normalize("Okay, ähm, danke!") == "Okay, danke!"
+
+    def test_question(self) -> None:
+        assert normalize("kannst du das mergen") == "Kannst du das mergen?"
+
+    def test_numbers(self) -> None:
+        assert normalize("etwa 3 Komma 5 Prozent") == "Etwa 3,5 %."
+
+
+class TestFastpathConfidence:
+    @pytest.fixture
+    def settings(self, clean_env: pytest.MonkeyPatch) -> Settings:
+        return Settings()
+
+    def test_short_plain_text_is_confident(self, settings: Settings) -> None:
+        assert fastpath_confidence("Sieht gut aus", settings) >= 0.7
+
+    def test_fillers_lower_confidence(self, settings: Settings) -> None:
+        plain = fastpath_confidence("ja passt so", settings)
+        assert fastpath_confidence("ja äh passt ähm so", settings) < plain
+
+    @pytest.mark.parametrize(
+        "transcript",
+        [
+            "die File config punkt py",
+            "das ist Bold wichtig",
+            "ruf handleRequest auf",
+            "am Montag nein Dienstag",
+            "eins zwei drei vier fünf sechs sieben acht neun",
+        ],
+    )
+    def test_rejects_llm_work(self, settings: Settings, transcript: str) -> None:
+        assert fastpath_confidence(transcript, settings) == 0.0
+
+
+class TestProcessTranscriptFastpath:
+    @pytest.fixture
+    def fastpath_settings(self, clean_env: pytest.MonkeyPatch, tmp_path: Path) -> Settings:
+        (tmp_path / "durchreichen.md").write_text("Passthrough prompt.")
+        (tmp_path / "clean.md").write_text("Cleanup prompt.")
+        clean_env.setenv("BABEL_LLM_URL", "http://test-llm:4000")
+        clean_env.setenv("BABEL_PROMPTS_DIR", str(tmp_path))
+        return Settings(local_fastpath=True)
+
+    @pytest.mark.anyio
+    async def test_trivial_transcript_skips_llm(
+        self, fastpath_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            raise AssertionError("LLM must not be called")
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        assert await process_transcript("ja äh passt", settings=fastpath_settings) == "Ja passt."
+
+    @pytest.mark.anyio
+    async def test_explicit_mode_uses_llm(
+        self, fastpath_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            return httpx.Response(200, json={"choices": [{"message": {"content": "Bereinigt"}}]})
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        result = await process_transcript("ja passt", mode="clean", settings=fastpath_settings)
+        assert result == "Bereinigt"
@@ -3,6 +3,7 @@ from __future__ import annotations
 import sys
 import threading
 from io import BytesIO
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -25,7 +26,8 @@ from babel_tower.stt import STTError  # noqa: E402
 
 
 @pytest.fixture
-def mock_settings(clean_env: pytest.MonkeyPatch) -> Settings:
+def mock_settings(clean_env: pytest.MonkeyPatch, tmp_path: Path) -> Settings:
+    clean_env.setenv("XDG_STATE_HOME", str(tmp_path))
     clean_env.setenv("BABEL_STT_URL", "http://test:9000")
     clean_env.setenv("BABEL_LLM_URL", "http://test:4000")
     return Settings()
@@ -144,6 +146,33 @@ class TestRunPipeline:
             mock_record.assert_called_once_with(mock_settings, stop_event=stop)
 
 
+    @pytest.mark.anyio
+    async def test_custom_recorder_replaces_record_speech(self, mock_settings: Settings) -> None:
+        recorder = AsyncMock(return_value=BytesIO(b"fake"))
+        with (
+            patch("babel_tower.pipeline.record_speech", new_callable=AsyncMock) as mock_record,
+            patch(
+                "babel_tower.pipeline.transcribe",
+                new_callable=AsyncMock,
+                return_value="text",
+            ),
+            patch(
+                "babel_tower.pipeline.process_transcript",
+                new_callable=AsyncMock,
+                return_value="done",
+            ),
+            patch("babel_tower.pipeline.copy_to_clipboard", return_value=True),
+            patch("babel_tower.pipeline.notify", return_value=True),
+            patch("babel_tower.pipeline.save_audio"),
+            patch("babel_tower.pipeline.save_transcript"),
+            patch("babel_tower.pipeline.save_result"),
+        ):
+            result = await run_pipeline(settings=mock_settings, recorder=recorder)
+            assert result == "done"
+            recorder.assert_called_once_with(mock_settings, stop_event=None)
+            mock_record.assert_not_called()
+
+
 class TestRunPipelineClipboard:
     @pytest.mark.anyio
     async def test_clipboard_false_skips_copy(self, mock_settings: Settings) -> None:
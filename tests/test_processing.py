@@ -300,3 +300,171 @@ class TestFormattingFragment:
         assert isinstance(messages, list)
         system_msg: dict[str, object] = messages[0]
         assert system_msg["content"] == "Cleanup prompt."
+
+
+class TestLLMPool:
+    @pytest.fixture
+    def pool_settings(
+        self, processing_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> Settings:
+        monkeypatch.setattr("babel_tower.upstream._breakers", {})
+        monkeypatch.setattr("babel_tower.processing._latencies", {})
+        return processing_settings.model_copy(
+            update={
+                "llm_urls": "http://primary:4000,http://fallback:4000",
+                "llm_mode_models": "clean:babel-fast|babel",
+                "llm_retry_backoff": 0.0,
+            }
+        )
+
+    @pytest.mark.anyio
+    async def test_retries_next_endpoint_on_server_error(
+        self, pool_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[tuple[str, object]] = []
+
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            model = kwargs["json"]["model"]  # type: ignore[index]
+            calls.append((url.split("/v1")[0], model))
+            if url.startswith("http://primary"):
+                return httpx.Response(502, text="Bad Gateway")
+            return _llm_response("Bereinigt")
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        result = await process_transcript("Test text here", mode="clean", settings=pool_settings)
+
+        assert result == "Bereinigt"
+        assert calls == [
+            ("http://primary:4000", "babel-fast"),
+            ("http://fallback:4000", "babel-fast"),
+        ]
+
+    @pytest.mark.anyio
+    async def test_mode_without_models_uses_default(
+        self, pool_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        models: list[object] = []
+
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            models.append(kwargs["json"]["model"])  # type: ignore[index]
+            return _llm_response("ok")
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        await process_transcript("Test text here", mode="structure", settings=pool_settings)
+
+        assert models == [pool_settings.llm_model]
+
+    @pytest.mark.anyio
+    async def test_open_circuit_skips_endpoint(
+        self, pool_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        urls: list[str] = []
+
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            urls.append(url)
+            if url.startswith("http://primary"):
+                raise httpx.ConnectError("refused")
+            return _llm_response("ok")
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        for _ in range(pool_settings.llm_breaker_failures):
+            await process_transcript("Test text here", mode="clean", settings=pool_settings)
+        urls.clear()
+
+        await process_transcript("Test text here", mode="clean", settings=pool_settings)
+
+        assert len(urls) == 1
+        assert urls[0].startswith("http://fallback")
+
+    @pytest.mark.anyio
+    async def test_client_error_is_not_retried(
+        self, pool_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = 0
+
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(400, text="Bad Request")
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        with pytest.raises(ProcessingError, match="400"):
+            await process_transcript("Test text here", mode="clean", settings=pool_settings)
+        assert calls == 1
+
+    @pytest.mark.anyio
+    async def test_hedges_slow_primary_for_short_modes(
+        self, pool_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import asyncio
+
+        from babel_tower.processing import _latency_window, _llm_targets
+
+        settings = pool_settings.model_copy(
+            update={"llm_hedge_modes": "clean", "llm_hedge_min_delay": 0.01}
+        )
+        primary = _llm_targets("clean", settings)[0]
+        _latency_window(primary, "clean").samples.extend([0.01] * 20)
+
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            if url.startswith("http://primary"):
+                await asyncio.sleep(5)
+                return _llm_response("langsam")
+            return _llm_response("schnell")
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        result = await process_transcript("Test text here", mode="clean", settings=settings)
+
+        assert result == "schnell"
+
+
+class TestPromptAssembly:
+    def test_prompt_is_byte_stable_across_whitespace_edits(
+        self, processing_settings: Settings, prompts_dir: Path
+    ) -> None:
+        from babel_tower.processing import _load_prompt
+
+        before = _load_prompt("clean", processing_settings)
+        (prompts_dir / "clean.md").write_text("Cleanup prompt.  \r\n\r\n")
+
+        assert _load_prompt("clean", processing_settings) == before
+
+    def test_prompt_reloads_after_edit(
+        self, processing_settings: Settings, prompts_dir: Path
+    ) -> None:
+        import os
+
+        from babel_tower.processing import _load_prompt
+
+        _load_prompt("clean", processing_settings)
+        prompt_file = prompts_dir / "clean.md"
+        prompt_file.write_text("New cleanup prompt.")
+        stat = prompt_file.stat()
+        os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert _load_prompt("clean", processing_settings).endswith("New cleanup prompt.")
+
+    @pytest.mark.anyio
+    async def test_usage_recorded_per_mode(
+        self, processing_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from babel_tower.metrics import llm_tokens_total
+
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={
+                    "choices": [{"message": {"content": "Strukturiert"}}],
+                    "usage": {
+                        "prompt_tokens": 300,
+                        "completion_tokens": 7,
+                        "prompt_tokens_details": {"cached_tokens": 256},
+                    },
+                },
+            )
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        before = llm_tokens_total.value(mode="structure", kind="cached")
+        await process_transcript("Langer Text", mode="structure", settings=processing_settings)
+
+        assert llm_tokens_total.value(mode="structure", kind="cached") == before + 256
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import sys
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+# sounddevice requires PortAudio at import time; stub it for CI/headless environments
+if "sounddevice" not in sys.modules:
+    sys.modules["sounddevice"] = MagicMock()
+
+from babel_tower.config import Settings  # noqa: E402
+from babel_tower.pipeline import run_revise_pipeline  # noqa: E402
+from babel_tower.revision import RevisionChain, resume_chain, save_chain  # noqa: E402
+from babel_tower.state import load_result, save_result  # noqa: E402
+
+
+@pytest.fixture
+def revise_settings(clean_env: pytest.MonkeyPatch, tmp_path: Path) -> Settings:
+    clean_env.setenv("XDG_STATE_HOME", str(tmp_path))
+    return Settings(llm_url="http://llm:4000", revise_max_turns=2)
+
+
+class TestResumeChain:
+    def test_continues_when_last_result_is_latest_revision(self, revise_settings: Settings) -> None:
+        chain = RevisionChain("Entwurf")
+        chain.append("u1", "Fassung 1")
+        save_chain(chain)
+
+        resumed = resume_chain("Fassung 1\n", revise_settings)
+
+        assert resumed == chain
+        assert resumed.context() == "## Änderungsanweisungen"
+        assert resumed.history() == [
+            {"role": "user", "content": "u1"},
+            {"role": "assistant", "content": "Fassung 1"},
+        ]
+
+    def test_new_chain_when_result_changed(self, revise_settings: Settings) -> None:
+        chain = RevisionChain("Entwurf")
+        chain.append("u1", "Fassung 1")
+        save_chain(chain)
+
+        resumed = resume_chain("ein neues Diktat", revise_settings)
+
+        assert resumed == RevisionChain("ein neues Diktat")
+        assert resumed.context().startswith("## Originaltext\n\nein neues Diktat")
+
+    def test_rebases_after_max_turns(self, revise_settings: Settings) -> None:
+        chain = RevisionChain("Entwurf", [("u1", "Fassung 1"), ("u2", "Fassung 2")])
+        save_chain(chain)
+
+        assert resume_chain("Fassung 2", revise_settings) == RevisionChain("Fassung 2")
+
+    def test_disabled_with_zero_turns(self, revise_settings: Settings) -> None:
+        save_chain(RevisionChain("Entwurf", [("u1", "Fassung 1")]))
+        settings = revise_settings.model_copy(update={"revise_max_turns": 0})
+
+        assert resume_chain("Fassung 1", settings).turns == []
+
+
+class TestRevisePipelineSession:
+    @pytest.mark.anyio
+    async def test_follow_up_replays_history_as_chat_turns(
+        self, revise_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        payloads: list[dict[str, object]] = []
+        replies = iter(["Fassung 1", "Fassung 2"])
+
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            payloads.append(kwargs["json"])  # type: ignore[arg-type]
+            body = {"choices": [{"message": {"content": next(replies)}}]}
+            return httpx.Response(200, json=body, request=httpx.Request("POST", url))
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        save_result("Entwurf")
+        with (
+            patch("babel_tower.pipeline.record_speech", AsyncMock(return_value=BytesIO(b"x"))),
+            patch(
+                "babel_tower.pipeline.transcribe", AsyncMock(side_effect=["kürzer", "förmlicher"])
+            ),
+            patch("babel_tower.pipeline.copy_to_clipboard"),
+            patch("babel_tower.pipeline.notify"),
+        ):
+            await run_revise_pipeline(settings=revise_settings)
+            result = await run_revise_pipeline(settings=revise_settings)
+
+        assert result == "Fassung 2" == load_result()
+        first, second = (p["messages"] for p in payloads)
+        assert first[1]["content"] == (  # type: ignore[index]
+            "<<<TRANSKRIPT>>>\n## Originaltext\n\nEntwurf\n\n"
+            "## Änderungsanweisungen\n\nkürzer\n<<<ENDE>>>"
+        )
+        # The second request extends the first one verbatim
+        assert second[: len(first)] == first  # type: ignore[index]
+        assert second[2:] == [  # type: ignore[index]
+            {"role": "assistant", "content": "Fassung 1"},
+            {
+                "role": "user",
+                "content": "<<<TRANSKRIPT>>>\n## Änderungsanweisungen\n\nförmlicher\n<<<ENDE>>>",
+            },
+        ]
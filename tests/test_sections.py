@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import sys
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# sounddevice requires PortAudio at import time; stub it for CI/headless environments
+if "sounddevice" not in sys.modules:
+    sys.modules["sounddevice"] = MagicMock()
+
+from babel_tower.config import Settings  # noqa: E402
+from babel_tower.pipeline import run_revise_pipeline  # noqa: E402
+from babel_tower.sections import parse_locator, revise_sections, split_sections  # noqa: E402
+
+_DOCUMENT = """# Titel
+
+Erster Absatz.
+
+## Konfiguration
+
+Zweiter Absatz
+über zwei Zeilen.
+
+```python
+x = 1
+
+y = 2
+```
+
+Dritter Absatz.
+
+Vierter Absatz."""
+
+
+@pytest.fixture
+def targeted_settings(clean_env: pytest.MonkeyPatch, tmp_path: Path) -> Settings:
+    clean_env.setenv("XDG_STATE_HOME", str(tmp_path))
+    return Settings(revise_targeted=True, revise_targeted_min_sections=4)
+
+
+class TestSplitSections:
+    def test_headings_attach_and_fences_stay_whole(self) -> None:
+        assert split_sections(_DOCUMENT) == [
+            "# Titel\n\nErster Absatz.",
+            "## Konfiguration\n\nZweiter Absatz\nüber zwei Zeilen.",
+            "```python\nx = 1\n\ny = 2\n```",
+            "Dritter Absatz.",
+            "Vierter Absatz.",
+        ]
+
+    def test_parse_locator(self) -> None:
+        assert parse_locator("2, 5", 5) == [1, 4]
+        assert parse_locator("Abschnitt 9", 5) is None
+        assert parse_locator("ALLE", 5) is None
+
+
+class TestReviseSections:
+    @pytest.mark.anyio
+    async def test_rewrites_only_located_sections(self, targeted_settings: Settings) -> None:
+        calls: list[tuple[str | None, str | None]] = []
+
+        async def fake_process(
+            text: str, mode: str | None, settings: Settings, context: str | None
+        ) -> str:
+            calls.append((mode, context))
+            if mode == "revise-locate":
+                return "2"
+            return "## Konfiguration\n\nKürzer."
+
+        with patch("babel_tower.sections.process_transcript", fake_process):
+            result = await revise_sections(_DOCUMENT, "kürzer", targeted_settings)
+
+        assert result == _DOCUMENT.replace("Zweiter Absatz\nüber zwei Zeilen.", "Kürzer.")
+        assert len(calls) == 2
+        assert "[5]\nVierter Absatz." in (calls[0][1] or "")
+        assert calls[1][1] == (
+            "## Originaltext (Ausschnitt)\n\n## Konfiguration\n\nZweiter Absatz\n"
+            "über zwei Zeilen.\n\n## Änderungsanweisungen"
+        )
+
+    @pytest.mark.anyio
+    async def test_empty_revision_drops_section(self, targeted_settings: Settings) -> None:
+        async def fake_process(
+            text: str, mode: str | None, settings: Settings, context: str | None
+        ) -> str:
+            return "4" if mode == "revise-locate" else ""
+
+        with patch("babel_tower.sections.process_transcript", fake_process):
+            result = await revise_sections(_DOCUMENT, "streich das", targeted_settings)
+
+        assert result is not None and "Dritter Absatz." not in result
+
+    @pytest.mark.anyio
+    async def test_whole_text_instruction_falls_back(self, targeted_settings: Settings) -> None:
+        locate = AsyncMock(return_value="ALLE")
+        with patch("babel_tower.sections.process_transcript", locate):
+            assert await revise_sections(_DOCUMENT, "förmlicher", targeted_settings) is None
+        locate.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_short_document_skips_locator(self, targeted_settings: Settings) -> None:
+        locate = AsyncMock()
+        with patch("babel_tower.sections.process_transcript", locate):
+            assert await revise_sections("Nur ein Absatz.", "kürzer", targeted_settings) is None
+        locate.assert_not_awaited()
+
+
+class TestTargetedRevisePipeline:
+    @pytest.mark.anyio
+    async def test_falls_back_to_full_revision(self, targeted_settings: Settings) -> None:
+        with (
+            patch("babel_tower.pipeline.load_result", return_value=_DOCUMENT),
+            patch("babel_tower.pipeline.record_speech", AsyncMock(return_value=BytesIO(b"x"))),
+            patch("babel_tower.pipeline.transcribe", AsyncMock(return_value="alles förmlicher")),
+            patch("babel_tower.pipeline.revise_sections", AsyncMock(return_value=None)) as targeted,
+            patch(
+                "babel_tower.pipeline.process_transcript", AsyncMock(return_value="Förmlich.")
+            ) as full,
+            patch("babel_tower.pipeline.copy_to_clipboard"),
+            patch("babel_tower.pipeline.notify"),
+            patch("babel_tower.pipeline.save_result"),
+        ):
+            result = await run_revise_pipeline(settings=targeted_settings)
+
+        assert result == "Förmlich."
+        targeted.assert_awaited_once_with(_DOCUMENT, "alles förmlicher", targeted_settings)
+        full.assert_awaited_once()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+from babel_tower.config import Settings
+from babel_tower.sessions import SessionSettings
+
+
+@pytest.fixture
+def base(clean_env: pytest.MonkeyPatch) -> Settings:
+    return Settings(mcp_session_idle_seconds=60.0)
+
+
+class TestSessionSettings:
+    def test_untouched_sessions_share_base(self, base: Settings) -> None:
+        sessions = SessionSettings(lambda: base)
+        assert sessions.get("a") is base
+        assert len(sessions) == 0
+
+    def test_overlay_is_copied_once(self, base: Settings) -> None:
+        sessions = SessionSettings(lambda: base)
+        overlay = sessions.update("a", stt_model="small")
+
+        assert overlay.stt_model == "small"
+        assert base.stt_model != "small"
+        assert sessions.get("a") is overlay
+        assert sessions.get("b") is base
+
+    def test_overlay_follows_reloaded_base(self, base: Settings) -> None:
+        current = [base]
+        sessions = SessionSettings(lambda: current[0])
+        sessions.update("a", default_mode="structure")
+
+        current[0] = base.model_copy(update={"stt_language": "en"})
+        overlay = sessions.get("a")
+
+        assert overlay.stt_language == "en"
+        assert overlay.default_mode == "structure"
+
+    def test_idle_sessions_are_evicted(
+        self, base: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        now = [1000.0]
+        monkeypatch.setattr("babel_tower.sessions.time.monotonic", lambda: now[0])
+        sessions = SessionSettings(lambda: base)
+        sessions.update("idle", default_mode="structure")
+        now[0] += 30
+        sessions.update("active", default_mode="durchreichen")
+
+        now[0] += 45
+        assert sessions.get("active").default_mode == "durchreichen"
+
+        assert len(sessions) == 1
+        assert sessions.get("idle") is base
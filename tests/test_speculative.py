@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# sounddevice requires PortAudio at import time; stub it for CI/headless environments
+if "sounddevice" not in sys.modules:
+    sys.modules["sounddevice"] = MagicMock()
+
+from babel_tower.audio import SegmentCallback  # noqa: E402
+from babel_tower.config import Settings  # noqa: E402
+from babel_tower.pipeline import run_pipeline  # noqa: E402
+from babel_tower.speculative import SpeculativeProcessor, speculative_mode  # noqa: E402
+from babel_tower.stt import STTError  # noqa: E402
+
+
+@pytest.fixture
+def spec_settings(clean_env: pytest.MonkeyPatch) -> Settings:
+    return Settings(speculative_modes="clean,structure", speculative_paragraph_words=4)
+
+
+async def _fake_transcribe(audio: BytesIO, _settings: Settings) -> str:
+    # Later segments finish first, so ordering is exercised
+    text = audio.getvalue().decode()
+    await asyncio.sleep(0.01 if text.startswith("Eins") else 0)
+    return text
+
+
+class TestSpeculativeMode:
+    def test_uses_default_mode_for_auto(self, spec_settings: Settings) -> None:
+        assert speculative_mode(None, spec_settings) == "clean"
+
+    def test_off_for_other_modes(self, spec_settings: Settings) -> None:
+        assert speculative_mode("durchreichen", spec_settings) is None
+
+    def test_off_without_multi_segment_recording(self, spec_settings: Settings) -> None:
+        settings = spec_settings.model_copy(update={"inter_segment_timeout": 0.0})
+        assert speculative_mode("clean", settings) is None
+
+
+class TestSpeculativeProcessor:
+    @pytest.mark.anyio
+    async def test_paragraphs_processed_during_recording_in_order(
+        self, spec_settings: Settings
+    ) -> None:
+        calls: list[str] = []
+
+        async def fake_process(text: str, mode: str | None, _settings: Settings) -> str:
+            calls.append(text)
+            return f"[{mode}] {text}"
+
+        with (
+            patch("babel_tower.speculative.transcribe", _fake_transcribe),
+            patch("babel_tower.speculative.process_transcript", fake_process),
+        ):
+            spec = SpeculativeProcessor("clean", spec_settings)
+            for text in ("Eins zwei", "drei vier.", "fünf sechs"):
+                await asyncio.to_thread(spec.on_segment, BytesIO(text.encode()))
+            await asyncio.sleep(0.05)
+            assert calls == ["Eins zwei drei vier."]
+
+            transcript = await spec.transcript()
+            result = await spec.process(transcript)
+
+        assert transcript == "Eins zwei drei vier. fünf sechs"
+        assert calls == ["Eins zwei drei vier.", "fünf sechs"]
+        assert result == "[clean] Eins zwei drei vier.\n\n[clean] fünf sechs"
+
+    @pytest.mark.anyio
+    async def test_short_dictation_uses_requested_mode(self, spec_settings: Settings) -> None:
+        modes: list[str | None] = []
+
+        async def fake_process(text: str, mode: str | None, _settings: Settings) -> str:
+            modes.append(mode)
+            return text
+
+        with (
+            patch("babel_tower.speculative.transcribe", _fake_transcribe),
+            patch("babel_tower.speculative.process_transcript", fake_process),
+        ):
+            spec = SpeculativeProcessor(None, spec_settings)
+            spec.on_segment(BytesIO(b"ja passt"))
+            await asyncio.sleep(0)
+            await spec.process(await spec.transcript())
+
+        assert modes == [None]
+
+    @pytest.mark.anyio
+    async def test_structure_reconciliation(self, spec_settings: Settings) -> None:
+        settings = spec_settings.model_copy(update={"speculative_reconcile": True})
+        calls: list[str] = []
+
+        async def fake_process(text: str, mode: str | None, _settings: Settings) -> str:
+            calls.append(text)
+            return text.upper()
+
+        with (
+            patch("babel_tower.speculative.transcribe", _fake_transcribe),
+            patch("babel_tower.speculative.process_transcript", fake_process),
+        ):
+            spec = SpeculativeProcessor("structure", settings)
+            for text in ("drei vier fünf sechs.", "sieben"):
+                spec.on_segment(BytesIO(text.encode()))
+                await asyncio.sleep(0)
+            result = await spec.process(await spec.transcript())
+
+        assert calls[-1] == "DREI VIER FÜNF SECHS.\n\nSIEBEN"
+        assert result == "DREI VIER FÜNF SECHS.\n\nSIEBEN"
+
+
+class TestSpeculativePipeline:
+    @pytest.mark.anyio
+    async def test_recorder_segments_feed_speculation(self, spec_settings: Settings) -> None:
+        async def recorder(
+            _settings: Settings, stop_event: threading.Event | None, on_segment: SegmentCallback
+        ) -> BytesIO:
+            def capture() -> None:
+                for text in ("Eins zwei drei vier.", "fünf"):
+                    on_segment(BytesIO(text.encode()))
+
+            await asyncio.to_thread(capture)
+            return BytesIO(b"full recording")
+
+        async def fake_process(text: str, mode: str | None, _settings: Settings) -> str:
+            return text.upper()
+
+        whole = MagicMock(side_effect=AssertionError("whole recording must not be transcribed"))
+        with (
+            patch("babel_tower.speculative.transcribe", _fake_transcribe),
+            patch("babel_tower.speculative.process_transcript", fake_process),
+            patch("babel_tower.pipeline.transcribe", whole),
+            patch("babel_tower.pipeline.notify"),
+            patch("babel_tower.pipeline.save_audio"),
+            patch("babel_tower.pipeline.save_transcript"),
+            patch("babel_tower.pipeline.save_result"),
+        ):
+            result = await run_pipeline(
+                mode="clean", settings=spec_settings, clipboard=False, recorder=recorder
+            )
+
+        assert result == "EINS ZWEI DREI VIER.\n\nFÜNF"
+
+    @pytest.mark.anyio
+    async def test_segment_stt_error_falls_back_to_whole_recording(
+        self, spec_settings: Settings
+    ) -> None:
+        async def recorder(
+            _settings: Settings, stop_event: threading.Event | None, on_segment: SegmentCallback
+        ) -> BytesIO:
+            await asyncio.to_thread(on_segment, BytesIO(b"kaputt"))
+            return BytesIO(b"full recording")
+
+        async def failing_transcribe(_audio: BytesIO, _settings: Settings) -> str:
+            raise STTError("boom")
+
+        async def whole(_audio: BytesIO, _settings: Settings) -> str:
+            return "ganze Aufnahme"
+
+        async def fake_process(text: str, mode: str | None, _settings: Settings) -> str:
+            return text
+
+        with (
+            patch("babel_tower.speculative.transcribe", failing_transcribe),
+            patch("babel_tower.pipeline.transcribe", whole),
+            patch("babel_tower.pipeline.process_transcript", fake_process),
+            patch("babel_tower.pipeline.notify"),
+            patch("babel_tower.pipeline.save_audio"),
+            patch("babel_tower.pipeline.save_transcript"),
+            patch("babel_tower.pipeline.save_result"),
+        ):
+            result = await run_pipeline(
+                mode="clean", settings=spec_settings, clipboard=False, recorder=recorder
+            )
+
+        assert result == "ganze Aufnahme"
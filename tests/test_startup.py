@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+from babel_tower.startup import StartupReport, parse_importtime
+
+_IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:      1500 |       1500 |       torch._C
+import time:       400 |       1900 |     torch.nn
+import time:       300 |       2200 |   torch
+import time:       200 |        200 |   numpy
+import time:       100 |       2500 | babel_tower.audio
+"""
+
+
+class TestParseImporttime:
+    def test_parses_timings_and_depth(self) -> None:
+        timings = parse_importtime(_IMPORTTIME)
+
+        assert len(timings) == 6
+        assert timings[1].module == "torch._C"
+        assert timings[1].self_us == 1500
+        assert timings[1].depth == 3
+        assert timings[-1].module == "babel_tower.audio"
+        assert timings[-1].cumulative_us == 2500
+        assert timings[-1].depth == 0
+
+    def test_ignores_unrelated_lines(self) -> None:
+        assert parse_importtime("Traceback (most recent call last):\nhello") == []
+
+
+class TestStartupReport:
+    def test_packages_ranked_by_outermost_cumulative(self) -> None:
+        report = StartupReport(total_s=1.0, phases={}, imports=parse_importtime(_IMPORTTIME))
+
+        packages = report.packages(limit=3)
+
+        assert packages == [("babel_tower", 0.0025), ("torch", 0.0022), ("numpy", 0.0002)]
+
+
+class TestLazyImports:
+    def test_audio_import_does_not_load_torch(self) -> None:
+        code = (
+            "import sys; from unittest.mock import MagicMock; "
+            "sys.modules.setdefault('sounddevice', MagicMock()); "
+            "import babel_tower.pipeline; print('torch' in sys.modules)"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+        )
+
+        assert result.stdout.strip() == "False"
@@ -213,3 +213,49 @@ class TestApplyCorrections:
         monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
         result = await transcribe(_wav_bytes(), settings)
         assert result == "Ich nutze Claude"
+
+
+class TestSTTRouting:
+    @pytest.fixture
+    def routed_settings(self, clean_env: pytest.MonkeyPatch) -> Settings:
+        clean_env.setenv("BABEL_STT_URLS", "http://gpu-stt:9000=2,http://cpu-stt:9001")
+        clean_env.setattr("babel_tower.upstream._pools", {})
+        return Settings()
+
+    @pytest.mark.anyio
+    async def test_fails_over_on_connect_error(
+        self, routed_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        urls: list[str] = []
+
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            urls.append(url)
+            if url.startswith("http://gpu-stt"):
+                raise httpx.ConnectError("refused")
+            return httpx.Response(200, json={"text": "vom CPU"})
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        assert await transcribe(_wav_bytes(), routed_settings) == "vom CPU"
+        assert [u.split("/v1")[0] for u in urls] == ["http://gpu-stt:9000", "http://cpu-stt:9001"]
+
+        # The failed endpoint is ejected, so the next request goes straight to the CPU
+        urls.clear()
+        await transcribe(_wav_bytes(), routed_settings)
+        assert len(urls) == 1
+        assert urls[0].startswith("http://cpu-stt")
+
+    @pytest.mark.anyio
+    async def test_server_error_is_not_retried(
+        self, routed_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = 0
+
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(503, text="busy")
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        with pytest.raises(STTError, match="503"):
+            await transcribe(_wav_bytes(), routed_settings)
+        assert calls == 1
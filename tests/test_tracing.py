@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# sounddevice requires PortAudio at import time; stub it for CI/headless environments
+if "sounddevice" not in sys.modules:
+    sys.modules["sounddevice"] = MagicMock()
+
+from babel_tower.config import Settings  # noqa: E402
+from babel_tower.pipeline import process_file  # noqa: E402
+from babel_tower.tracing import _to_otlp, _Trace, record_span, span, trace  # noqa: E402
+
+
+@pytest.fixture
+def state_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path))
+    return tmp_path / "babel_tower"
+
+
+@pytest.fixture
+def jsonl_settings(clean_env: pytest.MonkeyPatch) -> Settings:
+    clean_env.setenv("BABEL_TRACE_EXPORT", "jsonl")
+    return Settings()
+
+
+def _read_traces(state_dir: Path) -> list[dict[str, object]]:
+    lines = (state_dir / "traces.jsonl").read_text().splitlines()
+    return [json.loads(line) for line in lines]
+
+
+class TestSpan:
+    def test_noop_outside_trace(self) -> None:
+        with span("orphan") as current:
+            assert current is None
+
+    def test_off_records_nothing(self, state_dir: Path, clean_env: pytest.MonkeyPatch) -> None:
+        with trace("run", Settings()), span("stage") as current:
+            assert current is None
+        assert not (state_dir / "traces.jsonl").exists()
+
+
+class TestJsonLinesExport:
+    def test_writes_nested_spans(self, state_dir: Path, jsonl_settings: Settings) -> None:
+        with trace("run", jsonl_settings, mode="clean"):
+            with span("stt"):
+                pass
+            with span("llm"):
+                record_span("llm_ttfb", 1, 2)
+
+        (record,) = _read_traces(state_dir)
+        assert record["name"] == "run"
+        spans = {s["name"]: s for s in record["spans"]}  # type: ignore[union-attr]
+        assert set(spans) == {"run", "stt", "llm", "llm_ttfb"}
+        assert spans["stt"]["parent_id"] == spans["run"]["span_id"]
+        assert spans["llm_ttfb"]["parent_id"] == spans["llm"]["span_id"]
+        assert spans["run"]["attributes"] == {"mode": "clean"}
+
+    def test_nested_trace_becomes_child_span(
+        self, state_dir: Path, jsonl_settings: Settings
+    ) -> None:
+        with trace("converse", jsonl_settings), trace("pipeline", jsonl_settings):
+            pass
+
+        (record,) = _read_traces(state_dir)
+        names = [s["name"] for s in record["spans"]]  # type: ignore[union-attr]
+        assert names == ["converse", "pipeline"]
+
+    def test_error_recorded_on_span(self, state_dir: Path, jsonl_settings: Settings) -> None:
+        with pytest.raises(ValueError), trace("run", jsonl_settings), span("stt"):
+            raise ValueError("boom")
+
+        (record,) = _read_traces(state_dir)
+        stt = next(s for s in record["spans"] if s["name"] == "stt")  # type: ignore[union-attr]
+        assert stt["attributes"] == {"error": "ValueError"}
+
+
+class TestOtlpExport:
+    def test_payload_shape(self, clean_env: pytest.MonkeyPatch) -> None:
+        active = _Trace(trace_id="a" * 32, settings=Settings())
+        with patch("babel_tower.tracing._current_trace") as current:
+            current.get.return_value = active
+            record_span("stt", 1_000, 2_000, upload_bytes=42)
+
+        payload = _to_otlp(active)
+        (otlp_span,) = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]  # type: ignore[index]
+        assert otlp_span["traceId"] == "a" * 32
+        assert otlp_span["startTimeUnixNano"] == "1000"
+        assert otlp_span["attributes"] == [{"key": "upload_bytes", "value": {"intValue": "42"}}]
+
+    def test_posts_to_collector(self, clean_env: pytest.MonkeyPatch) -> None:
+        clean_env.setenv("BABEL_TRACE_EXPORT", "otlp")
+        clean_env.setenv("BABEL_TRACE_OTLP_URL", "http://collector:4318/v1/traces")
+        with patch("babel_tower.tracing.threading.Thread") as mock_thread:
+            with trace("run", Settings()):
+                pass
+            args = mock_thread.call_args.kwargs["args"]
+            assert args[0] == "http://collector:4318/v1/traces"
+            mock_thread.return_value.start.assert_called_once()
+
+
+class TestPipelineTracing:
+    @pytest.mark.anyio
+    async def test_process_file_records_stages(
+        self, state_dir: Path, jsonl_settings: Settings, tmp_path: Path
+    ) -> None:
+        audio = tmp_path / "in.wav"
+        audio.write_bytes(b"RIFF")
+        with (
+            patch("babel_tower.pipeline.transcribe", new_callable=AsyncMock, return_value="t"),
+            patch(
+                "babel_tower.pipeline.process_transcript",
+                new_callable=AsyncMock,
+                return_value="done",
+            ),
+            patch("babel_tower.pipeline.copy_to_clipboard", return_value=True),
+            patch("babel_tower.pipeline.notify", return_value=True),
+            patch("babel_tower.pipeline.save_transcript"),
+            patch("babel_tower.pipeline.save_result"),
+        ):
+            await process_file(str(audio), settings=jsonl_settings)
+
+        (record,) = _read_traces(state_dir)
+        assert record["name"] == "process_file"
+        assert [s["name"] for s in record["spans"]] == ["process_file", "output"]  # type: ignore[union-attr]
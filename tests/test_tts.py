@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import sys
+from io import BytesIO
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
+import numpy as np
 import pytest
+import soundfile as sf
 
 # sounddevice requires PortAudio at import time; stub it for CI/headless environments
 if "sounddevice" not in sys.modules:
@@ -161,3 +164,54 @@ class TestPlayAudioBlocking:
             mock_read.assert_called_once()
             mock_play.assert_called_once_with(mock_data, mock_sr)
             mock_wait.assert_called_once()
+
+
+def _wav(samples: np.ndarray, sr: int = 1000) -> bytes:
+    buf = BytesIO()
+    sf.write(buf, samples, sr, format="WAV", subtype="FLOAT")
+    return buf.getvalue()
+
+
+class TestPlayback:
+    def test_level_zero_before_start(self) -> None:
+        from babel_tower.tts import Playback
+
+        playback = Playback(_wav(np.full(1000, 0.5, dtype=np.float32)))
+        assert playback.level() == 0.0
+
+    def test_level_tracks_play_position(self) -> None:
+        from babel_tower.tts import Playback
+
+        loud_then_silent = np.concatenate(
+            [np.full(500, 0.5, dtype=np.float32), np.zeros(500, dtype=np.float32)]
+        )
+        playback = Playback(_wav(loud_then_silent))
+        with (
+            patch("babel_tower.tts.sd.play"),
+            patch("babel_tower.tts.time.monotonic", side_effect=[100.0, 100.1, 100.9]),
+        ):
+            playback.start()
+            assert playback.level() == pytest.approx(0.5, abs=1e-3)
+            assert playback.level() == 0.0
+
+    def test_stop_silences_level(self) -> None:
+        from babel_tower.tts import Playback
+
+        playback = Playback(_wav(np.full(1000, 0.5, dtype=np.float32)))
+        with patch("babel_tower.tts.sd.play"), patch("babel_tower.tts.sd.stop") as mock_stop:
+            playback.start()
+            playback.stop()
+            playback.stop()
+            mock_stop.assert_called_once()
+        assert playback.level() == 0.0
+
+    def test_is_echo_compares_against_playback_level(self) -> None:
+        from babel_tower.tts import Playback
+
+        playback = Playback(_wav(np.full(1000, 0.5, dtype=np.float32)))
+        with patch("babel_tower.tts.sd.play"):
+            playback.start()
+        quiet = np.full(512, 0.1, dtype=np.float32)
+        loud = np.full(512, 0.4, dtype=np.float32)
+        assert playback.is_echo(quiet, ratio=0.5)
+        assert not playback.is_echo(loud, ratio=0.5)
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from babel_tower.upstream import EndpointPool, hedged, parse_endpoints
+
+
+class TestParseEndpoints:
+    def test_falls_back_to_default_url(self) -> None:
+        assert parse_endpoints("", "http://stt:9000/") == [("http://stt:9000", 1.0)]
+
+    def test_parses_weights(self) -> None:
+        raw = "http://gpu:9000=3, http://cpu:9001"
+        assert parse_endpoints(raw, "unused") == [
+            ("http://gpu:9000", 3.0),
+            ("http://cpu:9001", 1.0),
+        ]
+
+
+class TestEndpointPool:
+    def test_prefers_least_outstanding_per_weight(self) -> None:
+        pool = EndpointPool([("http://gpu", 3.0), ("http://cpu", 1.0)])
+        gpu, cpu = pool.endpoints
+
+        picks = []
+        for _ in range(4):
+            endpoint = pool.pick()
+            assert endpoint is not None
+            endpoint.outstanding += 1
+            picks.append(endpoint.url)
+
+        assert picks.count("http://gpu") == 3
+        assert picks.count("http://cpu") == 1
+
+    def test_skips_ejected_endpoint(self) -> None:
+        pool = EndpointPool([("http://a", 1.0), ("http://b", 1.0)])
+        pool.eject(pool.endpoints[0])
+        assert pool.pick() is pool.endpoints[1]
+
+    def test_all_ejected_still_returns_endpoint(self) -> None:
+        pool = EndpointPool([("http://a", 1.0), ("http://b", 1.0)])
+        for endpoint in pool.endpoints:
+            pool.eject(endpoint)
+        assert pool.pick() is not None
+
+    def test_p95_needs_enough_samples(self) -> None:
+        pool = EndpointPool([("http://a", 1.0)])
+        endpoint = pool.endpoints[0]
+        endpoint.samples.extend([0.1] * 5)
+        assert endpoint.p95() is None
+        endpoint.samples.extend([0.1] * 18 + [2.0] * 2)
+        assert endpoint.p95() == 2.0
+
+
+class TestHedged:
+    @pytest.mark.anyio
+    async def test_fast_primary_never_hedges(self) -> None:
+        calls: list[str] = []
+
+        async def primary() -> str:
+            calls.append("primary")
+            return "primary"
+
+        async def backup() -> str:
+            calls.append("backup")
+            return "backup"
+
+        assert await hedged("test", primary, backup, delay=0.5) == "primary"
+        assert calls == ["primary"]
+
+    @pytest.mark.anyio
+    async def test_slow_primary_loses_to_backup(self) -> None:
+        cancelled = asyncio.Event()
+
+        async def primary() -> str:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "primary"
+
+        async def backup() -> str:
+            return "backup"
+
+        assert await hedged("test", primary, backup, delay=0.01) == "backup"
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+    @pytest.mark.anyio
+    async def test_failed_backup_waits_for_primary(self) -> None:
+        async def primary() -> str:
+            await asyncio.sleep(0.05)
+            return "primary"
+
+        async def backup() -> str:
+            raise RuntimeError("down")
+
+        assert await hedged("test", primary, backup, delay=0.01) == "primary"
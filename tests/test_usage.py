@@ -0,0 +1,62 @@
+import json
+
+import pytest
+from babel_tower.usage import Usage, parse_usage, summarize
+
+
+class TestParseUsage:
+    def test_openai_cached_tokens(self) -> None:
+        response = {
+            "usage": {
+                "prompt_tokens": 1200,
+                "completion_tokens": 40,
+                "prompt_tokens_details": {"cached_tokens": 1024},
+            }
+        }
+        assert parse_usage(response) == Usage(1200, 40, 1024)
+
+    def test_litellm_cache_read_fallback(self) -> None:
+        response = {
+            "usage": {"prompt_tokens": 900, "completion_tokens": 12, "cache_read_input_tokens": 800}
+        }
+        assert parse_usage(response) == Usage(900, 12, 800)
+
+    def test_missing_usage(self) -> None:
+        assert parse_usage({"choices": []}) is None
+
+
+def _trace_line(mode: str, prompt: int, completion: int, cached: int, duration_ms: float) -> str:
+    span = {
+        "name": "llm_request",
+        "duration_ms": duration_ms,
+        "attributes": {
+            "mode": mode,
+            "prompt_tokens": prompt,
+            "completion_tokens": completion,
+            "cached_tokens": cached,
+        },
+    }
+    return json.dumps({"trace_id": "t", "spans": [{"name": "pipeline"}, span]})
+
+
+class TestSummarize:
+    def test_fit_separates_prefill_and_decode(self) -> None:
+        # 50 ms overhead, 0.2 ms per uncached prompt token, 20 ms per completion token
+        requests = [(1000, 10, 0), (1000, 30, 800), (2000, 20, 1000), (500, 40, 0)]
+        lines = [_trace_line("clean", p, c, k, 50 + 0.2 * (p - k) + 20 * c) for p, c, k in requests]
+
+        (summary,) = summarize(lines)
+
+        assert summary.mode == "clean"
+        assert summary.requests == 4
+        assert summary.cached_ratio == pytest.approx(1800 / 4500)
+        assert summary.prefill_ms_per_1k == pytest.approx(200)
+        assert summary.decode_ms_per_token == pytest.approx(20)
+        assert summary.prompt_share is not None and 0 < summary.prompt_share < 1
+
+    def test_too_few_requests_skip_fit(self) -> None:
+        (summary,) = summarize([_trace_line("structure", 1000, 100, 0, 2500.0), "not json"])
+
+        assert summary.latency_s == pytest.approx(2.5)
+        assert summary.completion_tokens_per_s == pytest.approx(40)
+        assert summary.prefill_ms_per_1k is None
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+# sounddevice requires PortAudio at import time; stub it for CI/headless environments
+if "sounddevice" not in sys.modules:
+    sys.modules["sounddevice"] = MagicMock()
+
+import babel_tower.warmup as warmup  # noqa: E402
+from babel_tower.config import Settings  # noqa: E402
+from babel_tower.pipeline import run_pipeline  # noqa: E402
+
+
+@pytest.fixture
+def warm_settings(clean_env: pytest.MonkeyPatch, monkeypatch: pytest.MonkeyPatch) -> Settings:
+    monkeypatch.setattr(warmup, "_last_warm_up", 0.0)
+    monkeypatch.setattr(warmup, "_in_flight", None)
+    return Settings(
+        stt_urls="http://stt-a:9000,http://stt-b:9000",
+        llm_url="http://llm:4000",
+        llm_model="babel",
+        llm_mode_models="clean:babel-fast|babel",
+    )
+
+
+class TestWarmUp:
+    @pytest.mark.anyio
+    async def test_warms_every_stt_endpoint_and_llm_model(
+        self, warm_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        posts: list[tuple[str, object]] = []
+
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            posts.append((url, kwargs.get("json")))
+            return httpx.Response(200, json={}, request=httpx.Request("POST", url))
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        results = await warmup.warm_up(warm_settings)
+
+        urls = sorted(url for url, _ in posts)
+        assert urls == [
+            "http://llm:4000/v1/chat/completions",
+            "http://llm:4000/v1/chat/completions",
+            "http://stt-a:9000/v1/audio/transcriptions",
+            "http://stt-b:9000/v1/audio/transcriptions",
+        ]
+        completions = [payload for _, payload in posts if payload is not None]
+        assert sorted(p["model"] for p in completions) == ["babel", "babel-fast"]  # type: ignore[index]
+        assert all(p["max_tokens"] == 1 for p in completions)  # type: ignore[index]
+        assert all(seconds is not None for seconds in results.values())
+
+    @pytest.mark.anyio
+    async def test_failures_are_reported_not_raised(
+        self, warm_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def mock_post(self: httpx.AsyncClient, url: str, **kwargs: object) -> httpx.Response:
+            raise httpx.ConnectError("refused")
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        results = await warmup.warm_up(warm_settings)
+
+        assert results and all(seconds is None for seconds in results.values())
+
+    @pytest.mark.anyio
+    async def test_schedule_skips_recent_warm_up(
+        self, warm_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = AsyncMock(return_value={})
+        monkeypatch.setattr(warmup, "warm_up", calls)
+
+        warmup.schedule_warm_up(warm_settings)
+        await asyncio.sleep(0)
+        monkeypatch.setattr(warmup, "_last_warm_up", warmup.time.monotonic())
+        warmup.schedule_warm_up(warm_settings)
+        await asyncio.sleep(0)
+
+        assert calls.await_count == 1
+
+    def test_start_is_noop_when_disabled(self, warm_settings: Settings) -> None:
+        assert warmup.start_warm_up(warm_settings) is None
+
+
+class TestPipelineWarmUp:
+    @pytest.mark.anyio
+    async def test_recording_start_schedules_warm_up(self, warm_settings: Settings) -> None:
+        settings = warm_settings.model_copy(update={"warmup_on_record": True})
+        with (
+            patch("babel_tower.pipeline.schedule_warm_up") as schedule,
+            patch("babel_tower.pipeline.record_speech", AsyncMock(return_value=BytesIO(b"x"))),
+            patch("babel_tower.pipeline.transcribe", AsyncMock(return_value="ja")),
+            patch("babel_tower.pipeline.process_transcript", AsyncMock(return_value="Ja.")),
+            patch("babel_tower.pipeline.notify"),
+            patch("babel_tower.pipeline.save_audio"),
+            patch("babel_tower.pipeline.save_transcript"),
+            patch("babel_tower.pipeline.save_result"),
+        ):
+            await run_pipeline(settings=settings, clipboard=False)
+
+        schedule.assert_called_once_with(settings)